@@ -0,0 +1,82 @@
+"""Run the benchmark suite.
+
+Usage (from the python directory):
+    python -m benchmarks                                   # every case, sizes 10^3 to 10^5
+    python -m benchmarks --sizes 1e3,1e4,1e5,1e6,1e7 bst   # cases whose name starts with "bst"
+    python -m benchmarks --save-baseline main              # store benchmarks/baselines/main.json
+    python -m benchmarks --compare main                    # exit with 1 on regressions
+"""
+import argparse
+import json
+import sys
+
+from .cases import all_cases
+from .harness import compare, load_baseline, run_cases, save_baseline, to_report
+
+
+def parse_sizes(text: str):
+    return [int(float(size)) for size in text.split(",")]
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks", description="Run the benchmark suite."
+    )
+    parser.add_argument("prefixes", nargs="*", help="Only run cases with this prefix")
+    parser.add_argument(
+        "--sizes", type=parse_sizes, default=[10**3, 10**4, 10**5]
+    )
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--no-memory", action="store_true", help="Skip tracemalloc")
+    parser.add_argument("--list", action="store_true", help="List the cases")
+    parser.add_argument("--output", help="Write the JSON report to this file")
+    parser.add_argument("--save-baseline", metavar="NAME")
+    parser.add_argument("--compare", metavar="NAME", help="Compare to a baseline")
+    parser.add_argument("--tolerance", type=float, default=0.2)
+    args = parser.parse_args(argv)
+
+    cases = all_cases()
+    if args.list:
+        print("\n".join(cases))
+        return 0
+    selected = [
+        case
+        for name, case in cases.items()
+        if not args.prefixes or any(name.startswith(p) for p in args.prefixes)
+    ]
+
+    print(f"{'case':<40}{'size':>10}{'ops/s':>14}{'peak (KiB)':>14}")
+
+    def report_line(name, measure):
+        peak = "-" if measure.peak_bytes is None else f"{measure.peak_bytes / 1024:.0f}"
+        print(f"{name:<40}{measure.size:>10}{measure.ops_per_sec:>14.0f}{peak:>14}")
+
+    results = run_cases(
+        selected, args.sizes, args.repeat, not args.no_memory, report_line
+    )
+    print()
+    for result in results:
+        exponent = "-" if result.exponent is None else f"{result.exponent:.2f}"
+        skipped = "".join(
+            f"\n    skipped {size}: {reason}" for size, reason in result.skipped.items()
+        )
+        print(f"{result.name:<40} scaling exponent {exponent}{skipped}")
+
+    report = to_report(results)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as output:
+            json.dump(report, output, indent=2, sort_keys=True)
+    if args.save_baseline:
+        print(f"\nBaseline saved to {save_baseline(report, args.save_baseline)}")
+    if args.compare:
+        regressions = compare(report, load_baseline(args.compare), args.tolerance)
+        print(f"\n{len(regressions)} regression(s) against {args.compare}")
+        for regression in regressions:
+            print(f"  {regression}")
+        if regressions:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
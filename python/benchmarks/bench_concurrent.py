@@ -0,0 +1,124 @@
+"""Contention benchmark of the ConcurrentGraph wrapper.
+
+Reader and writer threads hammer a shared graph. The same workload runs once with the reader-writer
+lock and once with a plain mutex, and reports the throughput and the time spent waiting for the lock.
+
+Usage (from the python directory):
+    python -m benchmarks.bench_concurrent --readers 8 --writers 2 --operations 20000
+"""
+import argparse
+import random
+import threading
+import time
+
+from graph.concurrent import ConcurrentGraph, ReadWriteLock
+from graph.undirected_graph.multigraph import AdjacencySetUndirectedMultiGraph
+
+
+class TimedReadWriteLock(ReadWriteLock):
+    """Reader-writer lock accumulating the time spent waiting to acquire it."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.wait_time = 0.0
+        self._stats_lock = threading.Lock()
+
+    def _timed(self, acquire):
+        start = time.perf_counter()
+        acquire()
+        waited = time.perf_counter() - start
+        with self._stats_lock:
+            self.wait_time += waited
+
+    def acquire_read(self) -> None:
+        self._timed(super().acquire_read)
+
+    def acquire_write(self) -> None:
+        self._timed(super().acquire_write)
+
+
+class TimedMutex(TimedReadWriteLock):
+    """Exclusive lock with the reader-writer interface, used as the baseline."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._mutex = threading.RLock()
+
+    def acquire_read(self) -> None:
+        self._timed(self._mutex.acquire)
+
+    def release_read(self) -> None:
+        self._mutex.release()
+
+    def acquire_write(self) -> None:
+        self._timed(self._mutex.acquire)
+
+    def release_write(self) -> None:
+        self._mutex.release()
+
+
+def build_graph(nodes: int, links: int, seed: int) -> AdjacencySetUndirectedMultiGraph:
+    rng = random.Random(seed)
+    graph = AdjacencySetUndirectedMultiGraph()
+    for node in range(nodes):
+        graph.add_node(node)
+    for link_id in range(links):
+        graph.add_link(rng.randrange(nodes), rng.randrange(nodes), link_id)
+    return graph
+
+
+def run(lock, readers: int, writers: int, operations: int, nodes: int, seed: int):
+    graph = ConcurrentGraph(build_graph(nodes, nodes * 4, seed))
+    graph.lock = lock
+    start_barrier = threading.Barrier(readers + writers)
+
+    def reader(thread_seed):
+        rng = random.Random(thread_seed)
+        start_barrier.wait()
+        for _ in range(operations):
+            node = rng.randrange(nodes)
+            # Read a whole neighbourhood under the lock, as a traversal step would.
+            with graph.read():
+                for links in graph.graph.links.get(node, {}).values():
+                    len(links)
+
+    def writer(thread_seed):
+        rng = random.Random(thread_seed)
+        start_barrier.wait()
+        for i in range(operations // 10):
+            graph.add_link(rng.randrange(nodes), rng.randrange(nodes), (thread_seed, i))
+
+    threads = [
+        threading.Thread(target=reader, args=(seed + i,)) for i in range(readers)
+    ] + [
+        threading.Thread(target=writer, args=(seed + 1000 + i,)) for i in range(writers)
+    ]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - start
+    total_operations = readers * operations + writers * (operations // 10)
+    return total_operations / elapsed, lock.wait_time, elapsed
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--readers", type=int, default=8)
+    parser.add_argument("--writers", type=int, default=2)
+    parser.add_argument("--operations", type=int, default=20000)
+    parser.add_argument("--nodes", type=int, default=1000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    print(f"{'lock':<12}{'ops/s':>14}{'lock wait (s)':>16}{'elapsed (s)':>14}")
+    for name, lock in (("rwlock", TimedReadWriteLock()), ("mutex", TimedMutex())):
+        throughput, wait_time, elapsed = run(
+            lock, args.readers, args.writers, args.operations, args.nodes, args.seed
+        )
+        print(f"{name:<12}{throughput:>14.0f}{wait_time:>16.3f}{elapsed:>14.3f}")
+
+
+if __name__ == "__main__":
+    main()
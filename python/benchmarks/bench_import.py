@@ -0,0 +1,73 @@
+"""Startup benchmark: import time of each module, each measured in a fresh interpreter.
+
+Usage (from the python directory):
+    python -m benchmarks.bench_import --repeat 10
+"""
+import argparse
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+MODULES = (
+    "graphviz",
+    "graph.events",
+    "graph.undirected_graph.adjacency_set",
+    "graph.undirected_graph.multigraph",
+    "graph.directed_graph.multigraph",
+    "graph.traversal",
+    "graph.concurrent",
+    "graph.aio",
+    "graph.indexes",
+    "tree.generic_node",
+    "tree.binary.binary_search_tree",
+)
+
+# Run in the child interpreter: time the import and report whether graphviz was loaded.
+_PROBE = """
+import json, sys, time
+start = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - start
+print(json.dumps({{"seconds": elapsed, "graphviz": "graphviz" in sys.modules}}))
+"""
+
+PYTHON_DIRECTORY = Path(__file__).resolve().parent.parent
+
+
+def measure_import(module: str, repeat: int) -> dict:
+    """Best import time of the module over `repeat` fresh interpreters."""
+    best = None
+    for _ in range(repeat):
+        output = subprocess.run(
+            [sys.executable, "-c", _PROBE.format(module=module)],
+            cwd=PYTHON_DIRECTORY,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout
+        result = json.loads(output)
+        if best is None or result["seconds"] < best["seconds"]:
+            best = result
+    return best
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("modules", nargs="*", default=MODULES)
+    args = parser.parse_args(argv)
+
+    print(f"{'module':<42}{'import (ms)':>12}{'graphviz loaded':>18}")
+    for module in args.modules:
+        try:
+            result = measure_import(module, args.repeat)
+        except subprocess.CalledProcessError:
+            print(f"{module:<42}{'failed':>12}")
+            continue
+        loaded = "yes" if result["graphviz"] else "no"
+        print(f"{module:<42}{result['seconds'] * 1000:>12.2f}{loaded:>18}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,291 @@
+"""Benchmark cases of the data structures of the repository."""
+import tempfile
+from typing import Dict, List
+
+from graph.directed_graph.multigraph import AdjacencyDirectedSetMultiGraph
+from graph.undirected_graph.adjacency_set import AdjacencySetUndirectedGraph
+from graph.undirected_graph.multigraph import AdjacencySetUndirectedMultiGraph
+from tree.binary.binary_search_tree import BinarySearchNode
+from tree.sorted_map import ENGINES, SortedMap
+
+from .harness import Case, Skip, recursion_limit
+
+# Sorted keys build a degenerated tree as deep as its size and the tree methods are recursive.
+SORTED_BST_MAX_SIZE = 10**4
+
+
+def _keys(size, rng, ordered):
+    keys = list(range(size))
+    if not ordered:
+        rng.shuffle(keys)
+    return keys
+
+
+def _build_bst(keys):
+    root = BinarySearchNode(key=keys[0])
+    for key in keys[1:]:
+        root.insert(key)
+    return root
+
+
+def bst_cases(ordered: bool) -> List[Case]:
+    label = "sorted" if ordered else "random"
+    max_size = SORTED_BST_MAX_SIZE if ordered else None
+    depth = SORTED_BST_MAX_SIZE + 1000 if ordered else 1000
+
+    def insert(size, rng):
+        keys = _keys(size, rng, ordered)
+
+        def operation():
+            with recursion_limit(depth):
+                _build_bst(keys)
+            return size
+
+        return operation
+
+    def search(size, rng):
+        keys = _keys(size, rng, ordered)
+        with recursion_limit(depth):
+            root = _build_bst(keys)
+        rng.shuffle(keys)
+
+        def operation():
+            with recursion_limit(depth):
+                for key in keys:
+                    root.search(key)
+            return size
+
+        return operation
+
+    def delete(size, rng):
+        keys = _keys(size, rng, ordered)
+        with recursion_limit(depth):
+            root = _build_bst(keys)
+        rng.shuffle(keys)
+
+        def operation():
+            deleted = 0
+            with recursion_limit(depth):
+                for key in keys:
+                    # Deleting the root leaf is not supported by the node API.
+                    if key != root.key:
+                        root.delete(key)
+                        deleted += 1
+            return deleted
+
+        return operation
+
+    def iterate(size, rng):
+        keys = _keys(size, rng, ordered)
+        with recursion_limit(depth):
+            root = _build_bst(keys)
+
+        def operation():
+            with recursion_limit(depth):
+                return sum(1 for _ in root)
+
+        return operation
+
+    return [
+        Case(f"bst.insert.{label}", insert, max_size),
+        Case(f"bst.search.{label}", search, max_size),
+        Case(f"bst.delete.{label}", delete, max_size),
+        Case(f"bst.iterate.{label}", iterate, max_size),
+    ]
+
+
+def sorted_map_cases(engine: str, ordered: bool) -> List[Case]:
+    """Same workloads for each `SortedMap` engine, to pick the fastest one."""
+    label = "sorted" if ordered else "random"
+    # Unbalanced trees are quadratic on sorted keys, sorted lists move their end on each insertion.
+    quadratic = engine == "bst" and ordered
+    max_size = SORTED_BST_MAX_SIZE if quadratic else None
+
+    def build(keys):
+        sorted_map = SortedMap(engine=engine)
+        for key in keys:
+            sorted_map[key] = key
+        return sorted_map
+
+    def insert(size, rng):
+        keys = _keys(size, rng, ordered)
+
+        def operation():
+            build(keys)
+            return size
+
+        return operation
+
+    def lookup(size, rng):
+        keys = _keys(size, rng, ordered)
+        sorted_map = build(keys)
+        rng.shuffle(keys)
+
+        def operation():
+            for key in keys:
+                sorted_map[key]
+            return size
+
+        return operation
+
+    def delete(size, rng):
+        keys = _keys(size, rng, ordered)
+        sorted_map = build(keys)
+        rng.shuffle(keys)
+
+        def operation():
+            for key in keys:
+                del sorted_map[key]
+            return size
+
+        return operation
+
+    def scan(size, rng):
+        sorted_map = build(_keys(size, rng, ordered))
+        # 100 range scans, each over a tenth of the keys.
+        bounds = [rng.randrange(size) for _ in range(100)]
+
+        def operation():
+            scanned = 0
+            for low in bounds:
+                for _ in sorted_map.irange(low, low + size // 10):
+                    scanned += 1
+            return scanned
+
+        return operation
+
+    def floor(size, rng):
+        sorted_map = build(_keys(size, rng, ordered))
+        queries = [rng.random() * size for _ in range(size)]
+
+        def operation():
+            for query in queries:
+                sorted_map.floor(query)
+            return size
+
+        return operation
+
+    return [
+        Case(f"sorted_map.{engine}.insert.{label}", insert, max_size),
+        Case(f"sorted_map.{engine}.lookup.{label}", lookup, max_size),
+        Case(f"sorted_map.{engine}.delete.{label}", delete, max_size),
+        Case(f"sorted_map.{engine}.scan.{label}", scan, max_size),
+        Case(f"sorted_map.{engine}.floor.{label}", floor, max_size),
+    ]
+
+
+GRAPH_CLASSES = {
+    "undirected_graph": AdjacencySetUndirectedGraph,
+    "undirected_multigraph": AdjacencySetUndirectedMultiGraph,
+    "directed_multigraph": AdjacencyDirectedSetMultiGraph,
+}
+
+# Rendering goes through the graphviz executable, larger graphs take minutes.
+RENDER_MAX_SIZE = 10**4
+
+
+def _random_links(size, rng):
+    """`size` random links over `size // 4` nodes, as (node1, node2, link_id)."""
+    nodes = max(size // 4, 1)
+    return [(rng.randrange(nodes), rng.randrange(nodes), i) for i in range(size)]
+
+
+def _add_links(graph, links):
+    if graph.is_multigraph:
+        for node1, node2, link_id in links:
+            graph.add_link(node1, node2, link_id, link_id)
+    else:
+        for node1, node2, link_id in links:
+            graph.add_link(node1, node2, link_id)
+
+
+def graph_cases(name: str, graph_class) -> List[Case]:
+    def build(size, rng):
+        links = _random_links(size, rng)
+        graph = graph_class()
+        _add_links(graph, links)
+        return graph, links
+
+    def add(size, rng):
+        links = _random_links(size, rng)
+
+        def operation():
+            _add_links(graph_class(), links)
+            return size
+
+        return operation
+
+    def remove_link(size, rng):
+        graph, links = build(size, rng)
+
+        def operation():
+            removed = 0
+            for node1, node2, link_id in links:
+                if graph.is_multigraph:
+                    graph.remove_link(node1, node2, link_id)
+                elif node2 in graph.links[node1]:
+                    # Parallel random links replaced each other in a simple graph.
+                    graph.remove_link(node1, node2)
+                else:
+                    continue
+                removed += 1
+            return removed
+
+        return operation
+
+    def remove_node(size, rng):
+        graph, _ = build(size, rng)
+        nodes = list(graph.nodes)
+        rng.shuffle(nodes)
+
+        def operation():
+            for node in nodes:
+                graph.remove_node(node)
+            return len(nodes)
+
+        return operation
+
+    def neighbours(size, rng):
+        graph, _ = build(size, rng)
+
+        def operation():
+            visited = 0
+            for node in graph.nodes:
+                for _ in graph.links[node]:
+                    visited += 1
+            return visited
+
+        return operation
+
+    def render(size, rng):
+        graph, _ = build(size, rng)
+
+        def operation():
+            import graphviz
+
+            with tempfile.TemporaryDirectory() as directory:
+                try:
+                    graph.render(f"{directory}/graph", "Benchmark", "dot")
+                except graphviz.ExecutableNotFound as error:
+                    raise Skip("graphviz executable not found") from error
+            return size
+
+        return operation
+
+    return [
+        Case(f"{name}.add_link", add),
+        Case(f"{name}.remove_link", remove_link),
+        Case(f"{name}.remove_node", remove_node),
+        Case(f"{name}.neighbours", neighbours),
+        Case(f"{name}.render", render, RENDER_MAX_SIZE),
+    ]
+
+
+def all_cases() -> Dict[str, Case]:
+    cases = bst_cases(ordered=False) + bst_cases(ordered=True)
+    for engine in ENGINES:
+        cases += sorted_map_cases(engine, ordered=False)
+        cases += sorted_map_cases(engine, ordered=True)
+    for name, graph_class in GRAPH_CLASSES.items():
+        cases += graph_cases(name, graph_class)
+    return {case.name: case for case in cases}
@@ -0,0 +1,212 @@
+"""Small benchmark harness: timing, peak memory, scaling exponent, baselines and comparison."""
+import gc
+import json
+import math
+import random
+import sys
+import time
+import tracemalloc
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional
+
+BASELINE_DIRECTORY = Path(__file__).parent / "baselines"
+
+# A case receives the size and a seeded random generator, prepares its data and returns the
+# measured operation. The operation returns the number of elementary operations it performed.
+Operation = Callable[[], int]
+CaseFunction = Callable[[int, random.Random], Operation]
+
+
+class Skip(Exception):
+    """Raised by a case when it cannot run at the given size."""
+
+
+@dataclass
+class Case:
+    name: str
+    function: CaseFunction
+    max_size: Optional[int] = None
+
+
+@dataclass
+class Measure:
+    size: int
+    seconds: float
+    operations: int
+    peak_bytes: Optional[int] = None
+
+    @property
+    def ops_per_sec(self) -> float:
+        return self.operations / self.seconds if self.seconds > 0 else math.inf
+
+
+@dataclass
+class CaseResult:
+    name: str
+    measures: List[Measure] = field(default_factory=list)
+    skipped: Dict[int, str] = field(default_factory=dict)
+
+    @property
+    def exponent(self) -> Optional[float]:
+        return scaling_exponent(
+            [(measure.size, measure.seconds) for measure in self.measures]
+        )
+
+    def to_dict(self) -> dict:
+        return {
+            "exponent": self.exponent,
+            "sizes": {
+                str(measure.size): {
+                    "seconds": measure.seconds,
+                    "operations": measure.operations,
+                    "ops_per_sec": measure.ops_per_sec,
+                    "peak_bytes": measure.peak_bytes,
+                }
+                for measure in self.measures
+            },
+            "skipped": {str(size): reason for size, reason in self.skipped.items()},
+        }
+
+
+def scaling_exponent(points: Iterable[tuple]) -> Optional[float]:
+    """Least square slope of log(time) against log(size).
+
+    1 means the total time grows linearly with the size, 2 quadratically. None with less than two
+    usable points.
+    """
+    logs = [
+        (math.log(size), math.log(seconds))
+        for size, seconds in points
+        if size > 0 and seconds > 0
+    ]
+    if len(logs) < 2:
+        return None
+    mean_x = sum(x for x, _ in logs) / len(logs)
+    mean_y = sum(y for _, y in logs) / len(logs)
+    variance = sum((x - mean_x) ** 2 for x, _ in logs)
+    if variance == 0:
+        return None
+    return sum((x - mean_x) * (y - mean_y) for x, y in logs) / variance
+
+
+@contextmanager
+def recursion_limit(limit: int):
+    """Temporarily raise the recursion limit, for the recursive tree methods."""
+    previous = sys.getrecursionlimit()
+    sys.setrecursionlimit(max(previous, limit))
+    try:
+        yield
+    finally:
+        sys.setrecursionlimit(previous)
+
+
+def measure(
+    case: Case, size: int, repeat: int = 3, memory: bool = True, seed: int = 0
+) -> Measure:
+    """Best time of `repeat` runs, then one run under tracemalloc for the peak memory."""
+    best = math.inf
+    operations = 0
+    for _ in range(repeat):
+        operation = case.function(size, random.Random(seed))
+        gc.collect()
+        start = time.perf_counter()
+        operations = operation()
+        best = min(best, time.perf_counter() - start)
+    peak = None
+    if memory:
+        operation = case.function(size, random.Random(seed))
+        gc.collect()
+        tracemalloc.start()
+        try:
+            operation()
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+    return Measure(size, best, operations, peak)
+
+
+def run_cases(
+    cases: Iterable[Case],
+    sizes: Iterable[int],
+    repeat: int = 3,
+    memory: bool = True,
+    report: Callable[[str, Measure], None] = lambda name, measure: None,
+) -> List[CaseResult]:
+    results = []
+    for case in cases:
+        result = CaseResult(case.name)
+        for size in sizes:
+            if case.max_size is not None and size > case.max_size:
+                result.skipped[size] = f"above the maximum size {case.max_size}"
+                continue
+            try:
+                result.measures.append(measure(case, size, repeat, memory))
+            except Skip as skip:
+                result.skipped[size] = str(skip)
+                continue
+            report(case.name, result.measures[-1])
+        results.append(result)
+    return results
+
+
+def to_report(results: Iterable[CaseResult]) -> dict:
+    return {
+        "python": sys.version.split()[0],
+        "cases": {result.name: result.to_dict() for result in results},
+    }
+
+
+def baseline_path(name: str) -> Path:
+    path = Path(name)
+    if path.suffix == ".json" or path.parent != Path("."):
+        return path
+    return BASELINE_DIRECTORY / f"{name}.json"
+
+
+def save_baseline(report: dict, name: str) -> Path:
+    path = baseline_path(name)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(report, indent=2, sort_keys=True), encoding="utf-8")
+    return path
+
+
+def load_baseline(name: str) -> dict:
+    return json.loads(baseline_path(name).read_text(encoding="utf-8"))
+
+
+def compare(
+    report: dict,
+    baseline: dict,
+    tolerance: float = 0.2,
+    exponent_tolerance: float = 0.15,
+) -> List[str]:
+    """Return a message for each regression of the report against the baseline.
+
+    A regression is a throughput lower than `(1 - tolerance)` times the baseline one for a size
+    measured in both, or a scaling exponent higher by more than `exponent_tolerance`.
+    """
+    regressions = []
+    for name, case in report["cases"].items():
+        base_case = baseline["cases"].get(name)
+        if base_case is None:
+            continue
+        for size, values in case["sizes"].items():
+            base_values = base_case["sizes"].get(size)
+            if base_values is None:
+                continue
+            ratio = values["ops_per_sec"] / base_values["ops_per_sec"]
+            if ratio < 1 - tolerance:
+                regressions.append(
+                    f"{name} [{size}]: {values['ops_per_sec']:.0f} ops/s, "
+                    f"{(1 - ratio) * 100:.0f}% slower than the baseline"
+                )
+        exponent, base_exponent = case["exponent"], base_case["exponent"]
+        if exponent is not None and base_exponent is not None:
+            if exponent - base_exponent > exponent_tolerance:
+                regressions.append(
+                    f"{name}: scaling exponent {exponent:.2f} "
+                    f"against {base_exponent:.2f} in the baseline"
+                )
+    return regressions
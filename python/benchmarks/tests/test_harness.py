@@ -0,0 +1,59 @@
+import pytest
+
+from ..cases import all_cases
+from ..harness import (
+    Case,
+    Skip,
+    compare,
+    load_baseline,
+    run_cases,
+    save_baseline,
+    scaling_exponent,
+    to_report,
+)
+
+
+def test_harness_scaling_exponent():
+    assert scaling_exponent([(10, 1.0), (100, 10.0), (1000, 100.0)]) == pytest.approx(1)
+    assert scaling_exponent([(10, 1.0), (100, 100.0)]) == pytest.approx(2)
+    assert scaling_exponent([(10, 1.0)]) is None
+
+
+def test_harness_run_cases_skip():
+    def case(size, rng):
+        if size > 10:
+            raise Skip("too big")
+        return lambda: size
+
+    (result,) = run_cases([Case("test", case, max_size=100)], [10, 50, 1000], repeat=1)
+    assert [measure.size for measure in result.measures] == [10]
+    assert result.measures[0].operations == 10
+    assert result.measures[0].peak_bytes is not None
+    assert result.skipped == {50: "too big", 1000: "above the maximum size 100"}
+
+
+def test_harness_compare(tmp_path):
+    def report(ops_per_sec, exponent):
+        return {
+            "cases": {
+                "test": {
+                    "exponent": exponent,
+                    "sizes": {"1000": {"ops_per_sec": ops_per_sec}},
+                }
+            }
+        }
+
+    path = save_baseline(report(1000, 1.0), str(tmp_path / "base.json"))
+    baseline = load_baseline(str(path))
+    assert compare(report(900, 1.05), baseline) == []
+    assert len(compare(report(500, 1.0), baseline)) == 1
+    assert len(compare(report(500, 2.0), baseline)) == 2
+
+
+def test_harness_cases_run():
+    cases = all_cases()
+    selected = [case for name, case in cases.items() if not name.endswith("render")]
+    report = to_report(run_cases(selected, [20, 40], repeat=1, memory=False))
+    assert set(report["cases"]) == {case.name for case in selected}
+    for case in report["cases"].values():
+        assert set(case["sizes"]) == {"20", "40"}
@@ -0,0 +1,171 @@
+import asyncio
+import functools
+import itertools
+from contextlib import nullcontext
+from concurrent.futures import Executor
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    Dict,
+    Hashable,
+    Iterable,
+    List,
+    Optional,
+)
+
+from . import traversal
+from .concurrent import ConcurrentGraph
+
+NodeId = Hashable
+
+
+class AsyncGraph:
+    """Asyncio facade over any graph of the package.
+
+    - Small lookups (`neighbours`, `get_node`) issued concurrently during the same loop iteration are
+      batched and answered in a single pass over the graph.
+    - Traversals are async generators giving control back to the event loop every `yield_every` nodes.
+    - Heavy algorithms (`shortest_path`, `run`) are offloaded to an executor, the default one of the
+      loop when none is given, so they do not stall the event loop.
+
+    The wrapped graph is mutated and read from the event loop thread, except for offloaded algorithms.
+    If the graph is mutated while an algorithm runs in the executor, wrap it in a `ConcurrentGraph`:
+    batched lookups, traversal chunks and offloaded algorithms then run under its read lock.
+    """
+
+    def __init__(
+        self, graph, executor: Optional[Executor] = None, yield_every: int = 1000
+    ) -> None:
+        self.graph = graph
+        self.executor = executor
+        self.yield_every = yield_every
+        self._pending: Dict[str, Dict[NodeId, List[asyncio.Future]]] = {}
+
+    # Batched lookups
+
+    def _batched(self, kind: str, node: NodeId) -> asyncio.Future:
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        if kind not in self._pending:
+            self._pending[kind] = {}
+            loop.call_soon(self._flush, kind)
+        self._pending[kind].setdefault(node, []).append(future)
+        return future
+
+    def _flush(self, kind: str) -> None:
+        requests = self._pending.pop(kind)
+        with self._read_context():
+            self._resolve(kind, requests)
+
+    def _resolve(self, kind: str, requests: Dict[NodeId, List[asyncio.Future]]) -> None:
+        nodes, links = self.graph.nodes, self.graph.links
+        for node, futures in requests.items():
+            if node not in nodes:
+                error = ValueError("The given node is not in the graph")
+                for future in futures:
+                    if not future.done():
+                        future.set_exception(error)
+                continue
+            result = list(links[node]) if kind == "neighbours" else nodes[node]
+            for future in futures:
+                if not future.done():
+                    future.set_result(result)
+
+    async def neighbours(self, node: NodeId) -> List[NodeId]:
+        """Return the nodes linked to the given node (successors for a directed graph).
+
+        Raises:
+            ValueError: When the node is not in the graph
+        """
+        return await self._batched("neighbours", node)
+
+    async def get_node(self, node: NodeId) -> Any:
+        """Return the value of the node.
+
+        Raises:
+            ValueError: When the node is not in the graph
+        """
+        return await self._batched("get_node", node)
+
+    # Traversals
+
+    async def _cooperative(self, iterator) -> AsyncIterator[NodeId]:
+        # Each chunk is walked under the read lock of a `ConcurrentGraph`, released before
+        # yielding so writers are not blocked while the consumer awaits.
+        while True:
+            with self._read_context():
+                chunk = list(itertools.islice(iterator, self.yield_every))
+            for node in chunk:
+                yield node
+            if len(chunk) < self.yield_every:
+                return
+            await asyncio.sleep(0)
+
+    def bfs(self, start: NodeId) -> AsyncIterator[NodeId]:
+        """Breadth first traversal from the start node, see `traversal.bfs`.
+
+        With a `ConcurrentGraph`, the graph may change between two chunks: the nodes added then
+        may be missed, and the nodes removed then may still be yielded.
+        """
+        return self._cooperative(traversal.bfs(self.graph, start))
+
+    def dfs(self, start: NodeId) -> AsyncIterator[NodeId]:
+        """Depth first traversal from the start node, see `traversal.dfs`.
+
+        With a `ConcurrentGraph`, the graph may change between two chunks: the nodes added then
+        may be missed, and the nodes removed then may still be yielded.
+        """
+        return self._cooperative(traversal.dfs(self.graph, start))
+
+    # Offloaded algorithms
+
+    async def run(self, algorithm: Callable, *args, **kwargs) -> Any:
+        """Run `algorithm(graph, *args, **kwargs)` in the executor and return its result.
+
+        A `ConcurrentGraph` is read locked for the whole run, and the algorithm receives the graph it
+        wraps so its calls do not take the lock again.
+        """
+        call = functools.partial(self._read_locked, algorithm, *args, **kwargs)
+        return await asyncio.get_running_loop().run_in_executor(self.executor, call)
+
+    def _read_locked(self, algorithm: Callable, *args, **kwargs) -> Any:
+        if isinstance(self.graph, ConcurrentGraph):
+            with self.graph.read():
+                return algorithm(self.graph.graph, *args, **kwargs)
+        return algorithm(self.graph, *args, **kwargs)
+
+    def _read_context(self):
+        if isinstance(self.graph, ConcurrentGraph):
+            return self.graph.read()
+        return nullcontext()
+
+    async def shortest_path(
+        self, source: NodeId, target: NodeId
+    ) -> Optional[List[NodeId]]:
+        """Shortest path from source to target computed in the executor, see `traversal.shortest_path`."""
+        return await self.run(traversal.shortest_path, source, target)
+
+    # Mutations
+
+    async def bulk_load(
+        self,
+        nodes: Iterable[tuple] = (),
+        links: Iterable[tuple] = (),
+        chunk_size: int = 10000,
+    ) -> None:
+        """Load nodes then links into the graph, giving control back to the loop between chunks.
+
+        Args:
+            nodes (Iterable[tuple]): Arguments of `add_node` for each node, ie. `(node, value)`
+            links (Iterable[tuple]): Arguments of `add_link` for each link, ie. `(node1, node2, ...)`
+            chunk_size (int, optional): Number of operations between two yields. Defaults to 10000.
+        """
+        for method, items in (
+            (self.graph.add_node, nodes),
+            (self.graph.add_link, links),
+        ):
+            for count, arguments in enumerate(items, 1):
+                method(*arguments)
+                if count % chunk_size == 0:
+                    await asyncio.sleep(0)
@@ -0,0 +1,168 @@
+from collections import OrderedDict
+from typing import Any, Callable, Collection, Dict, Hashable, Optional, Set, Tuple
+
+from .events import GraphEvent
+from . import traversal
+from .traversal import neighbours
+
+NodeId = Hashable
+
+# Marks a missing entry, as None is a valid query result.
+_MISSING = object()
+
+
+class QueryCache:
+    """Memoize the results of read queries on a graph, until the graph changes.
+
+    Each result is stored with the version of the graph it was computed at, and is recomputed when
+    the graph version changed. Checking an entry is O(1) and any mutation invalidates every entry.
+
+    With `track_nodes=True` the cache subscribes to the graph instead, and remembers the nodes each
+    built-in query depends on (the node of `neighbours`, the nodes reached by the search of
+    `shortest_path`). A mutation only invalidates the entries depending on the nodes it touches, so
+    results on unrelated parts of the graph survive. Results of `get` queries are still invalidated
+    by any mutation, as their dependencies are unknown.
+
+    The least recently used entries are evicted above `maxsize` entries. The cache is not thread
+    safe, and results are shared between the callers: they are returned as tuples.
+
+    Example:
+        cache = QueryCache(graph, maxsize=10_000, track_nodes=True)
+        cache.shortest_path("a", "z")
+        cache.get(my_query, "a")  # my_query(graph, "a")
+
+    Args:
+        graph: Any graph of the package.
+        maxsize (int, optional): Maximum number of entries. Defaults to 1024.
+        track_nodes (bool, optional): Invalidate entries by touched nodes. Defaults to False.
+
+    Raises:
+        ValueError: When maxsize is lower than 1
+    """
+
+    def __init__(self, graph, maxsize: int = 1024, track_nodes: bool = False) -> None:
+        if maxsize < 1:
+            raise ValueError("The cache must hold at least one entry")
+        self.graph = graph
+        self.maxsize = maxsize
+        self.track_nodes = track_nodes
+        self.hits = 0
+        self.misses = 0
+        # Entries are (version, result, nodes): the version is None when the entry is tracked by
+        # its nodes instead.
+        self._entries: "OrderedDict[Hashable, Tuple[Optional[int], Any, Collection[NodeId]]]" = (
+            OrderedDict()
+        )
+        # Keys of the tracked entries depending on each node.
+        self._dependants: Dict[NodeId, Set[Hashable]] = {}
+        if track_nodes:
+            graph.subscribe(self._on_event)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._dependants.clear()
+
+    def close(self) -> None:
+        """Stop tracking the mutations of the graph and drop the entries."""
+        if self.track_nodes:
+            self.graph.unsubscribe(self._on_event)
+            self.track_nodes = False
+        self.clear()
+
+    # Storage
+
+    def _discard(self, key: Hashable) -> None:
+        _, _, nodes = self._entries.pop(key)
+        for node in nodes:
+            keys = self._dependants.get(node)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._dependants[node]
+
+    def _on_event(self, event: GraphEvent) -> None:
+        for node in (event.node1, event.node2):
+            for key in self._dependants.pop(node, ()):
+                if key in self._entries:
+                    self._discard(key)
+
+    def _cached(
+        self,
+        key: Hashable,
+        compute: Callable[[], Tuple[Any, Optional[Collection[NodeId]]]],
+    ) -> Any:
+        """Return the result stored for the key, or compute it with the nodes it depends on.
+
+        A None collection of nodes means the result depends on the whole graph.
+        """
+        entry = self._entries.get(key)
+        if entry is not None and (entry[0] is None or entry[0] == self.graph.version):
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+        if entry is not None:
+            self._discard(key)
+        self.misses += 1
+        result, nodes = compute()
+        if self.track_nodes and nodes is not None:
+            nodes = tuple(nodes)
+            self._entries[key] = (None, result, nodes)
+            for node in nodes:
+                self._dependants.setdefault(node, set()).add(key)
+        else:
+            self._entries[key] = (self.graph.version, result, ())
+        while len(self._entries) > self.maxsize:
+            self._discard(next(iter(self._entries)))
+        return result
+
+    # Queries
+
+    def neighbours(self, node: NodeId) -> Tuple[NodeId, ...]:
+        """Nodes linked to the given node (successors for a directed graph).
+
+        Raises:
+            ValueError: When the node is not in the graph
+        """
+        return self._cached(
+            ("neighbours", node),
+            lambda: (tuple(neighbours(self.graph, node)), (node,)),
+        )
+
+    def shortest_path(
+        self, source: NodeId, target: NodeId
+    ) -> Optional[Tuple[NodeId, ...]]:
+        """Shortest path (in number of links) from source to target, None if target is not reachable.
+
+        Raises:
+            ValueError: When the source or the target is not in the graph
+        """
+
+        def compute():
+            path, reached = traversal.shortest_path(
+                self.graph, source, target, return_reached=True
+            )
+            # The target is a dependency even when not reached: removing it makes the query fail.
+            return (tuple(path) if path is not None else None), (*reached, target)
+
+        return self._cached(("shortest_path", source, target), compute)
+
+    def is_reachable(self, source: NodeId, target: NodeId) -> bool:
+        """Return True when a path exists from source to target. Shares the `shortest_path` entries.
+
+        Raises:
+            ValueError: When the source or the target is not in the graph
+        """
+        return self.shortest_path(source, target) is not None
+
+    def get(self, query: Callable[..., Any], *args: Hashable) -> Any:
+        """Result of `query(graph, *args)`, invalidated by any mutation of the graph.
+
+        Args:
+            query (Callable): A function of the graph and the hashable arguments.
+        """
+        return self._cached(
+            ("get", query, args), lambda: (query(self.graph, *args), None)
+        )
@@ -0,0 +1,203 @@
+import threading
+from contextlib import contextmanager
+from typing import Any, Callable, Generic, Iterator, TypeVar
+
+G = TypeVar("G")
+
+
+class ReadWriteLock:
+    """Reader-writer lock. Many readers can hold the lock at the same time, a writer holds it alone.
+
+    Writers are preferred: once a writer is waiting, new readers wait until it is done so a steady
+    flow of readers cannot starve the writers. Both locks are reentrant: a thread already reading
+    takes the read lock again without waiting for the queued writers, and the writing thread can
+    also take the read lock (useful for batches calling read methods). Upgrading a read lock to the
+    write lock would deadlock, so it raises RuntimeError.
+    """
+
+    def __init__(self) -> None:
+        self._condition = threading.Condition(threading.Lock())
+        self._readers = 0
+        self._writers_waiting = 0
+        self._writer: int | None = None
+        self._writer_depth = 0
+        # Read lock depth of each thread, the threads holding the read lock count once in _readers.
+        self._local = threading.local()
+
+    def _read_depth(self) -> int:
+        return getattr(self._local, "depth", 0)
+
+    def acquire_read(self) -> None:
+        depth = self._read_depth()
+        with self._condition:
+            if self._writer == threading.get_ident():
+                # The writer already has exclusive access.
+                self._writer_depth += 1
+                return
+            if depth == 0:
+                while self._writer is not None or self._writers_waiting > 0:
+                    self._condition.wait()
+                self._readers += 1
+        self._local.depth = depth + 1
+
+    def release_read(self) -> None:
+        with self._condition:
+            if self._writer == threading.get_ident():
+                self._writer_depth -= 1
+                return
+            depth = self._read_depth()
+            if depth == 0:
+                raise RuntimeError("The read lock is not held by the current thread")
+            self._local.depth = depth - 1
+            if depth == 1:
+                self._readers -= 1
+                if self._readers == 0:
+                    self._condition.notify_all()
+
+    def acquire_write(self) -> None:
+        if self._read_depth() > 0:
+            raise RuntimeError(
+                "The current thread holds the read lock, it cannot take the write lock"
+            )
+        with self._condition:
+            me = threading.get_ident()
+            if self._writer == me:
+                self._writer_depth += 1
+                return
+            self._writers_waiting += 1
+            while self._writer is not None or self._readers > 0:
+                self._condition.wait()
+            self._writers_waiting -= 1
+            self._writer = me
+            self._writer_depth = 1
+
+    def release_write(self) -> None:
+        with self._condition:
+            if self._writer != threading.get_ident():
+                raise RuntimeError("The write lock is not held by the current thread")
+            self._writer_depth -= 1
+            if self._writer_depth == 0:
+                self._writer = None
+                self._condition.notify_all()
+
+    @contextmanager
+    def read(self) -> Iterator[None]:
+        self.acquire_read()
+        try:
+            yield
+        finally:
+            self.release_read()
+
+    @contextmanager
+    def write(self) -> Iterator[None]:
+        self.acquire_write()
+        try:
+            yield
+        finally:
+            self.release_write()
+
+
+class ConcurrentGraph(Generic[G]):
+    """Thread safe wrapper around any of the graph classes.
+
+    Each method call of the wrapped graph is executed under the lock: mutating methods take the write
+    lock so compound updates (`add_link` creating nodes then filling the adjacency dicts) are atomic,
+    every other method takes the read lock so readers proceed in parallel. Methods returning an
+    iterator (`out_edges`, `predecessors`...) return a list instead, built under the lock. Methods
+    returning a view of the graph (`transposed`) return it wrapped in a `ConcurrentGraph` sharing the
+    lock.
+    Several operations can be made atomic together with `batch()`. Direct access to the underlying
+    dicts (`nodes`, `links`, ...) is not protected, wrap it in `read()` yourself.
+
+    Example:
+        graph = ConcurrentGraph(AdjacencySetUndirectedMultiGraph())
+        graph.add_link(1, 2, "link_1")
+        with graph.batch():
+            graph.remove_link(1, 2, "link_1")
+            graph.add_link(1, 3, "link_1")
+        with graph.read():
+            neighbours = list(graph.links[1])
+    """
+
+    WRITE_METHODS = frozenset(
+        {
+            "add_node",
+            "remove_node",
+            "add_link",
+            "remove_link",
+            "remove_links",
+            "remove_link_by_id",
+            "update_link_value",
+            "apply_patch",
+        }
+    )
+    # Methods returning an object reading the dicts of the graph.
+    VIEW_METHODS = frozenset({"transposed"})
+
+    def __init__(self, graph: G) -> None:
+        self.graph = graph
+        self.lock = ReadWriteLock()
+
+    def __getattr__(self, name: str) -> Any:
+        attribute = getattr(self.graph, name)
+        if not callable(attribute):
+            return attribute
+        if name in self.WRITE_METHODS:
+            return self._locked(attribute, self.lock.write)
+        if name in self.VIEW_METHODS:
+            return self._view(attribute)
+        return self._locked(attribute, self.lock.read)
+
+    def _view(self, method: Callable) -> Callable:
+        def view_method(*args, **kwargs):
+            view = ConcurrentGraph(method(*args, **kwargs))
+            view.lock = self.lock
+            return view
+
+        return view_method
+
+    @staticmethod
+    def _locked(method: Callable, lock: Callable) -> Callable:
+        def locked_method(*args, **kwargs):
+            with lock():
+                result = method(*args, **kwargs)
+                # Lazy results walk the graph dicts: consume them while the lock is held.
+                if isinstance(result, Iterator):
+                    result = list(result)
+                return result
+
+        return locked_method
+
+    def read(self):
+        """Context manager holding the read lock, to read the graph structures directly."""
+        return self.lock.read()
+
+    def batch(self):
+        """Context manager holding the write lock, every operation done inside is applied atomically."""
+        return self.lock.write()
+
+    def has_node(self, node) -> bool:
+        with self.lock.read():
+            return node in self.graph.nodes
+
+    def get_node(self, node) -> Any:
+        """Return the value of the node.
+
+        Raises:
+            ValueError: When the node is not in the graph
+        """
+        with self.lock.read():
+            if node not in self.graph.nodes:
+                raise ValueError("The given node is not in the graph")
+            return self.graph.nodes[node]
+
+    def neighbours(self, node) -> list:
+        """Return a copy of the nodes linked to the given node (successors for directed graphs).
+
+        Raises:
+            ValueError: When the node is not in the graph
+        """
+        with self.lock.read():
+            if node not in self.graph.nodes:
+                raise ValueError("The given node is not in the graph")
+            return list(self.graph.links[node])
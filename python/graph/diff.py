@@ -0,0 +1,147 @@
+from dataclasses import dataclass, field
+from itertools import chain
+from typing import Any, Dict, Hashable, Set, Tuple
+
+NodeId = Hashable
+# (node1, node2) for simple graphs, (node1, node2, link_id) for multigraphs.
+LinkKey = Tuple[Hashable, ...]
+
+# Marks a missing link, as None is a valid link value.
+_MISSING = object()
+
+
+@dataclass
+class GraphDiff:
+    """Differences between two graphs of the same class, from an old graph to a new one.
+
+    Each undirected link is listed once, under one of its two orientations.
+
+    Attributes:
+        added_nodes (Dict[NodeId, Any]): Value of each node only in the new graph.
+        removed_nodes (Dict[NodeId, Any]): Value of each node only in the old graph.
+        changed_nodes (Dict[NodeId, Tuple[Any, Any]]): Old and new value of each node in both graphs.
+        added_links (Dict[LinkKey, Any]): Value of each link only in the new graph.
+        removed_links (Dict[LinkKey, Any]): Value of each link only in the old graph.
+        changed_links (Dict[LinkKey, Tuple[Any, Any]]): Old and new value of each link in both graphs.
+    """
+
+    added_nodes: Dict[NodeId, Any] = field(default_factory=dict)
+    removed_nodes: Dict[NodeId, Any] = field(default_factory=dict)
+    changed_nodes: Dict[NodeId, Tuple[Any, Any]] = field(default_factory=dict)
+    added_links: Dict[LinkKey, Any] = field(default_factory=dict)
+    removed_links: Dict[LinkKey, Any] = field(default_factory=dict)
+    changed_links: Dict[LinkKey, Tuple[Any, Any]] = field(default_factory=dict)
+
+    def __bool__(self) -> bool:
+        """False when the graphs are identical."""
+        return any(
+            (
+                self.added_nodes,
+                self.removed_nodes,
+                self.changed_nodes,
+                self.added_links,
+                self.removed_links,
+                self.changed_links,
+            )
+        )
+
+
+def _diff_values(diff: GraphDiff, key: LinkKey, old_value: Any, new_value: Any):
+    if old_value is _MISSING:
+        diff.added_links[key] = new_value
+    elif new_value is _MISSING:
+        diff.removed_links[key] = old_value
+    elif old_value != new_value:
+        diff.changed_links[key] = (old_value, new_value)
+
+
+def diff_graphs(old, new) -> GraphDiff:
+    """Compute the changes turning the `old` graph into the `new` one.
+
+    The graphs are walked once, node by node. The adjacency dicts of a node are compared as a whole
+    first, and only walked neighbour by neighbour when they differ, so unchanged parts of the graphs
+    cost a C level dict comparison.
+
+    Args:
+        old: The graph before the changes.
+        new: The graph after the changes, of the same class.
+
+    Returns:
+        GraphDiff: The changes, to be given to `patch_graph`.
+
+    Raises:
+        ValueError: When the graphs are not of the same class
+    """
+    if type(old) is not type(new):
+        raise ValueError("Only graphs of the same class can be compared")
+    diff = GraphDiff()
+    for node, value in new.nodes.items():
+        if node not in old.nodes:
+            diff.added_nodes[node] = value
+        elif old.nodes[node] != value:
+            diff.changed_nodes[node] = (old.nodes[node], value)
+    for node, value in old.nodes.items():
+        if node not in new.nodes:
+            diff.removed_nodes[node] = value
+
+    empty: Dict[NodeId, Any] = {}
+    # Nodes whose links are already compared, to take each undirected link once.
+    done: Set[NodeId] = set()
+    undirected = not new.is_directed
+    for node in chain(new.nodes, diff.removed_nodes):
+        old_neighbours = old.links.get(node, empty)
+        new_neighbours = new.links.get(node, empty)
+        if old_neighbours == new_neighbours:
+            done.add(node)
+            continue
+        for neighbour in chain(
+            new_neighbours,
+            (n for n in old_neighbours if n not in new_neighbours),
+        ):
+            if undirected and neighbour in done:
+                continue
+            old_links = old_neighbours.get(neighbour, _MISSING)
+            new_links = new_neighbours.get(neighbour, _MISSING)
+            if not new.is_multigraph:
+                _diff_values(diff, (node, neighbour), old_links, new_links)
+                continue
+            old_links = empty if old_links is _MISSING else old_links
+            new_links = empty if new_links is _MISSING else new_links
+            if old_links == new_links:
+                continue
+            for link_id in chain(
+                new_links, (i for i in old_links if i not in new_links)
+            ):
+                _diff_values(
+                    diff,
+                    (node, neighbour, link_id),
+                    old_links.get(link_id, _MISSING),
+                    new_links.get(link_id, _MISSING),
+                )
+        done.add(node)
+    return diff
+
+
+def patch_graph(graph, diff: GraphDiff) -> None:
+    """Apply the changes of a diff to a graph, in place.
+
+    The graph must be in the state of the old graph of the diff. The links are removed first, then
+    the nodes, before the nodes and links are added or updated. Observers are notified of each
+    mutation, as with direct calls to the graph methods.
+
+    Args:
+        graph: The graph to update.
+        diff (GraphDiff): Changes computed by `diff_graphs`.
+    """
+    for key in diff.removed_links:
+        graph.remove_link(*key)
+    for node in diff.removed_nodes:
+        graph.remove_node(node)
+    for node, value in diff.added_nodes.items():
+        graph.add_node(node, value)
+    for node, (_, value) in diff.changed_nodes.items():
+        graph.add_node(node, value)
+    for key, value in diff.added_links.items():
+        graph.add_link(*key, value)
+    for key, (_, value) in diff.changed_links.items():
+        graph.add_link(*key, value)
@@ -1,5 +1,8 @@
-from typing import TypeVar, Generic, Dict, Hashable, Set
-from graphviz import Digraph
+from typing import TypeVar, Generic, Dict, Hashable, Iterator, Set, Tuple
+
+from ..diff import GraphDiff, diff_graphs, patch_graph
+from ..events import EventKind, ObservableGraph, Observer
+from ..link_ids import LinkIdLookup
 
 NV = TypeVar("NV")
 EV = TypeVar("EV")
@@ -8,14 +11,21 @@ NodeId = Hashable
 LinkId = Hashable
 
 
-class AdjacencyDirectedSetMultiGraph(Generic[NV, EV]):
+class AdjacencyDirectedSetMultiGraph(LinkIdLookup, ObservableGraph, Generic[NV, EV]):
     """Graph implementation using hashable object and adjacency dict."""
 
+    is_directed = True
+    is_multigraph = True
+
     def __init__(self) -> None:
         super().__init__()
         self.nodes: Dict[NodeId, NV] = dict()
         self.links: Dict[NodeId, Dict[NodeId, Dict[LinkId, EV]]] = dict()
-        self.reverse_link_lookup: Dict[NodeId, Dict[NodeId, Set[LinkId]]] = dict()
+        # Incoming links of each node: reverse_link_lookup[node2][node1] is the same dict as
+        # links[node1][node2], so it gives the link ids and values without a second lookup.
+        self.reverse_link_lookup: Dict[NodeId, Dict[NodeId, Dict[LinkId, EV]]] = dict()
+        # Global lookup of the links by id. A link id can be reused between other nodes.
+        self.link_id_lookup: Dict[LinkId, Set[Tuple[NodeId, NodeId]]] = dict()
 
     def add_node(self, node: NodeId, value: NV = None) -> None:
         """Add node to the graph. If the node already exist update the node value.
@@ -32,11 +42,16 @@ class AdjacencyDirectedSetMultiGraph(Generic[NV, EV]):
         if node is None:
             raise ValueError("None value cannot be used as a Node")
 
-        if node not in self.nodes:
+        replaced = node in self.nodes
+        previous = self.nodes.get(node)
+        if not replaced:
             # We initialize the entry in the adjency dict for this node.
             self.links[node] = {}
+            self.reverse_link_lookup[node] = {}
         self.nodes[node] = value
-        self.reverse_link_lookup[node] = {}
+        self._notify(
+            EventKind.ADD_NODE, node, value=value, previous=previous, replaced=replaced
+        )
 
     def remove_node(self, node: NodeId):
         """Remove a node from the graph. This will delete all links associated to it.
@@ -49,14 +64,16 @@ class AdjacencyDirectedSetMultiGraph(Generic[NV, EV]):
         """
         if node not in self.nodes:
             raise ValueError("The given node is not in the graph")
+        # Delete all links which contains this node, outgoing then incoming ones.
+        for dest_node in list(self.links[node]):
+            self.remove_links(node, dest_node)
+        for source_node in list(self.reverse_link_lookup[node]):
+            self.remove_links(source_node, node)
         # Delete the node
-        del self.nodes[node]
-        # Delete all links which contains this node
-        related_links = self.reverse_link_lookup[node]
-        for connected_node, link in related_links:
-            del self.links[connected_node][link]
+        value = self.nodes.pop(node)
         del self.reverse_link_lookup[node]
         del self.links[node]
+        self._notify(EventKind.REMOVE_NODE, node, value=value)
 
     def add_link(
         self,
@@ -85,13 +102,24 @@ class AdjacencyDirectedSetMultiGraph(Generic[NV, EV]):
             self.add_node(node2, node2_value)
 
         # Add the link in the adjency dict for the source node. Must ensure the dict indirection exist before hands.
+        # The dict is shared with the reverse lookup of the destination node.
         if node2 not in self.links[node1]:
-            self.links[node1][node2] = {}
+            self.links[node1][node2] = self.reverse_link_lookup[node2][node1] = {}
+        replaced = link_id in self.links[node1][node2]
+        previous = self.links[node1][node2].get(link_id)
         self.links[node1][node2][link_id] = link_value
 
-        if node1 not in self.reverse_link_lookup[node2]:
-            self.reverse_link_lookup[node2][node1] = set()
-        self.reverse_link_lookup[node2][node1].add(link_id)
+        if not replaced:
+            self._index_link(node1, node2, link_id)
+        self._notify(
+            EventKind.ADD_LINK,
+            node1,
+            node2,
+            link_id,
+            link_value,
+            previous=previous,
+            replaced=replaced,
+        )
 
     def remove_links(self, node1: NodeId, node2: NodeId):
         """Remove all links of the graph between node1 and node2 (from source to dest). Each node must exist in the graph.
@@ -108,8 +136,11 @@ class AdjacencyDirectedSetMultiGraph(Generic[NV, EV]):
             raise ValueError("First node of the given link is not in the graph")
         if node2 not in self.nodes:
             raise ValueError("Second node of the given link is not in the graph")
-        del self.links[node1][node2]
+        links = self.links[node1].pop(node2)
         del self.reverse_link_lookup[node2][node1]
+        for link_id, link_value in links.items():
+            self._unindex_link(node1, node2, link_id)
+            self._notify(EventKind.REMOVE_LINK, node1, node2, link_id, link_value)
 
     def remove_link(self, node1: NodeId, node2: NodeId, link_id: LinkId):
         """Remove a link of the graph between node1 and node2. Each node must exist in the graph.
@@ -126,14 +157,91 @@ class AdjacencyDirectedSetMultiGraph(Generic[NV, EV]):
             raise ValueError("First node of the given link is not in the graph")
         if node2 not in self.nodes:
             raise ValueError("Second node of the given link is not in the graph")
-        del self.links[node1][node2][link_id]
+        link_value = self.links[node1][node2].pop(link_id)
         # Remove key if there is no more item in the dictionnary
         if len(self.links[node1][node2]) == 0:
             del self.links[node1][node2]
-
-        self.reverse_link_lookup[node2][node1].remove(link_id)
-        if len(self.reverse_link_lookup[node2][node1]) == 0:
             del self.reverse_link_lookup[node2][node1]
+        self._unindex_link(node1, node2, link_id)
+        self._notify(EventKind.REMOVE_LINK, node1, node2, link_id, link_value)
+
+    def successors(self, node: NodeId) -> Iterator[NodeId]:
+        """Iterate over the destination nodes of the links leaving the node.
+
+        Raises:
+            ValueError: When the node is not in the graph
+        """
+        if node not in self.nodes:
+            raise ValueError("The given node is not in the graph")
+        return iter(self.links[node])
+
+    def predecessors(self, node: NodeId) -> Iterator[NodeId]:
+        """Iterate over the source nodes of the links reaching the node.
+
+        Raises:
+            ValueError: When the node is not in the graph
+        """
+        if node not in self.nodes:
+            raise ValueError("The given node is not in the graph")
+        return iter(self.reverse_link_lookup[node])
+
+    def out_edges(self, node: NodeId) -> Iterator[Tuple[NodeId, NodeId, LinkId, EV]]:
+        """Iterate over the links leaving the node, as `(node, dest_node, link_id, link_value)`.
+
+        Raises:
+            ValueError: When the node is not in the graph
+        """
+        if node not in self.nodes:
+            raise ValueError("The given node is not in the graph")
+        return (
+            (node, dest_node, link_id, link_value)
+            for dest_node, links in self.links[node].items()
+            for link_id, link_value in links.items()
+        )
+
+    def in_edges(self, node: NodeId) -> Iterator[Tuple[NodeId, NodeId, LinkId, EV]]:
+        """Iterate over the links reaching the node, as `(source_node, node, link_id, link_value)`.
+
+        Raises:
+            ValueError: When the node is not in the graph
+        """
+        if node not in self.nodes:
+            raise ValueError("The given node is not in the graph")
+        return (
+            (source_node, node, link_id, link_value)
+            for source_node, links in self.reverse_link_lookup[node].items()
+            for link_id, link_value in links.items()
+        )
+
+    def transposed(self) -> "TransposedView[NV, EV]":
+        """Read only view of the graph with every link reversed, without copying anything.
+
+        The view follows the changes of the graph. Its `links` is the `reverse_link_lookup` of the
+        graph, so the traversals of `graph.traversal` walk the links backward on the view.
+        """
+        return TransposedView(self)
+
+    def diff(self, other: "AdjacencyDirectedSetMultiGraph") -> GraphDiff:
+        """Compute the changes turning this graph into the other one (see `graph.diff`).
+
+        Args:
+            other (AdjacencyDirectedSetMultiGraph): The new version of the graph.
+
+        Returns:
+            GraphDiff: Added, removed and changed nodes and links, to give to `apply_patch`.
+
+        Raises:
+            ValueError: When the other graph is not of the same class
+        """
+        return diff_graphs(self, other)
+
+    def apply_patch(self, diff: GraphDiff) -> None:
+        """Update the graph in place with the changes computed by `diff`.
+
+        Args:
+            diff (GraphDiff): Changes from a graph in the same state as this one.
+        """
+        patch_graph(self, diff)
 
     def render(self, filename: str, graph_name: str, output_format: str = "svg"):
         """Render a graph to the fileformat yout want, with the given filename
@@ -143,6 +251,8 @@ class AdjacencyDirectedSetMultiGraph(Generic[NV, EV]):
             graph_name (str): The name of the graph to be rendered
             format (str, optional): File format of the graph. Defaults to "svg". Supported format are available [here](https://graphviz.org/docs/outputs/)
         """
+        from graphviz import Digraph
+
         dot = Digraph(graph_name, format=output_format)
 
         for node, node_value in self.nodes.items():
@@ -153,3 +263,60 @@ class AdjacencyDirectedSetMultiGraph(Generic[NV, EV]):
                 for link_id, link_value in links.items():
                     dot.edge(str(source_node), str(dest_node), label=str(link_value))
         dot.render(filename)
+
+
+class TransposedView(Generic[NV, EV]):
+    """Read only view of a directed multigraph with every link reversed.
+
+    `links` and `reverse_link_lookup` are the dicts of the graph, swapped. Subscribers are notified
+    of the mutations of the graph, with the link endpoints in the orientation of the graph.
+    """
+
+    is_directed = True
+    is_multigraph = True
+
+    def __init__(self, graph: AdjacencyDirectedSetMultiGraph[NV, EV]) -> None:
+        self.graph = graph
+
+    @property
+    def nodes(self) -> Dict[NodeId, NV]:
+        return self.graph.nodes
+
+    @property
+    def links(self) -> Dict[NodeId, Dict[NodeId, Dict[LinkId, EV]]]:
+        return self.graph.reverse_link_lookup
+
+    @property
+    def reverse_link_lookup(self) -> Dict[NodeId, Dict[NodeId, Dict[LinkId, EV]]]:
+        return self.graph.links
+
+    @property
+    def version(self) -> int:
+        return self.graph.version
+
+    def subscribe(self, observer: Observer) -> None:
+        self.graph.subscribe(observer)
+
+    def unsubscribe(self, observer: Observer) -> None:
+        self.graph.unsubscribe(observer)
+
+    def successors(self, node: NodeId) -> Iterator[NodeId]:
+        return self.graph.predecessors(node)
+
+    def predecessors(self, node: NodeId) -> Iterator[NodeId]:
+        return self.graph.successors(node)
+
+    def out_edges(self, node: NodeId) -> Iterator[Tuple[NodeId, NodeId, LinkId, EV]]:
+        return (
+            (node2, node1, link_id, link_value)
+            for node1, node2, link_id, link_value in self.graph.in_edges(node)
+        )
+
+    def in_edges(self, node: NodeId) -> Iterator[Tuple[NodeId, NodeId, LinkId, EV]]:
+        return (
+            (node2, node1, link_id, link_value)
+            for node1, node2, link_id, link_value in self.graph.out_edges(node)
+        )
+
+    def transposed(self) -> AdjacencyDirectedSetMultiGraph[NV, EV]:
+        return self.graph
@@ -0,0 +1,176 @@
+from bisect import bisect_right
+from dataclasses import dataclass
+from enum import Enum
+from typing import Any, Callable, Hashable, List, Optional
+
+NodeId = Hashable
+LinkId = Hashable
+
+
+class EventKind(Enum):
+    """Kind of mutation. The value is the name of the graph method replaying the mutation."""
+
+    ADD_NODE = "add_node"
+    REMOVE_NODE = "remove_node"
+    ADD_LINK = "add_link"
+    REMOVE_LINK = "remove_link"
+
+
+@dataclass(frozen=True)
+class GraphEvent:
+    """A single mutation of a graph.
+
+    Removing a node first emits a REMOVE_LINK event for each link connected to it, and adding a link
+    between unknown nodes first emits their ADD_NODE events, so each event is self contained.
+
+    Attributes:
+        version (int): Version of the graph after the mutation.
+        kind (EventKind): Kind of mutation.
+        node1 (NodeId): The node added or removed, or the first (source) node of the link.
+        node2 (NodeId): The second (destination) node of the link. None for node events.
+        link_id (LinkId): The link id for multigraphs. None otherwise.
+        value: The new value for additions, the removed value for removals.
+        previous: The value replaced by an addition, when `replaced` is True.
+        replaced (bool): True when an addition updated an existing node or link.
+    """
+
+    version: int
+    kind: EventKind
+    node1: NodeId
+    node2: NodeId = None
+    link_id: LinkId = None
+    value: Any = None
+    previous: Any = None
+    replaced: bool = False
+
+    def apply(self, graph: "ObservableGraph") -> None:
+        """Apply the mutation to the given graph."""
+        if self.kind is EventKind.ADD_NODE:
+            graph.add_node(self.node1, self.value)
+        elif self.kind is EventKind.REMOVE_NODE:
+            graph.remove_node(self.node1)
+        elif self.kind is EventKind.ADD_LINK:
+            if graph.is_multigraph:
+                graph.add_link(self.node1, self.node2, self.link_id, self.value)
+            else:
+                graph.add_link(self.node1, self.node2, self.value)
+        elif graph.is_multigraph:
+            graph.remove_link(self.node1, self.node2, self.link_id)
+        else:
+            graph.remove_link(self.node1, self.node2)
+
+
+Observer = Callable[[GraphEvent], None]
+
+
+class ObservableGraph:
+    """Base class of the graphs: keeps a version number and notifies observers of each mutation.
+
+    The version is bumped by every mutation, even without observers, so it can be used to detect
+    that a graph changed. Observers are called synchronously, after the mutation is applied.
+    """
+
+    is_directed = False
+    is_multigraph = False
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.version = 0
+        self._observers: List[Observer] = []
+
+    def subscribe(self, observer: Observer) -> None:
+        """Call `observer(event)` after each mutation of the graph."""
+        self._observers.append(observer)
+
+    def unsubscribe(self, observer: Observer) -> None:
+        """Stop notifying the given observer.
+
+        Raises:
+            ValueError: When the observer is not subscribed
+        """
+        self._observers.remove(observer)
+
+    def _notify(
+        self,
+        kind: EventKind,
+        node1: NodeId,
+        node2: NodeId = None,
+        link_id: LinkId = None,
+        value: Any = None,
+        previous: Any = None,
+        replaced: bool = False,
+    ) -> None:
+        self.version += 1
+        if self._observers:
+            event = GraphEvent(
+                self.version, kind, node1, node2, link_id, value, previous, replaced
+            )
+            for observer in tuple(self._observers):
+                observer(event)
+
+
+class MutationJournal:
+    """Append-only journal of the mutations of a graph.
+
+    Example:
+        journal = MutationJournal(graph)
+        version = graph.version
+        ...  # mutate the graph
+        for event in journal.events_since(version):
+            update_my_index(event)
+        journal.replay(replica, since=version)
+    """
+
+    def __init__(self, graph: Optional[ObservableGraph] = None) -> None:
+        self.events: List[GraphEvent] = []
+        self.truncated_version = 0
+        self.graph: Optional[ObservableGraph] = None
+        if graph is not None:
+            self.attach(graph)
+
+    def attach(self, graph: ObservableGraph) -> None:
+        """Start recording the mutations of the graph.
+
+        Raises:
+            ValueError: When the journal is already attached to a graph
+        """
+        if self.graph is not None:
+            raise ValueError("The journal is already attached to a graph")
+        self.graph = graph
+        graph.subscribe(self.record)
+
+    def detach(self) -> None:
+        """Stop recording the mutations of the graph. Recorded events are kept."""
+        if self.graph is not None:
+            self.graph.unsubscribe(self.record)
+            self.graph = None
+
+    def record(self, event: GraphEvent) -> None:
+        self.events.append(event)
+
+    @property
+    def version(self) -> int:
+        """Version of the last recorded event (or truncated version if there is none)."""
+        return self.events[-1].version if self.events else self.truncated_version
+
+    def events_since(self, version: int) -> List[GraphEvent]:
+        """Return the recorded events with a version strictly greater than the given one.
+
+        Raises:
+            ValueError: When events after this version were truncated
+        """
+        if version < self.truncated_version:
+            raise ValueError("Events after this version were truncated")
+        start = bisect_right(self.events, version, key=lambda event: event.version)
+        return self.events[start:]
+
+    def truncate(self, version: int) -> None:
+        """Forget the events up to the given version (included) to bound the journal size."""
+        start = bisect_right(self.events, version, key=lambda event: event.version)
+        del self.events[:start]
+        self.truncated_version = max(self.truncated_version, version)
+
+    def replay(self, graph: ObservableGraph, since: int = 0) -> None:
+        """Apply the events recorded after the `since` version to the given graph."""
+        for event in self.events_since(since):
+            event.apply(graph)
@@ -0,0 +1,207 @@
+from abc import ABC, abstractmethod
+from bisect import bisect_left, bisect_right
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Hashable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+)
+
+from .events import EventKind, GraphEvent
+
+Item = Hashable
+KeyFunction = Callable[[Any], Any]
+
+
+class HashIndex:
+    """Hash index mapping a key to the set of items having this key."""
+
+    def __init__(self) -> None:
+        self.buckets: Dict[Hashable, Set[Item]] = {}
+
+    def add(self, key: Hashable, item: Item) -> None:
+        if key not in self.buckets:
+            self.buckets[key] = set()
+        self.buckets[key].add(item)
+
+    def remove(self, key: Hashable, item: Item) -> None:
+        bucket = self.buckets[key]
+        bucket.remove(item)
+        # Remove key if there is no more item in the set
+        if len(bucket) == 0:
+            del self.buckets[key]
+
+    def find(self, key: Hashable) -> Set[Item]:
+        return set(self.buckets.get(key, ()))
+
+
+class SortedIndex:
+    """Sorted index: the items of each key in a bucket, the distinct keys in a sorted list.
+
+    Lookups and range scans use a binary search over the distinct keys. Adding or removing an item
+    of an existing key is O(1), only a new key or the last item of a key inserts or deletes in the
+    sorted list, a C level shift of the keys after it. Items of the same key keep their insertion
+    order. Keys must be comparable with each other.
+    """
+
+    def __init__(self) -> None:
+        self.keys: List[Any] = []
+        # Dicts used as insertion ordered sets.
+        self.buckets: Dict[Any, Dict[Item, None]] = {}
+
+    def add(self, key: Any, item: Item) -> None:
+        if key not in self.buckets:
+            self.buckets[key] = {}
+            self.keys.insert(bisect_left(self.keys, key), key)
+        self.buckets[key][item] = None
+
+    def remove(self, key: Any, item: Item) -> None:
+        bucket = self.buckets[key]
+        del bucket[item]
+        # Remove key if there is no more item in the bucket
+        if len(bucket) == 0:
+            del self.buckets[key]
+            del self.keys[bisect_left(self.keys, key)]
+
+    def find(self, key: Any) -> Set[Item]:
+        return set(self.buckets.get(key, ()))
+
+    def range(
+        self, low: Any = None, high: Any = None, include_high: bool = False
+    ) -> Iterator[Item]:
+        """Iterate over the items with `low <= key < high` (or `<= high`), in key order.
+
+        A None bound is not applied.
+        """
+        start = 0 if low is None else bisect_left(self.keys, low)
+        if high is None:
+            end = len(self.keys)
+        elif include_high:
+            end = bisect_right(self.keys, high)
+        else:
+            end = bisect_left(self.keys, high)
+        buckets = [self.buckets[key] for key in self.keys[start:end]]
+        return (item for bucket in buckets for item in list(bucket))
+
+
+class _GraphIndex(ABC):
+    """Secondary index kept up to date with the mutation events of the graph."""
+
+    def __init__(
+        self, graph, key: Optional[KeyFunction] = None, ordered: bool = False
+    ) -> None:
+        self.graph = graph
+        self.key = key if key is not None else (lambda value: value)
+        self.storage = SortedIndex() if ordered else HashIndex()
+        # Indexed key of each item, to move it when its value changes.
+        self.item_keys: Dict[Item, Any] = {}
+        for item, value in self._scan():
+            self._add(item, value)
+        graph.subscribe(self._on_event)
+
+    @abstractmethod
+    def _scan(self) -> Iterator[Tuple[Item, Any]]:
+        """Iterate over the `(item, value)` pairs of the graph to index."""
+
+    @abstractmethod
+    def _on_event(self, event: GraphEvent) -> None:
+        """Update the index after a mutation of the graph."""
+
+    def _add(self, item: Item, value: Any) -> None:
+        if item in self.item_keys:
+            self._remove(item)
+        key = self.key(value)
+        self.item_keys[item] = key
+        self.storage.add(key, item)
+
+    def _remove(self, item: Item) -> None:
+        self.storage.remove(self.item_keys.pop(item), item)
+
+    def __len__(self) -> int:
+        return len(self.item_keys)
+
+    def find(self, key: Any) -> Set[Item]:
+        """Return the items whose value has the given key."""
+        return self.storage.find(key)
+
+    def range(
+        self, low: Any = None, high: Any = None, include_high: bool = False
+    ) -> Iterator[Item]:
+        """Iterate over the items with `low <= key < high` (or `<= high`), in key order.
+
+        Raises:
+            TypeError: When the index is not ordered
+        """
+        if not isinstance(self.storage, SortedIndex):
+            raise TypeError("Range scans need an ordered index")
+        return self.storage.range(low, high, include_high)
+
+    def close(self) -> None:
+        """Stop maintaining the index."""
+        self.graph.unsubscribe(self._on_event)
+
+
+class NodeIndex(_GraphIndex):
+    """Secondary index over the node values of a graph. Items are node ids.
+
+    Example:
+        index = NodeIndex(graph, key=lambda value: value["team"])
+        index.find("core")  # Nodes whose value has the "core" team
+        ordered = NodeIndex(graph, key=lambda value: value["age"], ordered=True)
+        list(ordered.range(18, 30))
+    """
+
+    def _scan(self):
+        return self.graph.nodes.items()
+
+    def _on_event(self, event: GraphEvent) -> None:
+        if event.kind is EventKind.ADD_NODE:
+            self._add(event.node1, event.value)
+        elif event.kind is EventKind.REMOVE_NODE:
+            self._remove(event.node1)
+
+
+class LinkIndex(_GraphIndex):
+    """Secondary index over the link values of a graph.
+
+    Items are `(node1, node2)` tuples, or `(node1, node2, link_id)` tuples for multigraphs. For
+    undirected graphs, each link is indexed once, in the orientation it was first seen.
+    """
+
+    def _item(self, node1, node2, link_id) -> Item:
+        return (node1, node2, link_id) if self.graph.is_multigraph else (node1, node2)
+
+    def _scan(self):
+        seen = set()
+        for node1, dest_nodes in self.graph.links.items():
+            for node2, links in dest_nodes.items():
+                if not self.graph.is_directed:
+                    if (node2, node1) in seen:
+                        continue
+                    seen.add((node1, node2))
+                if not self.graph.is_multigraph:
+                    yield (node1, node2), links
+                    continue
+                for link_id, link_value in links.items():
+                    yield (node1, node2, link_id), link_value
+
+    def _oriented(self, node1, node2, link_id) -> Item:
+        item = self._item(node1, node2, link_id)
+        if not self.graph.is_directed and item not in self.item_keys:
+            reversed_item = self._item(node2, node1, link_id)
+            if reversed_item in self.item_keys:
+                return reversed_item
+        return item
+
+    def _on_event(self, event: GraphEvent) -> None:
+        if event.kind is EventKind.ADD_LINK:
+            self._add(
+                self._oriented(event.node1, event.node2, event.link_id), event.value
+            )
+        elif event.kind is EventKind.REMOVE_LINK:
+            self._remove(self._oriented(event.node1, event.node2, event.link_id))
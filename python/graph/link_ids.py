@@ -0,0 +1,78 @@
+from typing import Any, Dict, Hashable, Set, Tuple
+
+NodeId = Hashable
+LinkId = Hashable
+
+
+class LinkIdLookup:
+    """Lookup of the links of a multigraph by id only, shared by the multigraph classes.
+
+    The graph keeps `link_id_lookup`, the pairs of nodes linked by each link id, up to date by calling
+    `_index_link` and `_unindex_link`. A link id can be reused between other nodes, the methods
+    finding a link from its id only raise ValueError in that case.
+    """
+
+    link_id_lookup: Dict[LinkId, Set[Tuple[NodeId, NodeId]]]
+
+    def _index_link(self, node1: NodeId, node2: NodeId, link_id: LinkId):
+        if link_id not in self.link_id_lookup:
+            self.link_id_lookup[link_id] = set()
+        self.link_id_lookup[link_id].add((node1, node2))
+
+    def _unindex_link(self, node1: NodeId, node2: NodeId, link_id: LinkId):
+        pairs = self.link_id_lookup[link_id]
+        pairs.discard((node1, node2))
+        # Remove key if there is no more item in the set
+        if len(pairs) == 0:
+            del self.link_id_lookup[link_id]
+
+    def _find_link(self, link_id: LinkId) -> Tuple[NodeId, NodeId]:
+        if link_id not in self.link_id_lookup:
+            raise ValueError("The given link is not in the graph")
+        pairs = self.link_id_lookup[link_id]
+        if len(pairs) > 1:
+            raise ValueError(
+                "The given link id is used between several nodes, use their node ids"
+            )
+        return next(iter(pairs))
+
+    def get_link(self, link_id: LinkId) -> Tuple[NodeId, NodeId, Any]:
+        """Find a link from its id only.
+
+        Args:
+            link_id (LinkId): The id of the link
+
+        Returns:
+            Tuple[NodeId, NodeId, Any]: The nodes of the link and its value
+
+        Raises:
+            ValueError: The link is not in the graph
+            ValueError: The link id is used between several pairs of nodes
+        """
+        node1, node2 = self._find_link(link_id)
+        return node1, node2, self.links[node1][node2][link_id]
+
+    def remove_link_by_id(self, link_id: LinkId):
+        """Remove a link from its id only.
+
+        Args:
+            link_id (LinkId): The id of the link to remove
+
+        Raises:
+            ValueError: The link is not in the graph
+            ValueError: The link id is used between several pairs of nodes
+        """
+        self.remove_link(*self._find_link(link_id), link_id)
+
+    def update_link_value(self, link_id: LinkId, link_value: Any):
+        """Replace the value of a link found from its id only.
+
+        Args:
+            link_id (LinkId): The id of the link to update
+            link_value (Any): The new value of the link
+
+        Raises:
+            ValueError: The link is not in the graph
+            ValueError: The link id is used between several pairs of nodes
+        """
+        self.add_link(*self._find_link(link_id), link_id, link_value)
@@ -0,0 +1,163 @@
+import heapq
+from array import array
+from itertools import count
+from typing import Any, Callable, Dict, Hashable, Iterator, List, Optional, Tuple
+
+NodeId = Hashable
+LinkId = Hashable
+# (node1, node2, link_id, link_value), link_id is None for graphs without link ids.
+SpanningLink = Tuple[NodeId, NodeId, Optional[LinkId], Any]
+CostFunction = Callable[[Any], Any]
+
+
+class UnionFind:
+    """Disjoint sets over the integers 0 to size - 1, with union by size and path halving."""
+
+    def __init__(self, size: int) -> None:
+        self.parent = list(range(size))
+        self.size = [1] * size
+
+    def find(self, element: int) -> int:
+        parent = self.parent
+        while parent[element] != element:
+            parent[element] = parent[parent[element]]
+            element = parent[element]
+        return element
+
+    def union(self, element1: int, element2: int) -> bool:
+        """Merge the sets of both elements. Return False if they were already in the same set."""
+        root1, root2 = self.find(element1), self.find(element2)
+        if root1 == root2:
+            return False
+        if self.size[root1] < self.size[root2]:
+            root1, root2 = root2, root1
+        self.parent[root2] = root1
+        self.size[root1] += self.size[root2]
+        return True
+
+
+def _check_undirected(graph) -> None:
+    if graph.is_directed:
+        raise ValueError("Spanning trees are only defined for undirected graphs")
+
+
+def _cheapest_links(graph, node: NodeId, cost: CostFunction) -> Iterator[tuple]:
+    """Cheapest link between the node and each of its neighbours, self links excluded.
+
+    Yields `(cost, neighbour, link_id, link_value)` tuples.
+    """
+    for neighbour, links in graph.links[node].items():
+        if neighbour == node:
+            continue
+        if not graph.is_multigraph:
+            yield cost(links), neighbour, None, links
+            continue
+        if len(links) == 1:
+            ((link_id, link_value),) = links.items()
+            yield cost(link_value), neighbour, link_id, link_value
+            continue
+        # Parallel links: only the cheapest one can be part of a minimum spanning tree. Each cost
+        # is computed once, the position breaks ties so link ids are never compared.
+        link_cost, _, link_id = min(
+            (cost(link_value), position, link_id)
+            for position, (link_id, link_value) in enumerate(links.items())
+        )
+        yield link_cost, neighbour, link_id, links[link_id]
+
+
+def kruskal(graph, cost: Optional[CostFunction] = None) -> List[SpanningLink]:
+    """Minimum spanning forest of an undirected graph with Kruskal's algorithm.
+
+    The link values are the costs, or `cost(link_value)` if a cost function is given. Self links are
+    ignored and only the cheapest of parallel links is considered. A disconnected graph gives a
+    spanning forest, with one tree per connected component.
+
+    Args:
+        graph: An undirected graph of the package.
+        cost (Callable, optional): Cost of a link from its value. Defaults to the value itself.
+
+    Returns:
+        List[SpanningLink]: The `(node1, node2, link_id, link_value)` links of the forest,
+        link_id being None for simple graphs.
+
+    Raises:
+        ValueError: When the graph is directed
+    """
+    _check_undirected(graph)
+    cost = cost if cost is not None else (lambda value: value)
+    nodes = list(graph.nodes)
+    positions: Dict[NodeId, int] = {node: i for i, node in enumerate(nodes)}
+    # Edge arrays rather than a tuple per edge, each undirected link taken once from its node with
+    # the lowest position. Values are looked up again for the links of the forest only.
+    costs: List[Any] = []
+    ends1, ends2 = array("q"), array("q")
+    link_ids: List[Optional[LinkId]] = []
+    for position, node in enumerate(nodes):
+        for link_cost, neighbour, link_id, _ in _cheapest_links(graph, node, cost):
+            neighbour_position = positions[neighbour]
+            if position < neighbour_position:
+                costs.append(link_cost)
+                ends1.append(position)
+                ends2.append(neighbour_position)
+                link_ids.append(link_id)
+    # Sort on the cost only, link ids and values do not need to be comparable.
+    order = sorted(range(len(costs)), key=costs.__getitem__)
+
+    forest: List[SpanningLink] = []
+    sets = UnionFind(len(nodes))
+    needed = len(nodes) - 1
+    links = graph.links
+    for edge in order:
+        position1, position2 = ends1[edge], ends2[edge]
+        if sets.union(position1, position2):
+            node1, node2, link_id = nodes[position1], nodes[position2], link_ids[edge]
+            value = links[node1][node2]
+            if graph.is_multigraph:
+                value = value[link_id]
+            forest.append((node1, node2, link_id, value))
+            if len(forest) == needed:
+                break
+    return forest
+
+
+def prim(graph, cost: Optional[CostFunction] = None) -> List[SpanningLink]:
+    """Minimum spanning forest of an undirected graph with Prim's algorithm and a lazy heap.
+
+    Same arguments and result as `kruskal`. Outdated heap entries are skipped when popped instead of
+    being updated, and a new tree is started from each node not reached yet.
+
+    Raises:
+        ValueError: When the graph is directed
+    """
+    _check_undirected(graph)
+    cost = cost if cost is not None else (lambda value: value)
+    # Tie breaker so nodes and values are never compared.
+    counter = count()
+    visited = set()
+    forest: List[SpanningLink] = []
+    for start in graph.nodes:
+        if start in visited:
+            continue
+        visited.add(start)
+        heap = []
+        node = start
+        while True:
+            for link_cost, neighbour, link_id, value in _cheapest_links(
+                graph, node, cost
+            ):
+                if neighbour not in visited:
+                    heapq.heappush(
+                        heap,
+                        (link_cost, next(counter), node, neighbour, link_id, value),
+                    )
+            node = None
+            while heap:
+                _, _, node1, node2, link_id, value = heapq.heappop(heap)
+                if node2 not in visited:
+                    visited.add(node2)
+                    forest.append((node1, node2, link_id, value))
+                    node = node2
+                    break
+            if node is None:
+                break
+    return forest
@@ -0,0 +1,144 @@
+import asyncio
+import sys
+import threading
+import time
+
+from ..aio import AsyncGraph
+from ..concurrent import ConcurrentGraph
+from ..directed_graph.multigraph import AdjacencyDirectedSetMultiGraph
+from ..undirected_graph.adjacency_set import AdjacencySetUndirectedGraph
+
+
+def line_graph(size):
+    g: AdjacencySetUndirectedGraph[int, str] = AdjacencySetUndirectedGraph()
+    for i in range(size - 1):
+        g.add_link(i, i + 1)
+    return g
+
+
+def test_async_graph_batched_lookups():
+    graph = AsyncGraph(line_graph(4))
+    flushes = []
+    original_resolve = graph._resolve
+
+    def resolve(kind, requests):
+        flushes.append(sorted(requests))
+        original_resolve(kind, requests)
+
+    graph._resolve = resolve
+
+    async def main():
+        return await asyncio.gather(
+            graph.neighbours(0), graph.neighbours(1), graph.neighbours(1)
+        )
+
+    assert asyncio.run(main()) == [[1], [0, 2], [0, 2]]
+    assert flushes == [[0, 1]]
+
+
+def test_async_graph_missing_node():
+    graph = AsyncGraph(line_graph(2))
+
+    async def main():
+        return await asyncio.gather(
+            graph.get_node(0), graph.get_node(10), return_exceptions=True
+        )
+
+    value, error = asyncio.run(main())
+    assert value is None
+    assert isinstance(error, ValueError)
+
+
+def test_async_graph_traversals_yield_control():
+    graph = AsyncGraph(line_graph(10), yield_every=2)
+    ticks = []
+
+    async def ticker():
+        for i in range(3):
+            ticks.append(i)
+            await asyncio.sleep(0)
+
+    async def main():
+        task = asyncio.create_task(ticker())
+        visited = [node async for node in graph.bfs(0)]
+        await task
+        return visited, [node async for node in graph.dfs(9)]
+
+    bfs_order, dfs_order = asyncio.run(main())
+    assert bfs_order == list(range(10))
+    assert dfs_order == list(reversed(range(10)))
+    assert ticks == [0, 1, 2]
+
+
+def test_async_graph_traversals_with_concurrent_writer():
+    hub: AdjacencySetUndirectedGraph[int, str] = AdjacencySetUndirectedGraph()
+    for node in range(1, 2000):
+        hub.add_link(0, node)
+    shared = ConcurrentGraph(hub)
+    graph = AsyncGraph(shared, yield_every=10)
+    stop = threading.Event()
+
+    def writer():
+        # Resizes the links of the hub while the traversals iterate over them.
+        while not stop.is_set():
+            shared.add_link(0, -1)
+            shared.remove_node(-1)
+
+    async def main():
+        for _ in range(20):
+            assert len([node async for node in graph.bfs(0)]) >= 2000
+            assert len([node async for node in graph.dfs(1)]) >= 2000
+
+    interval = sys.getswitchinterval()
+    # Switch threads often so the writer runs in the middle of the traversals.
+    sys.setswitchinterval(1e-6)
+    thread = threading.Thread(target=writer)
+    thread.start()
+    try:
+        asyncio.run(main())
+    finally:
+        stop.set()
+        thread.join(5)
+        sys.setswitchinterval(interval)
+
+
+def test_async_graph_offloaded_shortest_path():
+    graph = AsyncGraph(ConcurrentGraph(line_graph(5)))
+    assert asyncio.run(graph.shortest_path(0, 4)) == [0, 1, 2, 3, 4]
+
+
+def test_async_graph_run_with_queued_writer():
+    shared = ConcurrentGraph(line_graph(3))
+    writer = threading.Thread(target=shared.add_link, args=(2, 3))
+
+    def algorithm(graph):
+        assert not isinstance(graph, ConcurrentGraph)
+        writer.start()
+        deadline = time.monotonic() + 5
+        while shared.lock._writers_waiting == 0:
+            assert time.monotonic() < deadline
+            time.sleep(0.001)
+        # Would wait for the writer if the wrapper was given to the algorithm.
+        return sorted(graph.links[1])
+
+    async def main():
+        return await asyncio.wait_for(AsyncGraph(shared).run(algorithm), 5)
+
+    assert asyncio.run(main()) == [0, 2]
+    writer.join(5)
+    assert shared.neighbours(3) == [2]
+
+
+def test_async_graph_bulk_load():
+    graph = AsyncGraph(AdjacencyDirectedSetMultiGraph())
+
+    async def main():
+        await graph.bulk_load(
+            nodes=[(1, "Node1")],
+            links=[(1, 2, "link_1"), (2, 1, "link_2")],
+            chunk_size=1,
+        )
+
+    asyncio.run(main())
+    assert graph.graph.nodes == {1: "Node1", 2: None}
+    assert graph.graph.links == {1: {2: {"link_1": None}}, 2: {1: {"link_2": None}}}
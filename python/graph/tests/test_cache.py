@@ -0,0 +1,173 @@
+import pytest
+
+from ..cache import QueryCache
+from ..directed_graph.multigraph import AdjacencyDirectedSetMultiGraph
+from .. import traversal
+from ..traversal import shortest_path
+from ..undirected_graph.adjacency_set import AdjacencySetUndirectedGraph
+
+
+def chain_graph() -> AdjacencySetUndirectedGraph[int, str]:
+    g: AdjacencySetUndirectedGraph[int, str] = AdjacencySetUndirectedGraph()
+    for node in range(4):
+        g.add_link(node, node + 1)
+    g.add_link(10, 11)
+    return g
+
+
+def test_query_cache_hits_until_the_graph_changes():
+    g = chain_graph()
+    cache = QueryCache(g)
+    assert cache.shortest_path(0, 4) == (0, 1, 2, 3, 4)
+    assert cache.shortest_path(0, 4) == (0, 1, 2, 3, 4)
+    assert cache.is_reachable(0, 4) is True
+    assert (cache.hits, cache.misses) == (2, 1)
+
+    g.add_link(0, 4)
+    assert cache.shortest_path(0, 4) == (0, 4)
+    assert cache.misses == 2
+
+
+def test_query_cache_queries():
+    g = chain_graph()
+    cache = QueryCache(g)
+    assert cache.neighbours(1) == (0, 2)
+    assert cache.is_reachable(0, 11) is False
+    assert cache.shortest_path(0, 11) is None
+    assert cache.shortest_path(2, 2) == (2,)
+    assert cache.get(lambda graph: len(graph.nodes)) is not None
+    with pytest.raises(ValueError):
+        cache.neighbours(42)
+    with pytest.raises(ValueError):
+        cache.shortest_path(0, 42)
+
+
+def test_query_cache_generic_query():
+    g = chain_graph()
+    calls = []
+
+    def degree(graph, node):
+        calls.append(node)
+        return len(graph.links[node])
+
+    for track_nodes in (False, True):
+        calls.clear()
+        cache = QueryCache(g, track_nodes=track_nodes)
+        assert cache.get(degree, 1) == 2
+        assert cache.get(degree, 1) == 2
+        assert calls == [1]
+        # Generic queries are invalidated by any mutation.
+        g.add_node(20)
+        assert cache.get(degree, 1) == 2
+        assert calls == [1, 1]
+        cache.close()
+
+
+def test_query_cache_lru_eviction():
+    g = chain_graph()
+    cache = QueryCache(g, maxsize=2)
+    cache.neighbours(0)
+    cache.neighbours(1)
+    cache.neighbours(0)
+    cache.neighbours(2)
+    assert len(cache) == 2
+    misses = cache.misses
+    cache.neighbours(0)
+    assert cache.misses == misses
+    cache.neighbours(1)
+    assert cache.misses == misses + 1
+    with pytest.raises(ValueError):
+        QueryCache(g, maxsize=0)
+
+
+def test_query_cache_track_nodes():
+    g = chain_graph()
+    cache = QueryCache(g, track_nodes=True)
+    cache.shortest_path(0, 2)
+    cache.neighbours(11)
+    cache.shortest_path(10, 11)
+
+    # Unrelated mutation: the entries are kept.
+    g.add_link(20, 21)
+    cache.shortest_path(0, 2)
+    cache.neighbours(11)
+    cache.shortest_path(10, 11)
+    assert (cache.hits, cache.misses) == (3, 3)
+
+    # Touched node: only its entries are invalidated.
+    g.add_link(1, 5)
+    assert cache.neighbours(11) == (10,)
+    assert cache.shortest_path(10, 11) == (10, 11)
+    assert (cache.hits, cache.misses) == (5, 3)
+    assert cache.shortest_path(0, 2) == (0, 1, 2)
+    assert cache.misses == 4
+
+    cache.close()
+    assert len(cache) == 0
+    g.add_link(0, 2)
+    assert cache.shortest_path(0, 2) == (0, 2)
+
+
+def test_query_cache_track_nodes_unreachable_target():
+    g: AdjacencyDirectedSetMultiGraph[str, None] = AdjacencyDirectedSetMultiGraph()
+    g.add_link("a", "b", 1)
+    g.add_link("c", "d", 1)
+    cache = QueryCache(g, track_nodes=True)
+    assert cache.is_reachable("a", "d") is False
+    # Links between unreached nodes cannot make the target reachable.
+    g.add_link("c", "e", 1)
+    assert cache.is_reachable("a", "d") is False
+    assert cache.hits == 1
+    g.add_link("b", "c", 1)
+    assert cache.shortest_path("a", "d") == ("a", "b", "c", "d")
+    g.remove_node("d")
+    with pytest.raises(ValueError):
+        cache.is_reachable("a", "d")
+
+
+def test_query_cache_track_nodes_matches_traversal():
+    g = chain_graph()
+    cache = QueryCache(g, track_nodes=True)
+    pairs = [(source, target) for source in g.nodes for target in g.nodes]
+    for mutation in (
+        lambda: g.add_link(4, 10),
+        lambda: g.remove_link(1, 2),
+        lambda: g.remove_node(3),
+        lambda: g.add_link(0, 11),
+    ):
+        for source, target in pairs:
+            if source in g.nodes and target in g.nodes:
+                expected = shortest_path(g, source, target)
+                cached = cache.shortest_path(source, target)
+                assert (len(cached) if cached else None) == (
+                    len(expected) if expected else None
+                )
+        mutation()
+
+
+def test_query_cache_track_nodes_transposed_view():
+    g: AdjacencyDirectedSetMultiGraph[str, None] = AdjacencyDirectedSetMultiGraph()
+    g.add_link("a", "b", 1)
+    g.add_link("c", "d", 1)
+    view = g.transposed()
+    cache = QueryCache(view, track_nodes=True)
+    assert cache.shortest_path("b", "a") == ("b", "a")
+    assert cache.is_reachable("d", "a") is False
+    # Events are in the orientation of the graph, both endpoints are tracked.
+    g.add_link("c", "e", 1)
+    assert cache.shortest_path("b", "a") == ("b", "a")
+    assert cache.hits == 1
+    g.add_link("a", "c", 1)
+    assert cache.shortest_path("d", "a") == ("d", "c", "a")
+    cache.close()
+
+
+def test_query_cache_search_is_observed(monkeypatch):
+    searches = []
+    monkeypatch.setattr(
+        traversal, "observer", lambda name, visited: searches.append(name)
+    )
+    cache = QueryCache(chain_graph())
+    cache.shortest_path(0, 4)
+    cache.is_reachable(0, 4)
+    assert searches == ["shortest_path"]
@@ -0,0 +1,145 @@
+import threading
+import time
+
+import pytest
+
+from ..concurrent import ConcurrentGraph, ReadWriteLock
+from ..directed_graph.multigraph import AdjacencyDirectedSetMultiGraph
+from ..undirected_graph.adjacency_set import AdjacencySetUndirectedGraph
+from ..undirected_graph.multigraph import AdjacencySetUndirectedMultiGraph
+
+
+def test_read_write_lock_allows_concurrent_readers():
+    lock = ReadWriteLock()
+    both_inside = threading.Barrier(2, timeout=5)
+
+    def reader():
+        with lock.read():
+            both_inside.wait()
+
+    threads = [threading.Thread(target=reader) for _ in range(2)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert not both_inside.broken
+
+
+def test_read_write_lock_writer_is_exclusive():
+    lock = ReadWriteLock()
+    lock.acquire_write()
+    acquired = threading.Event()
+
+    def reader():
+        with lock.read():
+            acquired.set()
+
+    thread = threading.Thread(target=reader)
+    thread.start()
+    assert acquired.wait(0.05) is False
+    lock.release_write()
+    thread.join()
+    assert acquired.is_set()
+
+
+def test_read_write_lock_reentrant_writer():
+    lock = ReadWriteLock()
+    with lock.write():
+        with lock.write():
+            with lock.read():
+                pass
+    # The lock must be free again
+    with lock.write():
+        pass
+
+
+def wait_for_queued_writer(lock, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while lock._writers_waiting == 0:
+        assert time.monotonic() < deadline
+        time.sleep(0.001)
+
+
+def test_read_write_lock_reentrant_reader_with_queued_writer():
+    g = ConcurrentGraph(AdjacencySetUndirectedGraph())
+    g.add_link(1, 2)
+    writer = threading.Thread(target=g.add_link, args=(2, 3))
+    with g.read():
+        writer.start()
+        wait_for_queued_writer(g.lock)
+        # Nested read while a writer waits for this thread to release the lock.
+        assert g.neighbours(1) == [2]
+    writer.join(5)
+    assert not writer.is_alive()
+    assert g.neighbours(2) == [1, 3]
+
+
+def test_read_write_lock_upgrade_raises():
+    g = ConcurrentGraph(AdjacencySetUndirectedGraph())
+    with g.read():
+        with pytest.raises(RuntimeError):
+            g.add_link(1, 2)
+    # The lock is still usable after the failed upgrade.
+    g.add_link(1, 2)
+    assert g.neighbours(1) == [2]
+    with pytest.raises(RuntimeError):
+        g.lock.release_read()
+
+
+def test_concurrent_graph_delegates():
+    g = ConcurrentGraph(AdjacencySetUndirectedMultiGraph())
+    g.add_link(1, 2, "link_1", "LinkValue")
+    assert g.nodes == {1: None, 2: None}
+    assert g.links == {1: {2: {"link_1": "LinkValue"}}, 2: {1: {"link_1": "LinkValue"}}}
+    assert g.has_node(1) is True
+    assert g.get_node(2) is None
+    assert g.neighbours(1) == [2]
+
+
+def test_concurrent_graph_materialises_iterators():
+    g = ConcurrentGraph(AdjacencyDirectedSetMultiGraph())
+    g.add_link(1, 2, "a")
+    g.add_link(1, 3, "b")
+    edges = g.out_edges(1)
+    assert edges == [(1, 2, "a", None), (1, 3, "b", None)]
+    # The result does not follow the graph, so mutating it while iterating is safe.
+    for _ in edges:
+        g.add_link(1, 4, "c")
+    assert g.predecessors(4) == [1]
+    assert g.in_edges(2) == [(1, 2, "a", None)]
+
+
+def test_concurrent_graph_transposed_shares_the_lock():
+    g = ConcurrentGraph(AdjacencyDirectedSetMultiGraph())
+    g.add_link(1, 2, "a")
+    view = g.transposed()
+    assert isinstance(view, ConcurrentGraph) and view.lock is g.lock
+    assert view.successors(2) == [1]
+    assert view.in_edges(1) == [(2, 1, "a", None)]
+    assert view.transposed().lock is g.lock
+    with view.read():
+        assert g.lock._read_depth() == 1
+
+
+def test_concurrent_graph_batch():
+    g = ConcurrentGraph(AdjacencySetUndirectedGraph())
+    with g.batch():
+        g.add_link(1, 2)
+        g.remove_node(1)
+    assert g.nodes == {2: None}
+
+
+def test_concurrent_graph_parallel_writers():
+    g = ConcurrentGraph(AdjacencyDirectedSetMultiGraph())
+
+    def writer(offset):
+        for i in range(200):
+            g.add_link(offset, i, (offset, i))
+
+    threads = [threading.Thread(target=writer, args=(t,)) for t in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    for offset in range(4):
+        assert len(g.links[offset]) == 200
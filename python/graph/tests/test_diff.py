@@ -0,0 +1,136 @@
+import random
+
+import pytest
+
+from ..concurrent import ConcurrentGraph
+from ..diff import GraphDiff
+from ..directed_graph.multigraph import AdjacencyDirectedSetMultiGraph
+from ..undirected_graph.adjacency_set import AdjacencySetUndirectedGraph
+from ..undirected_graph.multigraph import AdjacencySetUndirectedMultiGraph
+
+
+def test_diff_identical_graphs_is_empty():
+    old: AdjacencySetUndirectedGraph[int, str] = AdjacencySetUndirectedGraph()
+    new: AdjacencySetUndirectedGraph[int, str] = AdjacencySetUndirectedGraph()
+    for g in (old, new):
+        g.add_link(1, 2, "a")
+        g.add_node(3)
+    diff = old.diff(new)
+    assert diff == GraphDiff()
+    assert not diff
+
+
+def test_diff_simple_graph():
+    old: AdjacencySetUndirectedGraph[int, str] = AdjacencySetUndirectedGraph()
+    old.add_link(1, 2, "a")
+    old.add_link(2, 3, "b")
+    old.add_link(3, 4, None)
+    old.add_node(5, "five")
+    old.add_node(7, "seven")
+    new: AdjacencySetUndirectedGraph[int, str] = AdjacencySetUndirectedGraph()
+    new.add_link(1, 2, "a")
+    new.add_link(2, 3, "changed")
+    new.add_link(1, 6, "c")
+    new.add_node(4)
+    new.add_node(5, "FIVE")
+    diff = old.diff(new)
+    assert diff.added_nodes == {6: None}
+    assert diff.removed_nodes == {7: "seven"}
+    assert diff.changed_nodes == {5: ("five", "FIVE")}
+    assert diff.added_links == {(1, 6): "c"}
+    # Each undirected link is listed once.
+    assert diff.removed_links.keys() in ({(3, 4)}, {(4, 3)})
+    assert diff.changed_links == {(2, 3): ("b", "changed")}
+
+
+def test_diff_undirected_multigraph():
+    old: AdjacencySetUndirectedMultiGraph[int, str] = AdjacencySetUndirectedMultiGraph()
+    old.add_link(1, 2, "x", "a")
+    old.add_link(1, 2, "y", "b")
+    old.add_link(2, 2, "z", "self")
+    new: AdjacencySetUndirectedMultiGraph[int, str] = AdjacencySetUndirectedMultiGraph()
+    new.add_link(1, 2, "x", "a")
+    new.add_link(1, 2, "w", "c")
+    new.add_link(2, 2, "z", "SELF")
+    diff = old.diff(new)
+    assert diff.added_links == {(1, 2, "w"): "c"}
+    assert diff.removed_links == {(1, 2, "y"): "b"}
+    assert diff.changed_links == {(2, 2, "z"): ("self", "SELF")}
+
+
+def test_diff_directed_multigraph():
+    old: AdjacencyDirectedSetMultiGraph[int, str] = AdjacencyDirectedSetMultiGraph()
+    old.add_link(1, 2, "x", "a")
+    old.add_link(2, 1, "x", "b")
+    new: AdjacencyDirectedSetMultiGraph[int, str] = AdjacencyDirectedSetMultiGraph()
+    new.add_link(1, 2, "x", "a")
+    new.add_link(2, 1, "x", "B")
+    new.add_link(3, 1, "y", "c")
+    diff = old.diff(new)
+    assert diff.added_nodes == {3: None}
+    assert diff.added_links == {(3, 1, "y"): "c"}
+    assert diff.removed_links == {}
+    assert diff.changed_links == {(2, 1, "x"): ("b", "B")}
+
+
+def test_diff_other_class():
+    with pytest.raises(ValueError):
+        AdjacencySetUndirectedGraph().diff(AdjacencySetUndirectedMultiGraph())
+
+
+def random_graph(graph_class, rng):
+    g = graph_class()
+    for node in rng.sample(range(30), 20):
+        g.add_node(node, rng.randrange(3))
+    nodes = list(g.nodes)
+    for _ in range(40):
+        node1, node2 = rng.choice(nodes), rng.choice(nodes)
+        if graph_class.is_multigraph:
+            g.add_link(node1, node2, rng.randrange(3), rng.randrange(3))
+        else:
+            g.add_link(node1, node2, rng.randrange(3))
+    return g
+
+
+def normalized(link_id_lookup):
+    return {
+        link_id: {frozenset(pair) for pair in pairs}
+        for link_id, pairs in link_id_lookup.items()
+    }
+
+
+@pytest.mark.parametrize(
+    "graph_class",
+    [
+        AdjacencySetUndirectedGraph,
+        AdjacencySetUndirectedMultiGraph,
+        AdjacencyDirectedSetMultiGraph,
+    ],
+)
+def test_apply_patch_reproduces_the_new_graph(graph_class):
+    rng = random.Random(7)
+    for _ in range(20):
+        old, new = random_graph(graph_class, rng), random_graph(graph_class, rng)
+        events = []
+        old.subscribe(events.append)
+        diff = old.diff(new)
+        old.apply_patch(diff)
+        assert old.nodes == new.nodes
+        assert old.links == new.links
+        if graph_class.is_directed:
+            assert old.reverse_link_lookup == new.reverse_link_lookup
+        if graph_class.is_multigraph:
+            # Undirected links are indexed in the orientation they were added with.
+            assert normalized(old.link_id_lookup) == normalized(new.link_id_lookup)
+        assert len(events) >= len(diff.removed_links) + len(diff.added_links)
+        assert not old.diff(new)
+
+
+def test_apply_patch_through_concurrent_graph():
+    old: AdjacencySetUndirectedGraph[int, str] = AdjacencySetUndirectedGraph()
+    old.add_link(1, 2, "a")
+    new: AdjacencySetUndirectedGraph[int, str] = AdjacencySetUndirectedGraph()
+    new.add_link(2, 3, "b")
+    shared = ConcurrentGraph(old)
+    shared.apply_patch(old.diff(new))
+    assert old.links == new.links
@@ -1,4 +1,7 @@
+import pytest
+
 from ..directed_graph.multigraph import AdjacencyDirectedSetMultiGraph
+from ..traversal import bfs, is_reachable, shortest_path
 
 # Test the behavior of the graph
 
@@ -22,7 +25,7 @@ def test_direct_multigraph_add_link():
     g.add_link(1, 2, "link_1", "LinkValue", node1_value=-1, node2_value=1)
     assert g.links == {1: {2: {"link_1": "LinkValue"}}, 2: {}}
     assert g.nodes == {1: 1, 2: 1}
-    assert g.reverse_link_lookup == {2: {1: {"link_1"}}, 1: {}}
+    assert g.reverse_link_lookup == {2: {1: {"link_1": "LinkValue"}}, 1: {}}
 
 
 def test_direct_multigraph_add_links():
@@ -32,7 +35,10 @@ def test_direct_multigraph_add_links():
     g.add_link(1, 2, "link_2", "AnotherLink", node1_value=-1, node2_value=1)
     assert g.links == {1: {2: {"link_1": "LinkValue", "link_2": "AnotherLink"}}, 2: {}}
     assert g.nodes == {1: 1, 2: 1}
-    assert g.reverse_link_lookup == {2: {1: {"link_1", "link_2"}}, 1: {}}
+    assert g.reverse_link_lookup == {
+        2: {1: {"link_1": "LinkValue", "link_2": "AnotherLink"}},
+        1: {},
+    }
 
 
 def test_direct_multigraph_remove_links():
@@ -42,7 +48,7 @@ def test_direct_multigraph_remove_links():
     g.remove_links(2, 1)
     assert g.links == {1: {2: {"link_1": None}}, 2: {}}
     assert g.nodes == {1: None, 2: None}
-    assert g.reverse_link_lookup == {2: {1: {"link_1"}}, 1: {}}
+    assert g.reverse_link_lookup == {2: {1: {"link_1": None}}, 1: {}}
 
 
 def test_direct_multigraph_remove_link_no_remaining():
@@ -61,7 +67,7 @@ def test_direct_multigraph_remove_link_with_remaining():
     g.remove_link(1, 2, "link_1")
     assert g.links == {1: {2: {"link_2": None}}, 2: {}}
     assert g.nodes == {1: None, 2: None}
-    assert g.reverse_link_lookup == {2: {1: {"link_2"}}, 1: {}}
+    assert g.reverse_link_lookup == {2: {1: {"link_2": None}}, 1: {}}
 
 
 def test_direct_multigraph_remove_node_linked():
@@ -86,3 +92,109 @@ def test_directed_multigraph_render(tmpdir, test_multigraph_directed_viz_dot):
     with open(path, "r", encoding="utf-8") as f:
         content = f.read()
         assert content == test_multigraph_directed_viz_dot
+
+
+def test_direct_multigraph_link_id_lookup():
+    g: AdjacencyDirectedSetMultiGraph[int, str] = AdjacencyDirectedSetMultiGraph()
+    g.add_link(1, 2, "link_1", "LinkValue")
+    g.add_link(2, 1, "link_2")
+    g.add_link(1, 1, "link_3")
+    assert g.get_link("link_1") == (1, 2, "LinkValue")
+    assert g.get_link("link_2") == (2, 1, None)
+
+    g.update_link_value("link_1", "NewValue")
+    assert g.links[1][2] == {"link_1": "NewValue"}
+
+    g.remove_link_by_id("link_2")
+    assert g.links == {1: {2: {"link_1": "NewValue"}, 1: {"link_3": None}}, 2: {}}
+    assert g.link_id_lookup == {"link_1": {(1, 2)}, "link_3": {(1, 1)}}
+    with pytest.raises(ValueError):
+        g.remove_link_by_id("link_2")
+
+    g.remove_node(1)
+    assert g.link_id_lookup == {}
+
+
+def test_direct_multigraph_link_id_lookup_shared_id():
+    g: AdjacencyDirectedSetMultiGraph[int, str] = AdjacencyDirectedSetMultiGraph()
+    g.add_link(1, 2, "link_1")
+    g.add_link(2, 1, "link_1")
+    with pytest.raises(ValueError):
+        g.get_link("link_1")
+    g.remove_links(2, 1)
+    assert g.get_link("link_1") == (1, 2, None)
+
+
+def test_direct_multigraph_reverse_lookup_shares_link_dicts():
+    g: AdjacencyDirectedSetMultiGraph[int, str] = AdjacencyDirectedSetMultiGraph()
+    g.add_link(1, 2, "link_1", "a")
+    assert g.reverse_link_lookup[2][1] is g.links[1][2]
+    g.add_link(1, 2, "link_1", "b")
+    assert g.reverse_link_lookup[2][1] == {"link_1": "b"}
+
+
+def _dependency_graph() -> AdjacencyDirectedSetMultiGraph[str, str]:
+    g: AdjacencyDirectedSetMultiGraph[str, str] = AdjacencyDirectedSetMultiGraph()
+    g.add_link("app", "lib", "import", "v1")
+    g.add_link("app", "lib", "test_import", "v2")
+    g.add_link("lib", "core", "import", "v3")
+    g.add_link("cli", "core", "import", "v4")
+    return g
+
+
+def test_direct_multigraph_predecessors_and_successors():
+    g = _dependency_graph()
+    assert list(g.successors("app")) == ["lib"]
+    assert set(g.predecessors("core")) == {"lib", "cli"}
+    assert list(g.predecessors("app")) == []
+    with pytest.raises(ValueError):
+        g.predecessors("missing")
+    with pytest.raises(ValueError):
+        g.successors("missing")
+
+
+def test_direct_multigraph_in_and_out_edges():
+    g = _dependency_graph()
+    assert list(g.out_edges("app")) == [
+        ("app", "lib", "import", "v1"),
+        ("app", "lib", "test_import", "v2"),
+    ]
+    assert sorted(g.in_edges("core")) == [
+        ("cli", "core", "import", "v4"),
+        ("lib", "core", "import", "v3"),
+    ]
+    with pytest.raises(ValueError):
+        g.in_edges("missing")
+    with pytest.raises(ValueError):
+        g.out_edges("missing")
+
+
+def test_direct_multigraph_transposed_view():
+    g = _dependency_graph()
+    view = g.transposed()
+    assert view.nodes is g.nodes
+    assert view.links is g.reverse_link_lookup
+    assert view.reverse_link_lookup is g.links
+    assert view.transposed() is g
+    assert set(view.successors("core")) == {"lib", "cli"}
+    assert list(view.predecessors("core")) == []
+    assert sorted(view.out_edges("core")) == [
+        ("core", "cli", "import", "v4"),
+        ("core", "lib", "import", "v3"),
+    ]
+    assert list(view.in_edges("app")) == [
+        ("lib", "app", "import", "v1"),
+        ("lib", "app", "test_import", "v2"),
+    ]
+    # The view follows the changes of the graph.
+    g.add_link("tool", "app", "import", "v5")
+    assert list(view.successors("app")) == ["tool"]
+    assert view.version == g.version
+
+
+def test_direct_multigraph_transposed_traversal():
+    g = _dependency_graph()
+    view = g.transposed()
+    assert set(bfs(view, "core")) == {"core", "lib", "cli", "app"}
+    assert shortest_path(view, "core", "app") == ["core", "lib", "app"]
+    assert not is_reachable(view, "app", "core")
@@ -0,0 +1,118 @@
+import pytest
+
+from ..directed_graph.multigraph import AdjacencyDirectedSetMultiGraph
+from ..events import EventKind, GraphEvent, MutationJournal
+from ..undirected_graph.adjacency_set import AdjacencySetUndirectedGraph
+from ..undirected_graph.multigraph import AdjacencySetUndirectedMultiGraph
+
+
+def test_events_notify_observers():
+    g: AdjacencySetUndirectedGraph[int, str] = AdjacencySetUndirectedGraph()
+    events = []
+    g.subscribe(events.append)
+    g.add_link(1, 2, "LinkValue")
+    g.add_link(1, 2, "NewValue")
+    g.remove_node(1)
+    assert events == [
+        GraphEvent(1, EventKind.ADD_NODE, 1),
+        GraphEvent(2, EventKind.ADD_NODE, 2),
+        GraphEvent(3, EventKind.ADD_LINK, 1, 2, value="LinkValue"),
+        GraphEvent(
+            4,
+            EventKind.ADD_LINK,
+            1,
+            2,
+            value="NewValue",
+            previous="LinkValue",
+            replaced=True,
+        ),
+        GraphEvent(5, EventKind.REMOVE_LINK, 1, 2, value="NewValue"),
+        GraphEvent(6, EventKind.REMOVE_NODE, 1),
+    ]
+    assert g.version == 6
+
+    g.unsubscribe(events.append)
+    g.add_node(3)
+    assert len(events) == 6
+    assert g.version == 7
+
+
+def test_events_remove_links_emits_each_link():
+    g: AdjacencySetUndirectedMultiGraph[int, str] = AdjacencySetUndirectedMultiGraph()
+    g.add_link(1, 2, "link_1", "a")
+    g.add_link(1, 2, "link_2", "b")
+    events = []
+    g.subscribe(events.append)
+    g.remove_links(2, 1)
+    assert [(e.kind, e.link_id, e.value) for e in events] == [
+        (EventKind.REMOVE_LINK, "link_1", "a"),
+        (EventKind.REMOVE_LINK, "link_2", "b"),
+    ]
+
+
+def test_events_directed_remove_node_with_incoming_and_self_links():
+    g: AdjacencyDirectedSetMultiGraph[int, str] = AdjacencyDirectedSetMultiGraph()
+    g.add_link(1, 2, "link_1")
+    g.add_link(2, 1, "link_2")
+    g.add_link(1, 1, "link_3")
+    g.add_link(3, 1, "link_4")
+    g.remove_node(1)
+    assert g.nodes == {2: None, 3: None}
+    assert g.links == {2: {}, 3: {}}
+    assert g.reverse_link_lookup == {2: {}, 3: {}}
+
+
+def test_events_add_existing_node_keeps_reverse_lookup():
+    g: AdjacencyDirectedSetMultiGraph[int, str] = AdjacencyDirectedSetMultiGraph()
+    g.add_link(1, 2, "link_1")
+    g.add_node(2, "Node2")
+    assert g.reverse_link_lookup == {2: {1: {"link_1": None}}, 1: {}}
+
+
+@pytest.mark.parametrize(
+    "graph_class",
+    [AdjacencySetUndirectedMultiGraph, AdjacencyDirectedSetMultiGraph],
+)
+def test_events_journal_replay_multigraph(graph_class):
+    g = graph_class()
+    journal = MutationJournal(g)
+    g.add_link(1, 2, "link_1", "a", "Node1")
+    g.add_link(2, 3, "link_2", "b")
+    g.add_link(3, 3, "link_3", "c")
+    version = g.version
+    g.remove_link(1, 2, "link_1")
+    g.remove_node(3)
+
+    replica = graph_class()
+    journal.replay(replica)
+    assert replica.nodes == g.nodes
+    assert replica.links == g.links
+    assert [event.kind for event in journal.events_since(version)] == [
+        EventKind.REMOVE_LINK,
+        EventKind.REMOVE_LINK,
+        EventKind.REMOVE_LINK,
+        EventKind.REMOVE_NODE,
+    ]
+
+
+def test_events_journal_replay_since_and_truncate():
+    g: AdjacencySetUndirectedGraph[int, str] = AdjacencySetUndirectedGraph()
+    replica: AdjacencySetUndirectedGraph[int, str] = AdjacencySetUndirectedGraph()
+    journal = MutationJournal(g)
+    g.add_link(1, 2, "a")
+    journal.replay(replica)
+    version = journal.version
+    g.add_link(2, 3, "b")
+    g.remove_link(1, 2)
+    journal.replay(replica, since=version)
+    assert replica.links == g.links
+    assert replica.nodes == g.nodes
+
+    journal.truncate(version)
+    assert journal.events[0].version == version + 1
+    with pytest.raises(ValueError):
+        journal.events_since(version - 1)
+
+    journal.detach()
+    g.add_node(4)
+    assert journal.version == g.version - 1
@@ -0,0 +1,16 @@
+import subprocess
+import sys
+from pathlib import Path
+
+PYTHON_DIRECTORY = Path(__file__).resolve().parents[2]
+
+
+def test_graph_modules_do_not_import_graphviz():
+    code = (
+        "import sys\n"
+        "import graph.undirected_graph.adjacency_set\n"
+        "import graph.undirected_graph.multigraph\n"
+        "import graph.directed_graph.multigraph\n"
+        "assert 'graphviz' not in sys.modules\n"
+    )
+    subprocess.run([sys.executable, "-c", code], cwd=PYTHON_DIRECTORY, check=True)
@@ -0,0 +1,96 @@
+import pytest
+
+from ..directed_graph.multigraph import AdjacencyDirectedSetMultiGraph
+from ..indexes import LinkIndex, NodeIndex, SortedIndex, _GraphIndex
+from ..undirected_graph.adjacency_set import AdjacencySetUndirectedGraph
+from ..undirected_graph.multigraph import AdjacencySetUndirectedMultiGraph
+
+
+def test_node_index_hash():
+    g: AdjacencySetUndirectedGraph[int, dict] = AdjacencySetUndirectedGraph()
+    g.add_node(1, {"team": "core"})
+    index = NodeIndex(g, key=lambda value: value["team"])
+    g.add_node(2, {"team": "core"})
+    g.add_node(3, {"team": "web"})
+    assert index.find("core") == {1, 2}
+
+    g.add_node(1, {"team": "web"})
+    g.remove_node(3)
+    assert index.find("core") == {2}
+    assert index.find("web") == {1}
+    assert len(index) == 2
+    with pytest.raises(TypeError):
+        index.range(0, 1)
+
+    index.close()
+    g.add_node(4, {"team": "core"})
+    assert index.find("core") == {2}
+
+
+def test_node_index_sorted_range():
+    g: AdjacencyDirectedSetMultiGraph[int, int] = AdjacencyDirectedSetMultiGraph()
+    for node in range(10):
+        g.add_node(node, node * 10)
+    index = NodeIndex(g, ordered=True)
+    g.add_node(3, 95)
+    assert list(index.range(20, 60)) == [2, 4, 5]
+    assert list(index.range(80, 95, include_high=True)) == [8, 9, 3]
+    assert list(index.range(high=10)) == [0]
+    assert index.find(95) == {3}
+
+
+def test_link_index_undirected_graph():
+    g: AdjacencySetUndirectedGraph[int, str] = AdjacencySetUndirectedGraph()
+    g.add_link(1, 2, "red")
+    g.add_link(1, 1, "red")
+    index = LinkIndex(g)
+    g.add_link(2, 3, "blue")
+    assert index.find("red") == {(1, 2), (1, 1)}
+    g.add_link(2, 1, "blue")
+    assert index.find("red") == {(1, 1)}
+    assert index.find("blue") == {(1, 2), (2, 3)}
+    g.remove_node(2)
+    assert index.find("blue") == set()
+    assert len(index) == 1
+
+
+def test_link_index_undirected_multigraph():
+    g: AdjacencySetUndirectedMultiGraph[int, int] = AdjacencySetUndirectedMultiGraph()
+    g.add_link(1, 2, "link_1", 5)
+    g.add_link(1, 2, "link_2", 7)
+    index = LinkIndex(g, ordered=True)
+    g.add_link(3, 2, "link_3", 6)
+    assert list(index.range(5, 7)) == [(1, 2, "link_1"), (3, 2, "link_3")]
+    g.remove_link(2, 1, "link_1")
+    assert index.find(5) == set()
+    g.remove_links(2, 3)
+    assert list(index.range()) == [(1, 2, "link_2")]
+
+
+def test_link_index_directed_multigraph():
+    g: AdjacencyDirectedSetMultiGraph[int, str] = AdjacencyDirectedSetMultiGraph()
+    g.add_link(1, 2, "link_1", "a")
+    g.add_link(2, 1, "link_1", "a")
+    index = LinkIndex(g)
+    assert index.find("a") == {(1, 2, "link_1"), (2, 1, "link_1")}
+    g.remove_node(1)
+    assert index.find("a") == set()
+
+
+def test_graph_index_is_abstract():
+    with pytest.raises(TypeError):
+        _GraphIndex(AdjacencySetUndirectedGraph())
+
+
+def test_sorted_index_buckets():
+    index = SortedIndex()
+    for item in range(6):
+        index.add(item % 2, item)
+    index.remove(0, 2)
+    assert index.keys == [0, 1]
+    assert list(index.range()) == [0, 4, 1, 3, 5]
+    for item in (0, 4):
+        index.remove(0, item)
+    assert index.keys == [1]
+    assert index.find(0) == set()
+    assert index.find(1) == {1, 3, 5}
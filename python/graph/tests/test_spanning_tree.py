@@ -0,0 +1,92 @@
+import random
+
+import pytest
+
+from ..directed_graph.multigraph import AdjacencyDirectedSetMultiGraph
+from ..spanning_tree import UnionFind, kruskal, prim
+from ..undirected_graph.adjacency_set import AdjacencySetUndirectedGraph
+from ..undirected_graph.multigraph import AdjacencySetUndirectedMultiGraph
+
+
+def total(forest):
+    return sum(value for _, _, _, value in forest)
+
+
+def test_union_find():
+    sets = UnionFind(4)
+    assert sets.union(0, 1) is True
+    assert sets.union(1, 0) is False
+    assert sets.union(2, 3) is True
+    assert sets.find(0) != sets.find(2)
+    sets.union(1, 3)
+    assert len({sets.find(i) for i in range(4)}) == 1
+
+
+@pytest.mark.parametrize("algorithm", [kruskal, prim])
+def test_spanning_tree_simple_graph(algorithm):
+    g: AdjacencySetUndirectedGraph[str, int] = AdjacencySetUndirectedGraph()
+    g.add_link("a", "b", 4)
+    g.add_link("a", "c", 1)
+    g.add_link("b", "c", 2)
+    g.add_link("c", "d", 5)
+    g.add_link("b", "d", 3)
+    g.add_link("d", "d", 0)
+    forest = algorithm(g)
+    assert len(forest) == 3
+    assert total(forest) == 6
+    assert all(link_id is None for _, _, link_id, _ in forest)
+
+
+@pytest.mark.parametrize("algorithm", [kruskal, prim])
+def test_spanning_tree_multigraph_forest(algorithm):
+    g: AdjacencySetUndirectedMultiGraph[int, dict] = AdjacencySetUndirectedMultiGraph()
+    g.add_link(1, 2, "expensive", {"cost": 10})
+    g.add_link(1, 2, "cheap", {"cost": 1})
+    g.add_link(2, 3, "link_3", {"cost": 2})
+    g.add_link(3, 3, "self", {"cost": -5})
+    # Second component
+    g.add_link(4, 5, "link_5", {"cost": 7})
+    g.add_node(6)
+    forest = algorithm(g, cost=lambda value: value["cost"])
+    assert sorted(link_id for _, _, link_id, _ in forest) == [
+        "cheap",
+        "link_3",
+        "link_5",
+    ]
+
+
+@pytest.mark.parametrize("algorithm", [kruskal, prim])
+def test_spanning_tree_parallel_links_cost_once(algorithm):
+    g: AdjacencySetUndirectedMultiGraph[int, int] = AdjacencySetUndirectedMultiGraph()
+    # Equal costs and link ids of different types: the ids must not be compared.
+    g.add_link(1, 2, "a", 1)
+    g.add_link(1, 2, 2, 1)
+    g.add_link(1, 2, ("c",), 3)
+    calls = []
+
+    def cost(value):
+        calls.append(value)
+        return value
+
+    assert algorithm(g, cost=cost) == [(1, 2, "a", 1)]
+    # Each link is costed once from each of its nodes.
+    assert len(calls) == 6
+
+
+def test_spanning_tree_algorithms_agree():
+    rng = random.Random(0)
+    g: AdjacencySetUndirectedMultiGraph[int, int] = AdjacencySetUndirectedMultiGraph()
+    for link_id in range(500):
+        g.add_link(rng.randrange(120), rng.randrange(120), link_id, rng.randrange(1000))
+    kruskal_forest, prim_forest = kruskal(g), prim(g)
+    assert len(kruskal_forest) == len(prim_forest)
+    assert total(kruskal_forest) == total(prim_forest)
+
+
+def test_spanning_tree_directed_graph():
+    g: AdjacencyDirectedSetMultiGraph[int, int] = AdjacencyDirectedSetMultiGraph()
+    g.add_link(1, 2, "link_1", 1)
+    with pytest.raises(ValueError):
+        kruskal(g)
+    with pytest.raises(ValueError):
+        prim(g)
@@ -0,0 +1,43 @@
+import pytest
+
+from ..directed_graph.multigraph import AdjacencyDirectedSetMultiGraph
+from ..traversal import bfs, dfs, is_reachable, neighbours, shortest_path
+from ..undirected_graph.multigraph import AdjacencySetUndirectedMultiGraph
+
+
+def test_traversal_neighbours():
+    g: AdjacencySetUndirectedMultiGraph[int, str] = AdjacencySetUndirectedMultiGraph()
+    g.add_link(1, 2, "link_1")
+    g.add_link(1, 3, "link_2")
+    assert list(neighbours(g, 1)) == [2, 3]
+    assert list(neighbours(g, 3)) == [1]
+    with pytest.raises(ValueError):
+        neighbours(g, 4)
+
+
+def test_traversal_bfs_dfs():
+    g: AdjacencyDirectedSetMultiGraph[int, str] = AdjacencyDirectedSetMultiGraph()
+    g.add_link(1, 2, "a")
+    g.add_link(1, 3, "b")
+    g.add_link(2, 4, "c")
+    g.add_link(3, 4, "d")
+    g.add_link(4, 1, "e")
+    assert list(bfs(g, 1)) == [1, 2, 3, 4]
+    assert list(dfs(g, 1)) == [1, 2, 4, 3]
+    assert list(bfs(g, 4)) == [4, 1, 2, 3]
+
+
+def test_traversal_shortest_path():
+    g: AdjacencyDirectedSetMultiGraph[int, str] = AdjacencyDirectedSetMultiGraph()
+    g.add_link(1, 2, "a")
+    g.add_link(2, 3, "b")
+    g.add_link(1, 3, "c")
+    g.add_node(4)
+    assert shortest_path(g, 1, 3) == [1, 3]
+    assert shortest_path(g, 3, 1) is None
+    assert shortest_path(g, 1, 1) == [1]
+    path, reached = shortest_path(g, 1, 3, return_reached=True)
+    assert path == [1, 3] and set(reached) == {1, 2, 3}
+    assert shortest_path(g, 3, 1, return_reached=True) == (None, {3: None}.keys())
+    assert is_reachable(g, 1, 3) is True
+    assert is_reachable(g, 1, 4) is False
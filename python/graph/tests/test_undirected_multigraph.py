@@ -1,3 +1,5 @@
+import pytest
+
 from ..undirected_graph.multigraph import AdjacencySetUndirectedMultiGraph
 
 # Test the behavior of the graph
@@ -82,3 +84,54 @@ def test_undirected_multigraph_render(tmpdir, test_multigraph_viz_dot):
     with open(path, "r", encoding="utf-8") as f:
         content = f.read()
         assert content == test_multigraph_viz_dot
+
+
+def test_undirect_multigraph_link_id_lookup():
+    g: AdjacencySetUndirectedMultiGraph[int, str] = AdjacencySetUndirectedMultiGraph()
+    g.add_link(1, 2, "link_1", "LinkValue")
+    g.add_link(2, 1, "link_1", "NewValue")
+    g.add_link(2, 3, "link_2")
+    assert g.link_id_lookup == {"link_1": {(1, 2)}, "link_2": {(2, 3)}}
+    assert g.get_link("link_1") == (1, 2, "NewValue")
+
+    g.update_link_value("link_2", "Updated")
+    assert g.links[3][2] == {"link_2": "Updated"}
+
+    g.remove_link_by_id("link_1")
+    assert g.links == {
+        1: {},
+        2: {3: {"link_2": "Updated"}},
+        3: {2: {"link_2": "Updated"}},
+    }
+    with pytest.raises(ValueError):
+        g.get_link("link_1")
+
+    g.remove_node(3)
+    assert g.link_id_lookup == {}
+
+
+def test_undirect_multigraph_link_id_lookup_shared_id():
+    g: AdjacencySetUndirectedMultiGraph[int, str] = AdjacencySetUndirectedMultiGraph()
+    g.add_link(1, 2, "link_1")
+    g.add_link(1, 3, "link_1")
+    with pytest.raises(ValueError):
+        g.remove_link_by_id("link_1")
+    g.remove_links(3, 1)
+    assert g.get_link("link_1") == (1, 2, None)
+
+
+def test_undirect_multigraph_shared_link_storage():
+    g: AdjacencySetUndirectedMultiGraph[int, str] = AdjacencySetUndirectedMultiGraph()
+    g.add_link(1, 2, "link_1", "LinkValue")
+    g.add_link(2, 1, "link_2", "AnotherLink")
+    assert g.links[1][2] is g.links[2][1]
+    assert g.links[2][1] == {"link_1": "LinkValue", "link_2": "AnotherLink"}
+
+    g.remove_link(2, 1, "link_1")
+    assert g.links == {
+        1: {2: {"link_2": "AnotherLink"}},
+        2: {1: {"link_2": "AnotherLink"}},
+    }
+    g.remove_link(1, 2, "link_2")
+    assert g.links == {1: {}, 2: {}}
+    assert g.link_id_lookup == {}
@@ -0,0 +1,142 @@
+from collections import deque
+from typing import (
+    Callable,
+    Collection,
+    Hashable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
+
+NodeId = Hashable
+
+# The traversals only rely on the `nodes` and `links` attributes shared by every graph class:
+# `links[node]` is keyed by the neighbours of the node (successors for a directed graph).
+# `bfs` and `dfs` can be resumed after a mutation (see `AsyncGraph`): a queued node removed since
+# then has no links.
+
+# Called with the traversal name and the number of nodes it visited when a traversal ends.
+# Set by `profiling.instrumentation`, None otherwise so the traversals pay a single check.
+observer: Optional[Callable[[str, int], None]] = None
+
+
+def neighbours(graph, node: NodeId) -> Iterator[NodeId]:
+    """Iterate over the nodes linked to the given node (successors for a directed graph).
+
+    Args:
+        graph: Any graph of the package.
+        node (NodeId): The node to inspect
+
+    Raises:
+        ValueError: When the node is not in the graph
+    """
+    if node not in graph.nodes:
+        raise ValueError("The given node is not in the graph")
+    return iter(graph.links[node])
+
+
+def bfs(graph, start: NodeId) -> Iterator[NodeId]:
+    """Breadth first traversal from the start node, each reachable node is yielded once.
+
+    Raises:
+        ValueError: When the start node is not in the graph
+    """
+    if start not in graph.nodes:
+        raise ValueError("The given node is not in the graph")
+    links = graph.links
+    visited = {start}
+    queue = deque([start])
+    try:
+        while queue:
+            node = queue.popleft()
+            yield node
+            for neighbour in links.get(node, ()):
+                if neighbour not in visited:
+                    visited.add(neighbour)
+                    queue.append(neighbour)
+    finally:
+        if observer is not None:
+            observer("bfs", len(visited) - len(queue))
+
+
+def dfs(graph, start: NodeId) -> Iterator[NodeId]:
+    """Depth first traversal (preorder) from the start node, each reachable node is yielded once.
+
+    The traversal is iterative so deep graphs do not hit the recursion limit.
+
+    Raises:
+        ValueError: When the start node is not in the graph
+    """
+    if start not in graph.nodes:
+        raise ValueError("The given node is not in the graph")
+    links = graph.links
+    visited = set()
+    stack = [start]
+    try:
+        while stack:
+            node = stack.pop()
+            if node in visited:
+                continue
+            visited.add(node)
+            yield node
+            # Reversed so neighbours are visited in insertion order.
+            stack.extend(
+                neighbour
+                for neighbour in reversed(links.get(node, ()))
+                if neighbour not in visited
+            )
+    finally:
+        if observer is not None:
+            observer("dfs", len(visited))
+
+
+def shortest_path(
+    graph, source: NodeId, target: NodeId, return_reached: bool = False
+) -> Union[Optional[List[NodeId]], Tuple[Optional[List[NodeId]], Collection[NodeId]]]:
+    """Shortest path (in number of links) from source to target, None if target is not reachable.
+
+    Args:
+        return_reached (bool, optional): Also return the nodes reached by the search, as
+            `(path, reached)`: the result only depends on the links of these nodes. Defaults to False.
+
+    Raises:
+        ValueError: When the source or the target is not in the graph
+    """
+    if source not in graph.nodes:
+        raise ValueError("The source node is not in the graph")
+    if target not in graph.nodes:
+        raise ValueError("The target node is not in the graph")
+    links = graph.links
+    parents = {source: None}
+    queue = deque([source])
+    try:
+        while queue:
+            node = queue.popleft()
+            if node == target:
+                path = []
+                while node is not None:
+                    path.append(node)
+                    node = parents[node]
+                path.reverse()
+                return (path, parents.keys()) if return_reached else path
+            for neighbour in links[node]:
+                if neighbour not in parents:
+                    parents[neighbour] = node
+                    queue.append(neighbour)
+        return (None, parents.keys()) if return_reached else None
+    finally:
+        if observer is not None:
+            observer("shortest_path", len(parents) - len(queue))
+
+
+def is_reachable(graph, source: NodeId, target: NodeId) -> bool:
+    """Return True when a path exists from source to target.
+
+    Raises:
+        ValueError: When the source or the target is not in the graph
+    """
+    if target not in graph.nodes:
+        raise ValueError("The target node is not in the graph")
+    return any(node == target for node in bfs(graph, source))
@@ -1,11 +1,13 @@
 from typing import TypeVar, Generic, Dict, Hashable
-from graphviz import Graph
+
+from ..diff import GraphDiff, diff_graphs, patch_graph
+from ..events import EventKind, ObservableGraph
 
 NV = TypeVar("NV")
 EV = TypeVar("EV")
 
 
-class AdjacencySetUndirectedGraph(Generic[NV, EV]):
+class AdjacencySetUndirectedGraph(ObservableGraph, Generic[NV, EV]):
     """Graph implementation using hashable object and adjacency dict."""
 
     def __init__(self) -> None:
@@ -28,10 +30,15 @@ class AdjacencySetUndirectedGraph(Generic[NV, EV]):
         if node is None:
             raise ValueError("None value cannot be used as a Node")
 
-        if node not in self.nodes:
+        replaced = node in self.nodes
+        previous = self.nodes.get(node)
+        if not replaced:
             # We initialize the entry in the adjency dict for this node.
             self.links[node] = {}
         self.nodes[node] = value
+        self._notify(
+            EventKind.ADD_NODE, node, value=value, previous=previous, replaced=replaced
+        )
 
     def remove_node(self, node: Hashable):
         """Remove a node from the graph. This will delete all links associated to it.
@@ -44,13 +51,13 @@ class AdjacencySetUndirectedGraph(Generic[NV, EV]):
         """
         if node not in self.nodes:
             raise ValueError("The given node is not in the graph")
+        # Delete all links which contains this node (copied as a self link is removed while iterating)
+        for connected_node in list(self.links[node]):
+            self.remove_link(node, connected_node)
         # Delete the node
-        del self.nodes[node]
-        # Delete all links which contains this node
-        connected_nodes = self.links[node]
-        for connected_node in connected_nodes:
-            del self.links[connected_node][node]
+        value = self.nodes.pop(node)
         del self.links[node]
+        self._notify(EventKind.REMOVE_NODE, node, value=value)
 
     def add_link(
         self,
@@ -76,9 +83,19 @@ class AdjacencySetUndirectedGraph(Generic[NV, EV]):
         if node2 not in self.nodes:
             self.add_node(node2, node2_value)
 
+        replaced = node2 in self.links[node1]
+        previous = self.links[node1].get(node2)
         # Add the link in the adjency dict for both node.
         self.links[node1][node2] = link_value
         self.links[node2][node1] = link_value
+        self._notify(
+            EventKind.ADD_LINK,
+            node1,
+            node2,
+            value=link_value,
+            previous=previous,
+            replaced=replaced,
+        )
 
     def remove_link(self, node1: Hashable, node2: Hashable):
         """Remove the link of the graph. Each node must exist in the graph.
@@ -95,11 +112,34 @@ class AdjacencySetUndirectedGraph(Generic[NV, EV]):
             raise ValueError("First node of the given link is not in the graph")
         if node2 not in self.nodes:
             raise ValueError("Second node of the given link is not in the graph")
-        del self.links[node1][node2]
+        value = self.links[node1].pop(node2)
         if (
             node1 != node2
         ):  # A link can connect the node to itself, but we can't delete it twice.
             del self.links[node2][node1]
+        self._notify(EventKind.REMOVE_LINK, node1, node2, value=value)
+
+    def diff(self, other: "AdjacencySetUndirectedGraph") -> GraphDiff:
+        """Compute the changes turning this graph into the other one (see `graph.diff`).
+
+        Args:
+            other (AdjacencySetUndirectedGraph): The new version of the graph.
+
+        Returns:
+            GraphDiff: Added, removed and changed nodes and links, to give to `apply_patch`.
+
+        Raises:
+            ValueError: When the other graph is not of the same class
+        """
+        return diff_graphs(self, other)
+
+    def apply_patch(self, diff: GraphDiff) -> None:
+        """Update the graph in place with the changes computed by `diff`.
+
+        Args:
+            diff (GraphDiff): Changes from a graph in the same state as this one.
+        """
+        patch_graph(self, diff)
 
     def render(self, filename: str, graph_name: str, output_format: str = "svg"):
         """Render a graph to the fileformat yout want, with the given filename
@@ -109,6 +149,8 @@ class AdjacencySetUndirectedGraph(Generic[NV, EV]):
             graph_name (str): The name of the graph to be rendered
             format (str, optional): File format of the graph. Defaults to "svg". Supported format are available [here](https://graphviz.org/docs/outputs/)
         """
+        from graphviz import Graph
+
         dot = Graph(graph_name, format=output_format)
 
         for node, node_value in self.nodes.items():
@@ -1,5 +1,8 @@
-from typing import TypeVar, Generic, Dict, Hashable
-from graphviz import Graph
+from typing import TypeVar, Generic, Dict, Hashable, Set, Tuple
+
+from ..diff import GraphDiff, diff_graphs, patch_graph
+from ..events import EventKind, ObservableGraph
+from ..link_ids import LinkIdLookup
 
 NV = TypeVar("NV")
 EV = TypeVar("EV")
@@ -8,13 +11,21 @@ NodeId = Hashable
 LinkId = Hashable
 
 
-class AdjacencySetUndirectedMultiGraph(Generic[NV, EV]):
-    """Graph implementation using hashable object and adjacency dict."""
+class AdjacencySetUndirectedMultiGraph(LinkIdLookup, ObservableGraph, Generic[NV, EV]):
+    """Graph implementation using hashable object and adjacency dict.
+
+    `links[node1][node2]` and `links[node2][node1]` are the same dict object: the id and value of a
+    link are stored once, while the links stay reachable in O(1) from both nodes.
+    """
+
+    is_multigraph = True
 
     def __init__(self) -> None:
         super().__init__()
         self.nodes: Dict[NodeId, NV] = dict()
         self.links: Dict[NodeId, Dict[NodeId, Dict[LinkId, EV]]] = dict()
+        # Global lookup of the links by id. A link id can be reused between other nodes.
+        self.link_id_lookup: Dict[LinkId, Set[Tuple[NodeId, NodeId]]] = dict()
 
     def add_node(self, node: NodeId, value: NV = None) -> None:
         """Add node to the graph. If the node already exist update the node value.
@@ -31,10 +42,15 @@ class AdjacencySetUndirectedMultiGraph(Generic[NV, EV]):
         if node is None:
             raise ValueError("None value cannot be used as a Node")
 
-        if node not in self.nodes:
+        replaced = node in self.nodes
+        previous = self.nodes.get(node)
+        if not replaced:
             # We initialize the entry in the adjency dict for this node.
             self.links[node] = {}
         self.nodes[node] = value
+        self._notify(
+            EventKind.ADD_NODE, node, value=value, previous=previous, replaced=replaced
+        )
 
     def remove_node(self, node: NodeId):
         """Remove a node from the graph. This will delete all links associated to it.
@@ -47,13 +63,13 @@ class AdjacencySetUndirectedMultiGraph(Generic[NV, EV]):
         """
         if node not in self.nodes:
             raise ValueError("The given node is not in the graph")
+        # Delete all links which contains this node (copied as a self link is removed while iterating)
+        for connected_node in list(self.links[node]):
+            self.remove_links(node, connected_node)
         # Delete the node
-        del self.nodes[node]
-        # Delete all links which contains this node
-        connected_nodes = self.links[node]
-        for connected_node in connected_nodes:
-            del self.links[connected_node][node]
+        value = self.nodes.pop(node)
         del self.links[node]
+        self._notify(EventKind.REMOVE_NODE, node, value=value)
 
     def add_link(
         self,
@@ -82,11 +98,26 @@ class AdjacencySetUndirectedMultiGraph(Generic[NV, EV]):
             self.add_node(node2, node2_value)
 
         # Add the link in the adjency dict for both node. Must ensure the dict indirection exist before hands.
+        # Both nodes share the same dict of links, so each link is stored once.
         if node2 not in self.links[node1]:
-            self.links[node1][node2] = {}
-            self.links[node2][node1] = {}
-        self.links[node1][node2][link_id] = link_value
-        self.links[node2][node1][link_id] = link_value
+            shared_links = {}
+            self.links[node1][node2] = shared_links
+            self.links[node2][node1] = shared_links
+        links = self.links[node1][node2]
+        replaced = link_id in links
+        previous = links.get(link_id)
+        links[link_id] = link_value
+        if not replaced:
+            self._index_link(node1, node2, link_id)
+        self._notify(
+            EventKind.ADD_LINK,
+            node1,
+            node2,
+            link_id,
+            link_value,
+            previous=previous,
+            replaced=replaced,
+        )
 
     def remove_links(self, node1: NodeId, node2: NodeId):
         """Remove all links of the graph between node1 and node2. Each node must exist in the graph.
@@ -103,11 +134,14 @@ class AdjacencySetUndirectedMultiGraph(Generic[NV, EV]):
             raise ValueError("First node of the given link is not in the graph")
         if node2 not in self.nodes:
             raise ValueError("Second node of the given link is not in the graph")
-        del self.links[node1][node2]
+        links = self.links[node1].pop(node2)
         if (
             node1 != node2
         ):  # A link can connect the node to itself, but we can't delete it twice.
             del self.links[node2][node1]
+        for link_id, link_value in links.items():
+            self._unindex_link(node1, node2, link_id)
+            self._notify(EventKind.REMOVE_LINK, node1, node2, link_id, link_value)
 
     def remove_link(self, node1: NodeId, node2: NodeId, link_id: LinkId):
         """Remove all links of the graph between node1 and node2. Each node must exist in the graph.
@@ -124,16 +158,45 @@ class AdjacencySetUndirectedMultiGraph(Generic[NV, EV]):
             raise ValueError("First node of the given link is not in the graph")
         if node2 not in self.nodes:
             raise ValueError("Second node of the given link is not in the graph")
-        del self.links[node1][node2][link_id]
+        # The dict of links is shared by both nodes, the link is deleted once.
+        link_value = self.links[node1][node2].pop(link_id)
         # Remove key if there is no more item in the dictionnary
         if len(self.links[node1][node2]) == 0:
             del self.links[node1][node2]
-        if (
-            node1 != node2
-        ):  # A link can connect the node to itself, but we can't delete it twice.
-            del self.links[node2][node1][link_id]
-            if len(self.links[node2][node1]) == 0:
+            if (
+                node1 != node2
+            ):  # A link can connect the node to itself, but we can't delete it twice.
                 del self.links[node2][node1]
+        self._unindex_link(node1, node2, link_id)
+        self._notify(EventKind.REMOVE_LINK, node1, node2, link_id, link_value)
+
+    def _unindex_link(self, node1: NodeId, node2: NodeId, link_id: LinkId):
+        # The link may have been indexed with the other orientation.
+        pairs = self.link_id_lookup[link_id]
+        pairs.discard((node2, node1))
+        super()._unindex_link(node1, node2, link_id)
+
+    def diff(self, other: "AdjacencySetUndirectedMultiGraph") -> GraphDiff:
+        """Compute the changes turning this graph into the other one (see `graph.diff`).
+
+        Args:
+            other (AdjacencySetUndirectedMultiGraph): The new version of the graph.
+
+        Returns:
+            GraphDiff: Added, removed and changed nodes and links, to give to `apply_patch`.
+
+        Raises:
+            ValueError: When the other graph is not of the same class
+        """
+        return diff_graphs(self, other)
+
+    def apply_patch(self, diff: GraphDiff) -> None:
+        """Update the graph in place with the changes computed by `diff`.
+
+        Args:
+            diff (GraphDiff): Changes from a graph in the same state as this one.
+        """
+        patch_graph(self, diff)
 
     def render(self, filename: str, graph_name: str, output_format: str = "svg"):
         """Render a graph to the fileformat yout want, with the given filename
@@ -143,6 +206,8 @@ class AdjacencySetUndirectedMultiGraph(Generic[NV, EV]):
             graph_name (str): The name of the graph to be rendered
             format (str, optional): File format of the graph. Defaults to "svg". Supported format are available [here](https://graphviz.org/docs/outputs/)
         """
+        from graphviz import Graph
+
         dot = Graph(graph_name, format=output_format)
 
         for node, node_value in self.nodes.items():
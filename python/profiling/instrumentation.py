@@ -0,0 +1,321 @@
+"""Optional hot path instrumentation of the graph and tree classes.
+
+Instrumentation is disabled by default and then costs nothing: `enable()` replaces the methods of
+the instrumented classes by counting and timing wrappers, and `disable()` puts the original methods
+back. While enabled, the binary search tree searches and insertions also report the depth reached
+and the number of key comparisons, computed from the node they return, and the graph traversals
+report the number of nodes they visited.
+
+Example:
+    from profiling import instrumentation
+
+    instrumentation.enable()
+    ...  # run the workload
+    metrics = instrumentation.snapshot()
+    instrumentation.disable()
+
+Counters are updated without lock: under heavy multithreading a few increments can be lost.
+"""
+import functools
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Tuple
+
+GRAPH_METHODS = (
+    "add_node",
+    "remove_node",
+    "add_link",
+    "remove_link",
+    "remove_links",
+    "get_link",
+    "successors",
+    "predecessors",
+    "out_edges",
+    "in_edges",
+    "remove_link_by_id",
+    "update_link_value",
+    "diff",
+    "apply_patch",
+    "render",
+)
+
+
+class Histogram:
+    """Histogram with power of two buckets, each bucket counts the values up to its bound."""
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.total = 0
+        self.min = None
+        self.max = None
+        self.buckets: Dict[int, int] = {}
+
+    def record(self, value: int) -> None:
+        self.count += 1
+        self.total += value
+        if self.min is None or value < self.min:
+            self.min = value
+        if self.max is None or value > self.max:
+            self.max = value
+        bound = 1 << max(value - 1, 0).bit_length()
+        self.buckets[bound] = self.buckets.get(bound, 0) + 1
+
+    def to_dict(self) -> dict:
+        return {
+            "count": self.count,
+            "total": self.total,
+            "mean": self.total / self.count if self.count else None,
+            "min": self.min,
+            "max": self.max,
+            "buckets": dict(sorted(self.buckets.items())),
+        }
+
+
+class Metrics:
+    def __init__(self) -> None:
+        self.counters: Dict[str, int] = {}
+        self.histograms: Dict[str, Histogram] = {}
+
+    def increment(self, name: str, amount: int = 1) -> None:
+        self.counters[name] = self.counters.get(name, 0) + amount
+
+    def record(self, name: str, value: int) -> None:
+        if name not in self.histograms:
+            self.histograms[name] = Histogram()
+        self.histograms[name].record(value)
+
+    def snapshot(self) -> dict:
+        return {
+            "counters": dict(self.counters),
+            "histograms": {
+                name: histogram.to_dict() for name, histogram in self.histograms.items()
+            },
+        }
+
+
+metrics = Metrics()
+# Original attributes replaced while enabled, as (owner, name, original) tuples.
+_patches: List[Tuple[Any, str, Any]] = []
+
+
+def _timed(name: str, method: Callable) -> Callable:
+    """Wrap a method to count its calls and record its latency in nanoseconds."""
+
+    @functools.wraps(method)
+    def timed_method(*args, **kwargs):
+        start = time.perf_counter_ns()
+        try:
+            return method(*args, **kwargs)
+        finally:
+            metrics.record(f"{name}.latency_ns", time.perf_counter_ns() - start)
+            metrics.increment(f"{name}.calls")
+
+    return timed_method
+
+
+# Original of an inherited attribute: the patch is deleted to restore it.
+_INHERITED = object()
+
+
+def _patch(owner: Any, name: str, replacement: Any) -> None:
+    _patches.append((owner, name, owner.__dict__.get(name, _INHERITED)))
+    setattr(owner, name, replacement)
+
+
+# The binary search tree methods are recursive through the class attributes: only the outermost
+# call of each thread is measured, the nested calls go straight to the original method.
+_local = threading.local()
+
+
+def _outermost(
+    name: str, method: Callable, record: Callable, prepare: Callable = None
+) -> Callable:
+    """Wrap a method to time its outermost calls, then call `record(self, args, result, state)`.
+
+    `state` is the result of `prepare(self, args)` called before the timed call, None by default.
+    """
+    timed = _timed(name, method)
+
+    @functools.wraps(method)
+    def instrumented_method(self, *args, **kwargs):
+        if getattr(_local, "active", False):
+            return method(self, *args, **kwargs)
+        state = prepare(self, args) if prepare is not None else None
+        _local.active = True
+        try:
+            result = timed(self, *args, **kwargs)
+        finally:
+            _local.active = False
+        record(self, args, result, state)
+        return result
+
+    return instrumented_method
+
+
+def _depth(node, root) -> int:
+    """Number of nodes from root to node, following the parent chain."""
+    depth = 1
+    while node is not root:
+        node = node.parent
+        depth += 1
+    return depth
+
+
+def _miss_depth(root, key) -> int:
+    """Number of nodes visited by an unsuccessful search, which returns no node to start from."""
+    node, depth = root, 0
+    while node is not None:
+        depth += 1
+        node = node.left_child if key < node.key else node.right_child
+    return depth
+
+
+def _contains(root, args) -> bool:
+    node, key = root, args[0]
+    while node is not None and key != node.key:
+        node = node.left_child if key < node.key else node.right_child
+    return node is not None
+
+
+# Each visited node costs an equality and an ordering comparison, the node holding the key only
+# the equality one.
+
+
+def _record_search(root, args, node, state) -> None:
+    if node is None:
+        depth = _miss_depth(root, args[0])
+        comparisons = 2 * depth
+    else:
+        depth = _depth(node, root)
+        comparisons = 2 * depth - 1
+    metrics.record("BinarySearchNode.search.depth", depth)
+    metrics.increment("BinarySearchNode.search.comparisons", comparisons)
+
+
+def _record_insert(root, args, node, existed) -> None:
+    depth = _depth(node, root)
+    # A new node costs no comparison, an existing one its equality comparison.
+    comparisons = 2 * depth - 1 if existed else 2 * (depth - 1)
+    metrics.record("BinarySearchNode.insert.depth", depth)
+    metrics.increment("BinarySearchNode.insert.comparisons", comparisons)
+
+
+def _counted_iter(method: Callable) -> Callable:
+    """Wrap the in order walk to record the number of nodes yielded by its outermost calls."""
+
+    @functools.wraps(method)
+    def counted_iter(self):
+        if getattr(_local, "active", False):
+            return method(self)
+        return _count_nodes(method(self))
+
+    return counted_iter
+
+
+def _count_nodes(nodes: Iterator) -> Iterator:
+    visited = 0
+    try:
+        while True:
+            # The nested walks run while the next node is computed.
+            _local.active = True
+            try:
+                node = next(nodes)
+            except StopIteration:
+                return
+            finally:
+                _local.active = False
+            visited += 1
+            yield node
+    finally:
+        metrics.record("BinarySearchNode.iter.nodes_visited", visited)
+
+
+def _on_traversal(name: str, visited: int) -> None:
+    metrics.increment(f"traversal.{name}.calls")
+    metrics.record(f"traversal.{name}.nodes_visited", visited)
+
+
+def _instrumented_classes():
+    from graph.directed_graph.multigraph import AdjacencyDirectedSetMultiGraph
+    from graph.undirected_graph.adjacency_set import AdjacencySetUndirectedGraph
+    from graph.undirected_graph.multigraph import AdjacencySetUndirectedMultiGraph
+    from tree.binary.binary_search_tree import BinarySearchNode
+
+    graphs = (
+        AdjacencySetUndirectedGraph,
+        AdjacencySetUndirectedMultiGraph,
+        AdjacencyDirectedSetMultiGraph,
+    )
+    return graphs, BinarySearchNode
+
+
+def is_enabled() -> bool:
+    return bool(_patches)
+
+
+def enable() -> None:
+    """Start instrumenting the graph and tree classes. Does nothing if already enabled."""
+    if is_enabled():
+        return
+    from graph import traversal
+
+    graphs, bst = _instrumented_classes()
+    for graph_class in graphs:
+        for name in GRAPH_METHODS:
+            # Inherited methods are patched on each class, to be counted per class.
+            method = getattr(graph_class, name, None)
+            if method is not None:
+                _patch(
+                    graph_class, name, _timed(f"{graph_class.__name__}.{name}", method)
+                )
+    for name, record, prepare in (
+        ("search", _record_search, None),
+        ("insert", _record_insert, _contains),
+        ("delete", lambda *_: None, None),
+    ):
+        method = bst.__dict__[name]
+        _patch(
+            bst, name, _outermost(f"BinarySearchNode.{name}", method, record, prepare)
+        )
+    _patch(bst, "__iter__", _counted_iter(bst.__dict__["__iter__"]))
+    _patch(traversal, "observer", _on_traversal)
+
+
+def disable() -> None:
+    """Restore the original methods. Collected metrics are kept until `reset()`."""
+    while _patches:
+        owner, name, original = _patches.pop()
+        if original is _INHERITED:
+            delattr(owner, name)
+        else:
+            setattr(owner, name, original)
+
+
+def reset() -> None:
+    """Forget the collected metrics."""
+    metrics.counters.clear()
+    metrics.histograms.clear()
+
+
+def snapshot() -> Dict[str, Any]:
+    """Return the collected metrics as a plain dict.
+
+    `counters` maps names such as `AdjacencySetUndirectedGraph.add_link.calls` or
+    `BinarySearchNode.search.comparisons` to their count. `histograms` maps names such as
+    `AdjacencySetUndirectedGraph.add_link.latency_ns`, `BinarySearchNode.search.depth` or
+    `traversal.bfs.nodes_visited` to their count, total, mean, min, max and buckets.
+    """
+    return metrics.snapshot()
+
+
+@contextmanager
+def enabled() -> Iterator[None]:
+    """Context manager instrumenting the classes inside the block."""
+    was_enabled = is_enabled()
+    enable()
+    try:
+        yield
+    finally:
+        if not was_enabled:
+            disable()
@@ -0,0 +1,236 @@
+"""Memory footprint reports of the graphs and trees.
+
+The reports walk the structures and sum `sys.getsizeof` of every container, key and value, each
+object being counted once even if it is shared (node ids used as keys in several dicts, small ints,
+dicts shared between two adjacency entries...). The figures are estimates of the memory owned by
+the structure: objects also referenced elsewhere are still counted.
+
+Example:
+    from profiling.memory import graph_memory_usage
+
+    print(graph_memory_usage(graph, sample=1000))
+"""
+import functools
+import random
+import sys
+import tracemalloc
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, Optional, Set
+
+# Containers walked recursively when measuring values.
+_CONTAINERS = (list, tuple, set, frozenset, dict)
+
+
+@dataclass
+class MemoryReport:
+    """Bytes used by each component of a structure.
+
+    Attributes:
+        components (Dict[str, int]): Bytes by component name.
+        estimated (bool): True when the per node components were extrapolated from a sample.
+        sample_size (int): Number of sampled nodes when estimated.
+    """
+
+    components: Dict[str, int] = field(default_factory=dict)
+    estimated: bool = False
+    sample_size: Optional[int] = None
+
+    @property
+    def total(self) -> int:
+        return sum(self.components.values())
+
+    def __str__(self) -> str:
+        lines = [f"{name:<16}{size:>14,} B" for name, size in self.components.items()]
+        suffix = f" (estimated from {self.sample_size} nodes)" if self.estimated else ""
+        lines.append(f"{'total':<16}{self.total:>14,} B{suffix}")
+        return "\n".join(lines)
+
+
+class _Counter:
+    """Accumulate sizes, counting each object once."""
+
+    def __init__(self) -> None:
+        self.seen: Set[int] = set()
+
+    def shallow(self, obj: Any) -> int:
+        if id(obj) in self.seen:
+            return 0
+        self.seen.add(id(obj))
+        return sys.getsizeof(obj)
+
+    def deep(self, obj: Any) -> int:
+        size = 0
+        stack = [obj]
+        while stack:
+            current = stack.pop()
+            if id(current) in self.seen:
+                continue
+            self.seen.add(id(current))
+            size += sys.getsizeof(current)
+            if isinstance(current, dict):
+                stack.extend(current.keys())
+                stack.extend(current.values())
+            elif isinstance(current, _CONTAINERS):
+                stack.extend(current)
+        return size
+
+
+@functools.lru_cache(maxsize=None)
+def instance_size(cls: type) -> int:
+    """Memory of an instance with its attributes storage, measured once per class.
+
+    `sys.getsizeof` misses the attribute storage of instances, and reading `__dict__` to measure
+    it would allocate a dict. The class must be instantiable without arguments.
+    """
+    count = 64
+    tracing = tracemalloc.is_tracing()
+    if not tracing:
+        tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        instances = [cls() for _ in range(count)]
+        after = tracemalloc.get_traced_memory()[0]
+    finally:
+        if not tracing:
+            tracemalloc.stop()
+    # Remove the list holding the instances.
+    return max(
+        (after - before - sys.getsizeof(instances)) // count,
+        sys.getsizeof(instances[0]),
+    )
+
+
+def _sample(nodes: Iterable, size: int, seed: int) -> list:
+    nodes = list(nodes)
+    if size >= len(nodes):
+        return nodes
+    return random.Random(seed).sample(nodes, size)
+
+
+def graph_memory_usage(
+    graph, sample: Optional[int] = None, seed: int = 0
+) -> MemoryReport:
+    """Memory used by a graph, by component.
+
+    Components:
+        nodes: The `nodes` dict.
+        adjacency: The `links` dict and the per node dicts of neighbours.
+        link_dicts: The per pair dicts of link ids (multigraphs).
+        reverse_index: `reverse_link_lookup` (directed multigraph).
+        link_id_index: `link_id_lookup` (multigraphs).
+        keys: Node ids and link ids.
+        values: Node values and link values, measured deeply.
+
+    Args:
+        graph: Any graph of the package.
+        sample (int, optional): Estimate the per node components from this number of randomly
+            sampled nodes instead of walking every node. Defaults to None (exact).
+        seed (int, optional): Seed of the sampling. Defaults to 0.
+    """
+    counter = _Counter()
+    components = {
+        name: 0
+        for name in (
+            "nodes",
+            "adjacency",
+            "link_dicts",
+            "reverse_index",
+            "link_id_index",
+            "keys",
+            "values",
+        )
+    }
+    components["nodes"] += counter.shallow(graph.nodes)
+    components["adjacency"] += counter.shallow(graph.links)
+    reverse = getattr(graph, "reverse_link_lookup", None)
+    if reverse is not None:
+        components["reverse_index"] += counter.shallow(reverse)
+
+    nodes = graph.nodes
+    estimated = sample is not None and sample < len(nodes)
+    walked = _sample(nodes, sample, seed) if estimated else nodes
+    per_node = dict.fromkeys(components, 0)
+    shared = not graph.is_directed
+    for node in walked:
+        per_node["keys"] += counter.deep(node)
+        per_node["values"] += counter.deep(nodes[node])
+        neighbours = graph.links[node]
+        per_node["adjacency"] += counter.shallow(neighbours)
+        for neighbour, links in neighbours.items():
+            # When sampling an undirected graph, the links are reached from both of their nodes.
+            weight = 0.5 if estimated and shared and neighbour != node else 1
+            if not graph.is_multigraph:
+                per_node["values"] += weight * counter.deep(links)
+                continue
+            per_node["link_dicts"] += weight * counter.shallow(links)
+            for link_id, link_value in links.items():
+                per_node["keys"] += weight * counter.deep(link_id)
+                per_node["values"] += weight * counter.deep(link_value)
+        if reverse is not None:
+            # The per pair dicts are shared with the adjacency, only the per node dict is owned.
+            per_node["reverse_index"] += counter.shallow(reverse[node])
+
+    scale = len(nodes) / len(walked) if estimated else 1
+    for name, size in per_node.items():
+        components[name] += int(size * scale)
+
+    link_id_lookup = getattr(graph, "link_id_lookup", None)
+    if link_id_lookup is not None:
+        # Keys and pairs share the already counted node and link ids.
+        components["link_id_index"] += counter.shallow(link_id_lookup)
+        link_ids = list(link_id_lookup)
+        sampled = _sample(link_ids, sample, seed) if estimated else link_ids
+        size = 0
+        for link_id in sampled:
+            size += counter.shallow(link_id_lookup[link_id])
+            for pair in link_id_lookup[link_id]:
+                size += counter.shallow(pair)
+        components["link_id_index"] += int(
+            size * (len(link_ids) / len(sampled) if sampled else 0)
+        )
+
+    return MemoryReport(components, estimated, len(walked) if estimated else None)
+
+
+def binary_tree_memory_usage(root) -> MemoryReport:
+    """Memory used by a binary search tree from its root, by component.
+
+    Components:
+        nodes: The node objects.
+        keys: The node keys.
+        values: The node values, measured deeply.
+    """
+    counter = _Counter()
+    components = {"nodes": 0, "keys": 0, "values": 0}
+    node_size = instance_size(type(root))
+    stack = [root]
+    while stack:
+        node = stack.pop()
+        components["nodes"] += node_size
+        components["keys"] += counter.deep(node.key)
+        components["values"] += counter.deep(node.value)
+        for child in (node.left_child, node.right_child):
+            if child is not None:
+                stack.append(child)
+    return MemoryReport(components)
+
+
+def tree_memory_usage(root) -> MemoryReport:
+    """Memory used by a generic tree from its root, by component.
+
+    Components:
+        nodes: The node objects.
+        children: The lists of children.
+        values: The node values, measured deeply.
+    """
+    counter = _Counter()
+    components = {"nodes": 0, "children": 0, "values": 0}
+    node_size = instance_size(type(root))
+    stack = [root]
+    while stack:
+        node = stack.pop()
+        components["nodes"] += node_size
+        components["children"] += counter.shallow(node.children)
+        components["values"] += counter.deep(node.value)
+        stack.extend(node.children)
+    return MemoryReport(components)
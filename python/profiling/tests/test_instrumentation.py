@@ -0,0 +1,98 @@
+from graph import traversal
+from graph.undirected_graph.multigraph import AdjacencySetUndirectedMultiGraph
+from tree.binary.binary_search_tree import BinarySearchNode
+
+from .. import instrumentation
+
+
+def test_instrumentation_disabled_by_default():
+    original_add_link = AdjacencySetUndirectedMultiGraph.add_link
+    original_search = BinarySearchNode.search
+    with instrumentation.enabled():
+        assert AdjacencySetUndirectedMultiGraph.add_link is not original_add_link
+        assert instrumentation.is_enabled() is True
+    assert AdjacencySetUndirectedMultiGraph.add_link is original_add_link
+    assert BinarySearchNode.search is original_search
+    assert traversal.observer is None
+
+
+def test_instrumentation_graph_counters():
+    instrumentation.reset()
+    g: AdjacencySetUndirectedMultiGraph[int, str] = AdjacencySetUndirectedMultiGraph()
+    with instrumentation.enabled():
+        g.add_link(1, 2, "link_1")
+        g.add_link(2, 3, "link_2")
+        g.remove_link(1, 2, "link_1")
+        assert list(traversal.bfs(g, 1)) == [1]
+        assert list(traversal.bfs(g, 2)) == [2, 3]
+    g.add_link(3, 4, "link_3")
+
+    metrics = instrumentation.snapshot()
+    counters = metrics["counters"]
+    assert counters["AdjacencySetUndirectedMultiGraph.add_link.calls"] == 2
+    assert counters["AdjacencySetUndirectedMultiGraph.add_node.calls"] == 3
+    assert counters["AdjacencySetUndirectedMultiGraph.remove_link.calls"] == 1
+    assert counters["traversal.bfs.calls"] == 2
+    latency = metrics["histograms"][
+        "AdjacencySetUndirectedMultiGraph.add_link.latency_ns"
+    ]
+    assert latency["count"] == 2
+    assert sum(latency["buckets"].values()) == 2
+    visited = metrics["histograms"]["traversal.bfs.nodes_visited"]
+    assert visited["total"] == 3
+
+
+def test_instrumentation_wraps_the_original_methods():
+    original_search = BinarySearchNode.search
+    instrumentation.reset()
+    with instrumentation.enabled():
+        assert BinarySearchNode.search.__wrapped__ is original_search
+        root = BinarySearchNode(key=1)
+        for key in range(2, 6):
+            root.insert(key)
+        root.insert(3)
+        root.delete(2)
+        assert root.search(5).key == 5
+    metrics = instrumentation.snapshot()
+    # The recursive calls are not measured on their own.
+    assert metrics["counters"]["BinarySearchNode.search.calls"] == 1
+    assert metrics["counters"]["BinarySearchNode.insert.calls"] == 5
+    assert metrics["counters"]["BinarySearchNode.delete.calls"] == 1
+    # Existing key 3 at depth 3: 2 + 2 + 1 comparisons.
+    assert (
+        metrics["counters"]["BinarySearchNode.insert.comparisons"] == 2 + 4 + 6 + 8 + 5
+    )
+    assert metrics["histograms"]["BinarySearchNode.search.depth"]["max"] == 4
+
+
+def test_instrumentation_binary_search_tree():
+    instrumentation.reset()
+    with instrumentation.enabled():
+        root = BinarySearchNode(key=2)
+        root.insert(1)
+        leaf = root.insert(4)
+        assert root.insert(3).parent is leaf
+        assert root.search(3) is leaf.left_child
+        assert root.search(5) is None
+        assert [node.key for node in root] == [1, 2, 3, 4]
+
+    metrics = instrumentation.snapshot()
+    depth = metrics["histograms"]["BinarySearchNode.search.depth"]
+    assert (depth["count"], depth["max"]) == (2, 3)
+    # 3: 2 < 4 > 3 = 3 -> 5 comparisons, 5: 2 < 4 < -> 4 comparisons
+    assert metrics["counters"]["BinarySearchNode.search.comparisons"] == 9
+    assert metrics["histograms"]["BinarySearchNode.insert.depth"]["max"] == 3
+    # 1: 2 -> 2, 4: 2 -> 2, 3: 2 < 4 > -> 4
+    assert metrics["counters"]["BinarySearchNode.insert.comparisons"] == 8
+    assert metrics["histograms"]["BinarySearchNode.iter.nodes_visited"]["total"] == 4
+
+
+def test_instrumentation_inherited_methods():
+    instrumentation.reset()
+    g: AdjacencySetUndirectedMultiGraph[int, str] = AdjacencySetUndirectedMultiGraph()
+    g.add_link(1, 2, "link_1")
+    with instrumentation.enabled():
+        assert g.get_link("link_1") == (1, 2, None)
+    assert "get_link" not in AdjacencySetUndirectedMultiGraph.__dict__
+    counters = instrumentation.snapshot()["counters"]
+    assert counters["AdjacencySetUndirectedMultiGraph.get_link.calls"] == 1
@@ -0,0 +1,64 @@
+import sys
+
+from graph.directed_graph.multigraph import AdjacencyDirectedSetMultiGraph
+from graph.undirected_graph.adjacency_set import AdjacencySetUndirectedGraph
+from graph.undirected_graph.multigraph import AdjacencySetUndirectedMultiGraph
+from tree.binary.binary_search_tree import BinarySearchNode
+from tree.generic_node import Node
+
+from ..memory import (
+    MemoryReport,
+    binary_tree_memory_usage,
+    graph_memory_usage,
+    instance_size,
+    tree_memory_usage,
+)
+
+
+def test_memory_graph_components():
+    g: AdjacencyDirectedSetMultiGraph[int, str] = AdjacencyDirectedSetMultiGraph()
+    g.add_link(1, 2, "link_1", "LinkValue")
+    report = graph_memory_usage(g)
+    assert isinstance(report, MemoryReport)
+    assert report.estimated is False
+    assert report.components["nodes"] == sys.getsizeof(g.nodes)
+    assert report.components["link_dicts"] == sys.getsizeof(g.links[1][2])
+    assert report.components["reverse_index"] > 0
+    assert report.components["link_id_index"] > 0
+    assert report.total == sum(report.components.values())
+    assert "total" in str(report)
+
+
+def test_memory_graph_values_counted_once():
+    g: AdjacencySetUndirectedGraph[int, str] = AdjacencySetUndirectedGraph()
+    value = "x" * 1000
+    g.add_link(1, 2, value)
+    assert graph_memory_usage(g).components["values"] < 2 * sys.getsizeof(value)
+
+
+def test_memory_graph_estimation():
+    g: AdjacencySetUndirectedMultiGraph[int, str] = AdjacencySetUndirectedMultiGraph()
+    for i in range(1000):
+        g.add_link(i, (i + 1) % 1000, i, str(i))
+    exact = graph_memory_usage(g)
+    estimate = graph_memory_usage(g, sample=100)
+    assert estimate.estimated is True
+    assert estimate.sample_size == 100
+    assert abs(estimate.total - exact.total) < exact.total * 0.2
+
+
+def test_memory_trees():
+    root = BinarySearchNode(key=2)
+    root.insert(1)
+    root.insert(3)
+    report = binary_tree_memory_usage(root)
+    assert report.components["nodes"] == 3 * instance_size(BinarySearchNode)
+    assert instance_size(BinarySearchNode) >= sys.getsizeof(root)
+
+    tree = Node(value="root")
+    tree.children.append(Node(tree, value="child"))
+    report = tree_memory_usage(tree)
+    assert report.components["nodes"] == 2 * instance_size(Node)
+    assert report.components["children"] == sys.getsizeof(
+        tree.children
+    ) + sys.getsizeof(tree.children[0].children)
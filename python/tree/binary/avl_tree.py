@@ -0,0 +1,144 @@
+from dataclasses import dataclass
+from typing import Generic, Iterator, Optional, Tuple, TypeVar
+
+NodeKey = TypeVar("NodeKey")
+NodeValue = TypeVar("NodeValue")
+
+
+@dataclass
+class AVLNode(Generic[NodeKey, NodeValue]):
+    """Node of a self balancing binary search tree (AVL tree).
+
+    The heights of the two subtrees of each node differ by at most one, so the tree depth stays
+    below 1.45 log2(n) whatever the insertion order. Rebalancing may change the root of a subtree:
+    `insert` and `delete` return the new root, to be stored in place of the node they were called on.
+
+    Example:
+        root = AVLNode(key=0)
+        for key in range(1, 10):
+            root = root.insert(key)
+        root, value = root.delete(5)
+    """
+
+    left_child: Optional["AVLNode"] = None
+    right_child: Optional["AVLNode"] = None
+    key: NodeKey = None
+    value: NodeValue = None
+    height: int = 1
+
+    def __iter__(self) -> Iterator["AVLNode"]:
+        # Walking through the tree in order, the depth is logarithmic.
+        if self.left_child:
+            yield from self.left_child
+        yield self
+        if self.right_child:
+            yield from self.right_child
+
+    def search(self, key: NodeKey) -> Optional["AVLNode"]:
+        node = self
+        while node is not None:
+            if key == node.key:
+                return node
+            node = node.left_child if key < node.key else node.right_child
+        return None
+
+    def key_exists(self, key: NodeKey) -> bool:
+        return self.search(key) is not None
+
+    def get_most_left(self) -> "AVLNode":
+        node = self
+        while node.left_child is not None:
+            node = node.left_child
+        return node
+
+    def get_most_right(self) -> "AVLNode":
+        node = self
+        while node.right_child is not None:
+            node = node.right_child
+        return node
+
+    def insert(self, key: NodeKey, value: NodeValue | None = None) -> "AVLNode":
+        """Insert the key, or replace its value if it exists. Return the new root of the subtree."""
+        if key == self.key:
+            self.value = value
+            return self
+        if key < self.key:
+            self.left_child = (
+                AVLNode(key=key, value=value)
+                if self.left_child is None
+                else self.left_child.insert(key, value)
+            )
+        else:
+            self.right_child = (
+                AVLNode(key=key, value=value)
+                if self.right_child is None
+                else self.right_child.insert(key, value)
+            )
+        return self._rebalance()
+
+    def delete(self, key: NodeKey) -> Tuple[Optional["AVLNode"], NodeValue]:
+        """Delete the key. Return the new root of the subtree, None if it is empty, and the value.
+
+        Raises:
+            KeyError: When the key is not in the tree
+        """
+        if key == self.key:
+            value = self.value
+            if self.left_child is None or self.right_child is None:
+                return self.left_child or self.right_child, value
+            # Two children: take the place of the successor, removed from the right subtree.
+            successor = self.right_child.get_most_left()
+            self.right_child, _ = self.right_child.delete(successor.key)
+            self.key, self.value = successor.key, successor.value
+            return self._rebalance(), value
+        if key < self.key:
+            if self.left_child is None:
+                raise KeyError(key)
+            self.left_child, value = self.left_child.delete(key)
+        else:
+            if self.right_child is None:
+                raise KeyError(key)
+            self.right_child, value = self.right_child.delete(key)
+        return self._rebalance(), value
+
+    # Balancing
+
+    def _update_height(self) -> None:
+        self.height = 1 + max(
+            self.left_child.height if self.left_child else 0,
+            self.right_child.height if self.right_child else 0,
+        )
+
+    def _balance(self) -> int:
+        return (self.left_child.height if self.left_child else 0) - (
+            self.right_child.height if self.right_child else 0
+        )
+
+    def _rotate_left(self) -> "AVLNode":
+        pivot = self.right_child
+        self.right_child = pivot.left_child
+        pivot.left_child = self
+        self._update_height()
+        pivot._update_height()
+        return pivot
+
+    def _rotate_right(self) -> "AVLNode":
+        pivot = self.left_child
+        self.left_child = pivot.right_child
+        pivot.right_child = self
+        self._update_height()
+        pivot._update_height()
+        return pivot
+
+    def _rebalance(self) -> "AVLNode":
+        self._update_height()
+        balance = self._balance()
+        if balance > 1:
+            if self.left_child._balance() < 0:
+                self.left_child = self.left_child._rotate_left()
+            return self._rotate_right()
+        if balance < -1:
+            if self.right_child._balance() > 0:
+                self.right_child = self.right_child._rotate_right()
+            return self._rotate_left()
+        return self
@@ -49,10 +49,16 @@ class BinarySearchNode(Generic[NodeKey, NodeValue]):
                 return self.right_child.insert(key, value)
 
     def get_most_left(self) -> "BinarySearchNode":
-        return self if self.left_child is None else self.left_child.get_most_left()
+        node = self
+        while node.left_child is not None:
+            node = node.left_child
+        return node
 
     def get_most_right(self) -> "BinarySearchNode":
-        return self if self.right_child is None else self.right_child.get_most_right()
+        node = self
+        while node.right_child is not None:
+            node = node.right_child
+        return node
 
     def has_successor(self) -> bool:
         return (self.right_child is not None) or self.is_left_child()
@@ -116,6 +122,8 @@ class BinarySearchNode(Generic[NodeKey, NodeValue]):
             successor.parent.left_child = successor.right_child
         else:
             successor.parent.right_child = successor.right_child
+        if successor.right_child is not None:
+            successor.right_child.parent = successor.parent
 
         del successor
         return node
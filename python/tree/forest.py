@@ -0,0 +1,241 @@
+import operator
+from array import array
+from collections import deque
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Generic,
+    Hashable,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    TypeVar,
+)
+
+from .generic_node import Node
+
+NodeValue = TypeVar("NodeValue")
+
+# Position used for a missing parent, child or sibling.
+NONE = -1
+
+
+class FlatForest(Generic[NodeValue]):
+    """Array backed forest: the nodes are positions in parallel columns instead of objects.
+
+    - `parent[i]`: position of the parent of node i, `NONE` for a root.
+    - `first_child[i]` and `next_sibling[i]`: the children of node i as a linked list, in order.
+    - `values[i]`: value of node i.
+
+    Building, whole tree scans and subtree aggregates run over these columns, without one object
+    and one children list per node. Traversals are iterative so deep trees are supported.
+    """
+
+    def __init__(self) -> None:
+        self.parent = array("q")
+        self.first_child = array("q")
+        self.next_sibling = array("q")
+        self.values: List[NodeValue] = []
+        # Last child of each node, to append children in O(1).
+        self._last_child = array("q")
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def add_node(self, value: NodeValue = None, parent: int = NONE) -> int:
+        """Append a node, as the last child of `parent` or as a new root.
+
+        Returns:
+            int: The position of the new node.
+
+        Raises:
+            ValueError: When the parent position does not exist
+        """
+        if parent != NONE and not 0 <= parent < len(self.values):
+            raise ValueError("The given parent is not in the forest")
+        position = len(self.values)
+        self.parent.append(parent)
+        self.first_child.append(NONE)
+        self.next_sibling.append(NONE)
+        self._last_child.append(NONE)
+        self.values.append(value)
+        if parent != NONE:
+            last = self._last_child[parent]
+            if last == NONE:
+                self.first_child[parent] = position
+            else:
+                self.next_sibling[last] = position
+            self._last_child[parent] = position
+        return position
+
+    def roots(self) -> Iterator[int]:
+        return (
+            position for position, parent in enumerate(self.parent) if parent == NONE
+        )
+
+    def children(self, position: int) -> Iterator[int]:
+        child = self.first_child[position]
+        while child != NONE:
+            yield child
+            child = self.next_sibling[child]
+
+    # Traversals
+
+    def _starts(self, root: Optional[int]) -> List[int]:
+        return list(self.roots()) if root is None else [root]
+
+    def preorder(self, root: Optional[int] = None) -> Iterator[int]:
+        """Positions in preorder, from the given root or over the whole forest."""
+        first_child, next_sibling = self.first_child, self.next_sibling
+        stack = list(reversed(self._starts(root)))
+        while stack:
+            position = stack.pop()
+            yield position
+            children = []
+            child = first_child[position]
+            while child != NONE:
+                children.append(child)
+                child = next_sibling[child]
+            stack.extend(reversed(children))
+
+    def postorder(self, root: Optional[int] = None) -> Iterator[int]:
+        """Positions in postorder, from the given root or over the whole forest."""
+        first_child, next_sibling = self.first_child, self.next_sibling
+        for start in self._starts(root):
+            # Each entry is a node and its next child to visit.
+            stack = [(start, first_child[start])]
+            while stack:
+                position, child = stack[-1]
+                if child == NONE:
+                    stack.pop()
+                    yield position
+                    continue
+                stack[-1] = (position, next_sibling[child])
+                stack.append((child, first_child[child]))
+
+    def level_order(self, root: Optional[int] = None) -> Iterator[int]:
+        """Positions level by level, from the given root or over the whole forest."""
+        first_child, next_sibling = self.first_child, self.next_sibling
+        queue = deque(self._starts(root))
+        while queue:
+            position = queue.popleft()
+            yield position
+            child = first_child[position]
+            while child != NONE:
+                queue.append(child)
+                child = next_sibling[child]
+
+    # Aggregates
+
+    def subtree_aggregate(
+        self,
+        values: Optional[Iterable[Any]] = None,
+        combine: Callable[[Any, Any], Any] = operator.add,
+    ) -> List[Any]:
+        """Combine the values of each subtree in a single postorder pass.
+
+        Args:
+            values (Iterable, optional): Value of each position. Defaults to the node values.
+            combine (Callable, optional): Combine a node result with a child result. Defaults to +.
+
+        Returns:
+            List: For each position, the combination of the values of its subtree.
+        """
+        result = list(self.values if values is None else values)
+        parent = self.parent
+        for position in self.postorder():
+            parent_position = parent[position]
+            if parent_position != NONE:
+                result[parent_position] = combine(
+                    result[parent_position], result[position]
+                )
+        return result
+
+    def subtree_sizes(self) -> List[int]:
+        """Number of nodes of the subtree of each position."""
+        return self.subtree_aggregate([1] * len(self))
+
+    def depths(self) -> array:
+        """Depth of each position, 0 for the roots."""
+        depths = array("q", bytes(8 * len(self)))
+        parent = self.parent
+        for position in self.preorder():
+            if parent[position] != NONE:
+                depths[position] = depths[parent[position]] + 1
+        return depths
+
+    # Conversions
+
+    @classmethod
+    def from_nodes(cls, roots: Iterable[Node]) -> "FlatForest":
+        """Copy `Node` trees into a forest. Nodes are numbered in preorder."""
+        forest = cls()
+        for root in roots:
+            stack = [(root, NONE)]
+            while stack:
+                node, parent = stack.pop()
+                position = forest.add_node(node.value, parent)
+                stack.extend((child, position) for child in reversed(node.children))
+        return forest
+
+    def to_nodes(self) -> List[Node]:
+        """Build `Node` trees from the forest and return their roots."""
+        nodes = [Node(value=value) for value in self.values]
+        for position, node in enumerate(nodes):
+            node.children = [nodes[child] for child in self.children(position)]
+            if self.parent[position] != NONE:
+                node.parent = nodes[self.parent[position]]
+        return [nodes[position] for position in self.roots()]
+
+    @classmethod
+    def from_edges(
+        cls,
+        edges: Iterable[Tuple[Hashable, Optional[Hashable]]],
+        values: Optional[Dict[Hashable, Any]] = None,
+    ) -> Tuple["FlatForest", Dict[Hashable, int]]:
+        """Build a forest from `(child, parent)` edges, a None parent declares a root.
+
+        Nodes are identified by hashable ids and are positioned in order of first appearance. The
+        children of a node keep the order of the edges.
+
+        Args:
+            edges (Iterable[Tuple]): The `(child, parent)` edges.
+            values (Dict, optional): Value of each node id. Defaults to the node ids.
+
+        Returns:
+            Tuple[FlatForest, Dict]: The forest and the position of each node id.
+
+        Raises:
+            ValueError: When a node has two parents or the edges contain a cycle
+        """
+        forest = cls()
+        positions: Dict[Hashable, int] = {}
+
+        def position_of(node_id):
+            if node_id not in positions:
+                value = node_id if values is None else values.get(node_id)
+                positions[node_id] = forest.add_node(value)
+            return positions[node_id]
+
+        for child, parent in edges:
+            child_position = position_of(child)
+            if parent is None:
+                continue
+            if forest.parent[child_position] != NONE:
+                raise ValueError(f"The node {child!r} has two parents")
+            parent_position = position_of(parent)
+            forest.parent[child_position] = parent_position
+            last = forest._last_child[parent_position]
+            if last == NONE:
+                forest.first_child[parent_position] = child_position
+            else:
+                forest.next_sibling[last] = child_position
+            forest._last_child[parent_position] = child_position
+
+        # Nodes on a cycle are not reachable from any root.
+        if sum(1 for _ in forest.preorder()) != len(forest):
+            raise ValueError("The edges contain a cycle")
+        return forest, positions
@@ -18,4 +18,5 @@ class Node(Generic[NodeValue]):
         return self.parent is None
 
     def copy(self):
-        return Node(self.parent, self.children)
+        # The children list is copied so the copy can be changed without changing the original.
+        return Node(self.parent, list(self.children), self.value)
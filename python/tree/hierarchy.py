@@ -0,0 +1,140 @@
+from array import array
+from typing import Dict, List
+
+from .generic_node import Node
+
+
+class HierarchyIndex:
+    """Precomputed index answering hierarchy queries on a `Node` tree.
+
+    Each node is numbered and the index keeps, for each node, its depth and its 2**k-th ancestors
+    (binary lifting):
+    - `depth` is O(1).
+    - `is_ancestor` and `lowest_common_ancestor` are O(log n): the deepest node is lifted to the
+      depth of the other one, then both are lifted together by decreasing powers of two.
+
+    Building the index is O(n log n) and is done on the first query. Nodes added since then are
+    indexed when a query involves them: their parent chain is walked up to an indexed node and each
+    new node is appended in O(log n), without rebuilding. Call `invalidate()` after moving or
+    removing nodes.
+
+    Nodes are tracked by identity, as `Node` instances are not hashable.
+    """
+
+    def __init__(self, root: Node) -> None:
+        self.root = root
+        self.nodes: List[Node] = []
+        self._positions: Dict[int, int] = {}
+        self._depth = array("l")
+        # _up[k][i] is the 2**k-th ancestor of node i.
+        self._up: List[array] = [array("l")]
+        self._built = False
+
+    def invalidate(self) -> None:
+        """Drop the index, it is rebuilt on the next query."""
+        self._built = False
+
+    def _append(self, node: Node, parent: int) -> None:
+        """Number a node whose parent is already indexed, -1 for the root."""
+        number = len(self.nodes)
+        self._positions[id(node)] = number
+        self.nodes.append(node)
+        self._depth.append(self._depth[parent] + 1 if parent >= 0 else 0)
+        # The ancestors above the root are the root itself.
+        ancestor = parent if parent >= 0 else number
+        for level in self._up:
+            level.append(ancestor)
+            ancestor = level[ancestor]
+        if self._depth[number] >= 1 << len(self._up):
+            # New level, for all the nodes: lifting by 2**k is lifting twice by 2**(k - 1).
+            previous = self._up[-1]
+            self._up.append(array("l", (previous[i] for i in previous)))
+
+    def _build(self) -> None:
+        self.nodes = []
+        self._positions = {}
+        self._depth = array("l")
+        self._up = [array("l")]
+        self._append(self.root, -1)
+        # Iterative walk, the trees can be deeper than the recursion limit.
+        stack = [(self.root, 0)]
+        while stack:
+            node, number = stack.pop()
+            for child in node.children:
+                if id(child) in self._positions:
+                    raise ValueError("A node appears twice in the tree")
+                self._append(child, number)
+                stack.append((child, len(self.nodes) - 1))
+        self._built = True
+
+    def _position(self, node: Node) -> int:
+        if not self._built:
+            self._build()
+        position = self._positions.get(id(node))
+        if position is not None:
+            return position
+        # Unknown node: index it with its ancestors added since the last build, if any.
+        chain = []
+        ancestor = node
+        while ancestor is not None and id(ancestor) not in self._positions:
+            chain.append(ancestor)
+            ancestor = ancestor.parent
+        if ancestor is None:
+            raise ValueError("The given node is not in the tree")
+        parent = self._positions[id(ancestor)]
+        for new_node in reversed(chain):
+            self._append(new_node, parent)
+            parent = len(self.nodes) - 1
+        return parent
+
+    def _lift(self, position: int, distance: int) -> int:
+        level = 0
+        while distance:
+            if distance & 1:
+                position = self._up[level][position]
+            distance >>= 1
+            level += 1
+        return position
+
+    def __len__(self) -> int:
+        if not self._built:
+            self._build()
+        return len(self.nodes)
+
+    def depth(self, node: Node) -> int:
+        """Number of links between the node and the root.
+
+        Raises:
+            ValueError: When the node is not in the tree
+        """
+        position = self._position(node)
+        return self._depth[position]
+
+    def is_ancestor(self, ancestor: Node, node: Node) -> bool:
+        """Return True when `ancestor` is a proper ancestor of `node` (a node is not its own ancestor).
+
+        Raises:
+            ValueError: When a node is not in the tree
+        """
+        ancestor_position, position = self._position(ancestor), self._position(node)
+        distance = self._depth[position] - self._depth[ancestor_position]
+        return distance > 0 and self._lift(position, distance) == ancestor_position
+
+    def lowest_common_ancestor(self, node1: Node, node2: Node) -> Node:
+        """Deepest node being an ancestor of both nodes, or one of them.
+
+        Raises:
+            ValueError: When a node is not in the tree
+        """
+        position1, position2 = self._position(node1), self._position(node2)
+        if self._depth[position1] < self._depth[position2]:
+            position1, position2 = position2, position1
+        position1 = self._lift(
+            position1, self._depth[position1] - self._depth[position2]
+        )
+        if position1 == position2:
+            return self.nodes[position1]
+        for level in reversed(self._up):
+            if level[position1] != level[position2]:
+                position1, position2 = level[position1], level[position2]
+        return self.nodes[self._up[0][position1]]
@@ -0,0 +1,431 @@
+from bisect import bisect_left, bisect_right
+from collections.abc import ItemsView, MutableMapping, ValuesView
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, TypeVar
+
+from .binary.avl_tree import AVLNode
+from .binary.binary_search_tree import BinarySearchNode
+
+Key = TypeVar("Key")
+Value = TypeVar("Value")
+Item = Tuple[Any, Any]
+
+
+# Engines
+#
+# An engine stores the items in key order and provides:
+# - `__len__()`
+# - `find(key)`, `set(key, value)` and `delete(key)`, the last one returning the deleted value.
+#   `find` and `delete` raise KeyError for a missing key.
+# - `floor(key)` and `ceiling(key)`: the item with the greatest key <= key (smallest key >= key),
+#   or None.
+# - `items(low, high, include_high, reverse)`: the items with `low <= key < high` (or `<= high`),
+#   a None bound not being applied.
+
+
+class _TreeEngine:
+    """Ordered operations shared by the binary tree engines, on `left_child`/`right_child` nodes."""
+
+    def __init__(self) -> None:
+        self.root = None
+        self.size = 0
+
+    def __len__(self) -> int:
+        return self.size
+
+    def floor(self, key: Any) -> Optional[Item]:
+        node, best = self.root, None
+        while node is not None:
+            if key == node.key:
+                return node.key, node.value
+            if key < node.key:
+                node = node.left_child
+            else:
+                best, node = node, node.right_child
+        return None if best is None else (best.key, best.value)
+
+    def ceiling(self, key: Any) -> Optional[Item]:
+        node, best = self.root, None
+        while node is not None:
+            if key == node.key:
+                return node.key, node.value
+            if key < node.key:
+                best, node = node, node.left_child
+            else:
+                node = node.right_child
+        return None if best is None else (best.key, best.value)
+
+    def items(
+        self,
+        low: Any = None,
+        high: Any = None,
+        include_high: bool = False,
+        reverse: bool = False,
+    ) -> Iterator[Item]:
+        # In order walk with an explicit stack, skipping the subtrees out of the bounds.
+        def below_low(key):
+            return low is not None and key < low
+
+        def above_high(key):
+            return high is not None and (
+                high < key or (not include_high and key == high)
+            )
+
+        stack, node = [], self.root
+        while stack or node is not None:
+            while node is not None:
+                if reverse:
+                    if above_high(node.key):
+                        node = node.left_child
+                        continue
+                    stack.append(node)
+                    node = node.right_child
+                else:
+                    if below_low(node.key):
+                        node = node.right_child
+                        continue
+                    stack.append(node)
+                    node = node.left_child
+            if not stack:
+                # Every remaining node was out of the bounds.
+                return
+            node = stack.pop()
+            if below_low(node.key) if reverse else above_high(node.key):
+                return
+            yield node.key, node.value
+            node = node.left_child if reverse else node.right_child
+
+
+class BinarySearchTreeEngine(_TreeEngine):
+    """Unbalanced `BinarySearchNode` tree: fast on random keys, linear depth on sorted keys.
+
+    Searches and insertions are iterative, so degenerated trees do not hit the recursion limit.
+    """
+
+    def _search(self, key: Any) -> Optional[BinarySearchNode]:
+        node = self.root
+        while node is not None and key != node.key:
+            node = node.left_child if key < node.key else node.right_child
+        return node
+
+    def find(self, key: Any) -> Any:
+        node = self._search(key)
+        if node is None:
+            raise KeyError(key)
+        return node.value
+
+    def set(self, key: Any, value: Any) -> None:
+        if self.root is None:
+            self.root = BinarySearchNode(key=key, value=value)
+            self.size = 1
+            return
+        node = self.root
+        while True:
+            if key == node.key:
+                node.value = value
+                return
+            side = "left_child" if key < node.key else "right_child"
+            child = getattr(node, side)
+            if child is None:
+                setattr(node, side, BinarySearchNode(node, key=key, value=value))
+                self.size += 1
+                return
+            node = child
+
+    def delete(self, key: Any) -> Any:
+        node = self._search(key)
+        if node is None:
+            raise KeyError(key)
+        value = node.value
+        if node is self.root and (node.left_child is None or node.right_child is None):
+            # The node API cannot replace a root with less than two children, it has no parent.
+            self.root = node.left_child or node.right_child
+            if self.root is not None:
+                self.root.parent = None
+        else:
+            # The search starts and ends on the node itself.
+            node.delete(key)
+        self.size -= 1
+        return value
+
+
+class AVLTreeEngine(_TreeEngine):
+    """Balanced `AVLNode` tree: logarithmic depth whatever the insertion order."""
+
+    def find(self, key: Any) -> Any:
+        node = self.root.search(key) if self.root is not None else None
+        if node is None:
+            raise KeyError(key)
+        return node.value
+
+    def set(self, key: Any, value: Any) -> None:
+        if self.root is None:
+            self.root = AVLNode(key=key, value=value)
+            self.size = 1
+            return
+        node = self.root.search(key)
+        if node is not None:
+            node.value = value
+            return
+        self.root = self.root.insert(key, value)
+        self.size += 1
+
+    def delete(self, key: Any) -> Any:
+        if self.root is None:
+            raise KeyError(key)
+        self.root, value = self.root.delete(key)
+        self.size -= 1
+        return value
+
+
+class BisectEngine:
+    """Parallel sorted lists of keys and values searched with `bisect`.
+
+    Lookups and scans are the fastest, insertions and deletions move the end of the lists.
+    """
+
+    def __init__(self) -> None:
+        self.keys: List[Any] = []
+        self.values: List[Any] = []
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def _position(self, key: Any) -> int:
+        position = bisect_left(self.keys, key)
+        if position == len(self.keys) or self.keys[position] != key:
+            raise KeyError(key)
+        return position
+
+    def find(self, key: Any) -> Any:
+        return self.values[self._position(key)]
+
+    def set(self, key: Any, value: Any) -> None:
+        position = bisect_left(self.keys, key)
+        if position < len(self.keys) and self.keys[position] == key:
+            self.values[position] = value
+            return
+        self.keys.insert(position, key)
+        self.values.insert(position, value)
+
+    def delete(self, key: Any) -> Any:
+        position = self._position(key)
+        del self.keys[position]
+        return self.values.pop(position)
+
+    def floor(self, key: Any) -> Optional[Item]:
+        position = bisect_right(self.keys, key)
+        if position == 0:
+            return None
+        return self.keys[position - 1], self.values[position - 1]
+
+    def ceiling(self, key: Any) -> Optional[Item]:
+        position = bisect_left(self.keys, key)
+        if position == len(self.keys):
+            return None
+        return self.keys[position], self.values[position]
+
+    def items(
+        self,
+        low: Any = None,
+        high: Any = None,
+        include_high: bool = False,
+        reverse: bool = False,
+    ) -> Iterator[Item]:
+        start = 0 if low is None else bisect_left(self.keys, low)
+        if high is None:
+            end = len(self.keys)
+        elif include_high:
+            end = bisect_right(self.keys, high)
+        else:
+            end = bisect_left(self.keys, high)
+        items = zip(self.keys[start:end], self.values[start:end])
+        return reversed(list(items)) if reverse else items
+
+
+ENGINES: Dict[str, type] = {
+    "bst": BinarySearchTreeEngine,
+    "avl": AVLTreeEngine,
+    "bisect": BisectEngine,
+}
+
+
+class _ItemsView(ItemsView):
+    def __iter__(self):
+        return self._mapping.engine.items()
+
+
+class _ValuesView(ValuesView):
+    def __iter__(self):
+        return (value for _, value in self._mapping.engine.items())
+
+
+class SortedMap(MutableMapping):
+    """Mapping keeping its keys sorted, with ordered operations.
+
+    The items are stored by an engine chosen for the workload:
+    - "avl": balanced tree, logarithmic operations whatever the order of the keys (default).
+    - "bst": unbalanced binary search tree, degenerates to linear operations on sorted keys.
+    - "bisect": sorted lists, fastest lookups and scans but linear insertions and deletions.
+
+    Iterating over the map while modifying it is not supported.
+
+    Example:
+        prices = SortedMap({"b": 2, "a": 1}, engine="bisect")
+        list(prices)  # ["a", "b"]
+        prices.floor("az")  # ("a", 1)
+        list(prices.irange("a", "b", include_high=True))
+
+    Args:
+        items (Mapping | Iterable, optional): Initial items, as for `dict`.
+        engine (str | object, optional): Engine name, or an engine instance. Defaults to "avl".
+
+    Raises:
+        ValueError: When the engine name is unknown
+    """
+
+    def __init__(self, items: Iterable = None, engine: Any = "avl") -> None:
+        if isinstance(engine, str):
+            if engine not in ENGINES:
+                raise ValueError(
+                    f"Unknown engine {engine!r}, expected one of {list(ENGINES)}"
+                )
+            engine = ENGINES[engine]()
+        self.engine = engine
+        if items is not None:
+            self.update(items)
+
+    def __getitem__(self, key: Key) -> Value:
+        return self.engine.find(key)
+
+    def __setitem__(self, key: Key, value: Value) -> None:
+        self.engine.set(key, value)
+
+    def __delitem__(self, key: Key) -> None:
+        self.engine.delete(key)
+
+    def __contains__(self, key: object) -> bool:
+        try:
+            self.engine.find(key)
+        except KeyError:
+            return False
+        return True
+
+    def __len__(self) -> int:
+        return len(self.engine)
+
+    def __iter__(self) -> Iterator[Key]:
+        return (key for key, _ in self.engine.items())
+
+    def __reversed__(self) -> Iterator[Key]:
+        return (key for key, _ in self.engine.items(reverse=True))
+
+    def __repr__(self) -> str:
+        items = ", ".join(f"{key!r}: {value!r}" for key, value in self.items())
+        return f"{type(self).__name__}({{{items}}})"
+
+    def items(self) -> ItemsView:
+        return _ItemsView(self)
+
+    def values(self) -> ValuesView:
+        return _ValuesView(self)
+
+    def pop(self, key: Key, *default: Value) -> Value:
+        try:
+            return self.engine.delete(key)
+        except KeyError:
+            if default:
+                return default[0]
+            raise
+
+    # Ordered operations
+
+    def floor(self, key: Key) -> Tuple[Key, Value]:
+        """Item with the greatest key lower or equal to the given key.
+
+        Raises:
+            KeyError: When every key is greater
+        """
+        item = self.engine.floor(key)
+        if item is None:
+            raise KeyError(key)
+        return item
+
+    def ceiling(self, key: Key) -> Tuple[Key, Value]:
+        """Item with the smallest key greater or equal to the given key.
+
+        Raises:
+            KeyError: When every key is lower
+        """
+        item = self.engine.ceiling(key)
+        if item is None:
+            raise KeyError(key)
+        return item
+
+    def first(self) -> Tuple[Key, Value]:
+        """Item with the smallest key.
+
+        Raises:
+            KeyError: When the map is empty
+        """
+        for item in self.engine.items():
+            return item
+        raise KeyError("first(): sorted map is empty")
+
+    def last(self) -> Tuple[Key, Value]:
+        """Item with the greatest key.
+
+        Raises:
+            KeyError: When the map is empty
+        """
+        for item in self.engine.items(reverse=True):
+            return item
+        raise KeyError("last(): sorted map is empty")
+
+    def pop_first(self) -> Tuple[Key, Value]:
+        """Remove and return the item with the smallest key.
+
+        Raises:
+            KeyError: When the map is empty
+        """
+        key, value = self.first()
+        self.engine.delete(key)
+        return key, value
+
+    def pop_last(self) -> Tuple[Key, Value]:
+        """Remove and return the item with the greatest key.
+
+        Raises:
+            KeyError: When the map is empty
+        """
+        key, value = self.last()
+        self.engine.delete(key)
+        return key, value
+
+    def popitem(self) -> Tuple[Key, Value]:
+        return self.pop_first()
+
+    def irange(
+        self,
+        low: Key = None,
+        high: Key = None,
+        include_high: bool = False,
+        reverse: bool = False,
+    ) -> Iterator[Key]:
+        """Iterate over the keys with `low <= key < high` (or `<= high`), in key order.
+
+        A None bound is not applied.
+        """
+        return (key for key, _ in self.irange_items(low, high, include_high, reverse))
+
+    def irange_items(
+        self,
+        low: Key = None,
+        high: Key = None,
+        include_high: bool = False,
+        reverse: bool = False,
+    ) -> Iterator[Tuple[Key, Value]]:
+        """Iterate over the items with `low <= key < high` (or `<= high`), in key order.
+
+        A None bound is not applied.
+        """
+        return self.engine.items(low, high, include_high, reverse)
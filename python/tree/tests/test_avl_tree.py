@@ -0,0 +1,57 @@
+import random
+
+import pytest
+
+from ..binary.avl_tree import AVLNode
+
+
+def height(node):
+    if node is None:
+        return 0
+    left, right = height(node.left_child), height(node.right_child)
+    assert abs(left - right) <= 1
+    assert node.height == 1 + max(left, right)
+    return node.height
+
+
+def test_avl_tree_sorted_insertions_stay_balanced():
+    root = AVLNode(key=0)
+    for key in range(1, 1024):
+        root = root.insert(key, str(key))
+    assert height(root) == 11
+    assert [node.key for node in root] == list(range(1024))
+    assert root.search(512).value == "512"
+
+
+def test_avl_tree_insert_existing_key_replaces_value():
+    root = AVLNode(key=1, value="a")
+    root = root.insert(1, "b")
+    assert root.value == "b"
+    assert root.height == 1
+
+
+def test_avl_tree_delete():
+    rng = random.Random(3)
+    keys = list(range(200))
+    rng.shuffle(keys)
+    root = AVLNode(key=keys[0], value=keys[0])
+    for key in keys[1:]:
+        root = root.insert(key, key)
+    rng.shuffle(keys)
+    for i, key in enumerate(keys[:-1]):
+        root, value = root.delete(key)
+        assert value == key
+        assert sorted(keys[i + 1 :]) == [node.key for node in root]
+        height(root)
+    root, _ = root.delete(keys[-1])
+    assert root is None
+
+
+def test_avl_tree_delete_missing_key():
+    root = AVLNode(key=1).insert(2)
+    with pytest.raises(KeyError):
+        root.delete(3)
+    with pytest.raises(KeyError):
+        root.delete(0)
+    assert root.get_most_left().key == 1
+    assert root.get_most_right().key == 2
@@ -130,6 +130,18 @@ def test_binary_search_tree_delete_successor_node():
     assert replaced is root
 
 
+def test_binary_search_tree_delete_successor_with_right_child():
+    root = BinarySearchNode(key=2)
+    root.insert(1)
+    root.insert(5)
+    root.insert(3)
+    grandchild = root.insert(4)
+    root.delete(2)
+    assert root.key == 3
+    assert grandchild.parent is root.right_child
+    assert [node.key for node in root] == [1, 3, 4, 5]
+
+
 def test_binary_search_tree_successor():
     root = BinarySearchNode(key=3)
     root.insert(2)
@@ -0,0 +1,100 @@
+import pytest
+
+from ..forest import NONE, FlatForest
+from ..generic_node import Node
+
+
+def build_forest():
+    #   a       e
+    #  / \\     |
+    # b   c    f
+    # |
+    # d
+    forest, positions = FlatForest.from_edges(
+        [("b", "a"), ("c", "a"), ("d", "b"), ("e", None), ("f", "e")]
+    )
+    return forest, positions
+
+
+def test_forest_from_edges():
+    forest, positions = build_forest()
+    assert positions == {"b": 0, "a": 1, "c": 2, "d": 3, "e": 4, "f": 5}
+    assert list(forest.roots()) == [1, 4]
+    assert list(forest.children(positions["a"])) == [0, 2]
+    assert forest.parent[positions["d"]] == positions["b"]
+    assert forest.parent[positions["a"]] == NONE
+
+
+def test_forest_from_edges_errors():
+    with pytest.raises(ValueError):
+        FlatForest.from_edges([("b", "a"), ("b", "c")])
+    with pytest.raises(ValueError):
+        FlatForest.from_edges([("a", "b"), ("b", "a")])
+
+
+def test_forest_traversals():
+    forest, _ = build_forest()
+
+    def values(positions):
+        return "".join(forest.values[position] for position in positions)
+
+    assert values(forest.preorder()) == "abdcef"
+    assert values(forest.postorder()) == "dbcafe"
+    assert values(forest.level_order()) == "aebcfd"
+    assert values(forest.preorder(0)) == "bd"
+
+
+def test_forest_aggregates():
+    forest, positions = build_forest()
+    sizes = forest.subtree_sizes()
+    assert sizes[positions["a"]] == 4
+    assert sizes[positions["e"]] == 2
+    assert (
+        forest.subtree_aggregate(combine=lambda a, b: a + b)[positions["a"]] == "abdc"
+    )
+    assert list(forest.depths()) == [1, 0, 1, 2, 0, 1]
+
+
+def test_forest_node_round_trip():
+    root = Node(value=1)
+    for value in (2, 3):
+        root.children.append(Node(root, value=value))
+    root.children[0].children.append(Node(root.children[0], value=4))
+
+    forest = FlatForest.from_nodes([root])
+    assert forest.values == [1, 2, 4, 3]
+
+    (copy,) = forest.to_nodes()
+    assert copy.value == 1
+    assert [child.value for child in copy.children] == [2, 3]
+    assert copy.children[0].children[0].value == 4
+    assert copy.children[0].children[0].parent is copy.children[0]
+    assert copy.is_root()
+
+
+def test_forest_add_node():
+    forest = FlatForest()
+    root = forest.add_node("root")
+    child = forest.add_node("child", root)
+    forest.add_node("other", root)
+    assert [forest.values[p] for p in forest.children(root)] == ["child", "other"]
+    assert forest.parent[child] == root
+    with pytest.raises(ValueError):
+        forest.add_node("orphan", 10)
+
+
+def test_forest_deep_tree():
+    forest = FlatForest()
+    parent = NONE
+    for value in range(10000):
+        parent = forest.add_node(value, parent)
+    assert sum(1 for _ in forest.postorder()) == 10000
+    assert forest.subtree_sizes()[0] == 10000
+
+
+def test_node_copy_does_not_share_children():
+    root = Node(value=1)
+    copy = root.copy()
+    copy.children.append(Node(copy))
+    assert root.children == []
+    assert copy.value == 1
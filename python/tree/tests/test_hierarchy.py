@@ -0,0 +1,131 @@
+import random
+
+import pytest
+
+from ..generic_node import Node
+from ..hierarchy import HierarchyIndex
+
+
+def add_child(parent, value=None):
+    child = Node(parent, value=value)
+    parent.children.append(child)
+    return child
+
+
+def random_tree(size, seed):
+    rng = random.Random(seed)
+    nodes = [Node(value=0)]
+    for value in range(1, size):
+        nodes.append(add_child(rng.choice(nodes), value))
+    return nodes
+
+
+def naive_ancestors(node):
+    ancestors = []
+    while node is not None:
+        ancestors.append(node)
+        node = node.parent
+    return ancestors
+
+
+def test_hierarchy_small_tree():
+    root = Node(value="root")
+    a = add_child(root, "a")
+    b = add_child(root, "b")
+    a1 = add_child(a, "a1")
+    a2 = add_child(a, "a2")
+    index = HierarchyIndex(root)
+
+    assert len(index) == 5
+    assert index.depth(root) == 0
+    assert index.depth(a2) == 2
+    assert index.is_ancestor(root, a1) is True
+    assert index.is_ancestor(a, a2) is True
+    assert index.is_ancestor(a, a) is False
+    assert index.is_ancestor(b, a1) is False
+    assert index.is_ancestor(a1, a) is False
+    assert index.lowest_common_ancestor(a1, a2) is a
+    assert index.lowest_common_ancestor(a1, b) is root
+    assert index.lowest_common_ancestor(a, a2) is a
+    assert index.lowest_common_ancestor(b, b) is b
+
+
+def test_hierarchy_matches_parent_walk():
+    nodes = random_tree(300, seed=1)
+    index = HierarchyIndex(nodes[0])
+    rng = random.Random(2)
+    for _ in range(500):
+        node1, node2 = rng.choice(nodes), rng.choice(nodes)
+        ancestors1 = naive_ancestors(node1)
+        assert index.depth(node1) == len(ancestors1) - 1
+        assert index.is_ancestor(node2, node1) == any(
+            ancestor is node2 for ancestor in ancestors1[1:]
+        )
+        expected = next(
+            ancestor
+            for ancestor in naive_ancestors(node2)
+            if any(ancestor is other for other in ancestors1)
+        )
+        assert index.lowest_common_ancestor(node1, node2) is expected
+
+
+def test_hierarchy_lazy_rebuild():
+    root = Node(value="root")
+    a = add_child(root, "a")
+    index = HierarchyIndex(root)
+    assert index.depth(a) == 1
+
+    b = add_child(a, "b")
+    assert index.depth(b) == 2
+    assert index.lowest_common_ancestor(b, a) is a
+
+    with pytest.raises(ValueError):
+        index.depth(Node())
+
+    # Moving a node needs an explicit invalidation
+    a.children.remove(b)
+    b.parent = root
+    root.children.append(b)
+    index.invalidate()
+    assert index.depth(b) == 1
+
+
+def test_hierarchy_extends_without_rebuild():
+    nodes = random_tree(200, seed=3)
+    index = HierarchyIndex(nodes[0])
+    assert len(index) == 200
+
+    def fail():
+        raise AssertionError("The index was rebuilt")
+
+    index._build = fail
+    rng = random.Random(4)
+    for _ in range(100):
+        parent = rng.choice(nodes)
+        # Grow a small chain, only its last node is queried.
+        child = add_child(add_child(parent))
+        nodes += [child.parent, child]
+        assert index.depth(child) == len(naive_ancestors(child)) - 1
+        other = rng.choice(nodes)
+        expected = next(
+            ancestor
+            for ancestor in naive_ancestors(other)
+            if any(ancestor is a for a in naive_ancestors(child))
+        )
+        assert index.lowest_common_ancestor(child, other) is expected
+        assert index.is_ancestor(parent, child) is True
+    assert len(index) == len(nodes)
+
+    # Nodes of another tree are rejected without rebuilding.
+    outside = add_child(add_child(Node()))
+    with pytest.raises(ValueError):
+        index.depth(outside)
+
+
+def test_hierarchy_deep_tree():
+    root = node = Node()
+    for _ in range(5000):
+        node = add_child(node)
+    index = HierarchyIndex(root)
+    assert index.depth(node) == 5000
+    assert index.lowest_common_ancestor(node, root.children[0]) is root.children[0]
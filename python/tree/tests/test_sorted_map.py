@@ -0,0 +1,127 @@
+import random
+
+import pytest
+
+from ..sorted_map import ENGINES, SortedMap
+
+
+@pytest.fixture(params=list(ENGINES))
+def engine(request):
+    return request.param
+
+
+def test_sorted_map_mapping(engine):
+    m = SortedMap({3: "c", 1: "a"}, engine=engine)
+    m[2] = "b"
+    m[1] = "A"
+    assert list(m) == [1, 2, 3]
+    assert list(m.items()) == [(1, "A"), (2, "b"), (3, "c")]
+    assert list(m.values()) == ["A", "b", "c"]
+    assert list(reversed(m)) == [3, 2, 1]
+    assert len(m) == 3
+    assert 2 in m and 4 not in m
+    assert m.get(4) is None
+    assert m == {1: "A", 2: "b", 3: "c"}
+    del m[2]
+    assert m.pop(3) == "c"
+    assert m.pop(3, None) is None
+    assert repr(m) == "SortedMap({1: 'A'})"
+    with pytest.raises(KeyError):
+        m[2]
+    with pytest.raises(KeyError):
+        del m[2]
+
+
+def test_sorted_map_delete_root(engine):
+    # The first key is the root of the tree engines.
+    m = SortedMap(engine=engine)
+    m[1] = "a"
+    del m[1]
+    assert len(m) == 0 and list(m) == []
+    m.update({2: "b", 1: "a"})
+    del m[2]
+    assert list(m.items()) == [(1, "a")]
+    m.update({2: "b", 0: "z"})
+    del m[1]
+    assert list(m.items()) == [(0, "z"), (2, "b")]
+
+
+def test_sorted_map_ordered_operations(engine):
+    m = SortedMap({key: key * 10 for key in range(0, 20, 2)}, engine=engine)
+    assert m.floor(5) == (4, 40)
+    assert m.floor(6) == (6, 60)
+    assert m.ceiling(5) == (6, 60)
+    assert m.ceiling(18) == (18, 180)
+    with pytest.raises(KeyError):
+        m.floor(-1)
+    with pytest.raises(KeyError):
+        m.ceiling(19)
+    assert m.first() == (0, 0)
+    assert m.last() == (18, 180)
+    assert list(m.irange(4, 10)) == [4, 6, 8]
+    assert list(m.irange(3, 10, include_high=True)) == [4, 6, 8, 10]
+    assert list(m.irange(high=4)) == [0, 2]
+    assert list(m.irange(15)) == [16, 18]
+    assert list(m.irange(4, 10, reverse=True)) == [8, 6, 4]
+    assert list(m.irange_items(5, 9)) == [(6, 60), (8, 80)]
+    assert m.pop_first() == (0, 0)
+    assert m.pop_last() == (18, 180)
+    assert m.popitem() == (2, 20)
+    assert len(m) == 7
+
+
+def test_sorted_map_empty(engine):
+    m = SortedMap(engine=engine)
+    for operation in (m.first, m.last, m.pop_first, m.pop_last, m.popitem):
+        with pytest.raises(KeyError):
+            operation()
+    with pytest.raises(KeyError):
+        m.floor(1)
+    assert list(m.irange(0, 10)) == []
+
+
+def test_sorted_map_range_outside_the_keys(engine):
+    m = SortedMap({1: 1}, engine=engine)
+    for reverse in (False, True):
+        assert list(m.irange(5, reverse=reverse)) == []
+        assert list(m.irange(2, 9, reverse=reverse)) == []
+        assert list(m.irange(None, 1, reverse=reverse)) == []
+        assert list(m.irange(-5, 0, include_high=True, reverse=reverse)) == []
+    m.update({key: key for key in range(10, 20)})
+    for reverse in (False, True):
+        assert list(m.irange(25, 30, reverse=reverse)) == []
+        assert list(m.irange(2, 10, reverse=reverse)) == []
+        assert list(m.irange(high=0, reverse=reverse)) == []
+
+
+def test_sorted_map_unknown_engine():
+    with pytest.raises(ValueError):
+        SortedMap(engine="btree")
+
+
+def test_sorted_map_matches_dict(engine):
+    rng = random.Random(11)
+    m, expected = SortedMap(engine=engine), {}
+    for _ in range(2000):
+        key = rng.randrange(200)
+        if rng.random() < 0.4 and key in expected:
+            assert m.pop(key) == expected.pop(key)
+        else:
+            m[key] = expected[key] = rng.random()
+        assert len(m) == len(expected)
+    assert list(m.items()) == sorted(expected.items())
+    for _ in range(200):
+        low, high = sorted(rng.randrange(-10, 210) for _ in range(2))
+        reverse = rng.random() < 0.5
+        assert list(m.irange(low, high, include_high=True, reverse=reverse)) == sorted(
+            (key for key in expected if low <= key <= high), reverse=reverse
+        )
+
+
+def test_sorted_map_sorted_keys_do_not_hit_recursion_limit(engine):
+    m = SortedMap(engine=engine)
+    for key in range(3000):
+        m[key] = key
+    assert m.last() == (2999, 2999)
+    del m[0]
+    assert next(iter(m)) == 1